@@ -0,0 +1,358 @@
+"""
+Ansible Output Parser
+Streaming Parser for Semaphore Task Output (Plays, Tasks, Host Results, Recap, Timings)
+"""
+
+import re
+import time
+from collections import Counter, deque
+from datetime import datetime
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple, Union
+
+# Semaphore runs ansible-playbook with ANSIBLE_FORCE_COLOR=True
+ANSI_PATTERN = re.compile(r'\x1b\[[0-9;]*m')
+
+# Boundaries
+PLAY_PATTERN = re.compile(r'^PLAY \[(?P<name>.*)\] \**\s*$')
+TASK_PATTERN = re.compile(r'^(?P<kind>TASK|RUNNING HANDLER) \[(?P<name>.*)\] \**\s*$')
+RECAP_PATTERN = re.compile(r'^PLAY RECAP \**\s*$')
+
+# Per-host results: "ok: [host]", "changed: [host -> delegate] => (item=x)",
+# "fatal: [host]: FAILED! => {...}", "fatal: [host]: UNREACHABLE! => {...}"
+RESULT_PATTERN = re.compile(
+    r'^(?P<status>ok|changed|skipping|failed|fatal|unreachable|rescued|ignored): '
+    r'\[(?P<host>[^\]\s]+)(?: -> [^\]]+)?\]'
+    r'(?P<rest>.*)$'
+)
+
+# Recap line: "vm-apps : ok=12 changed=3 unreachable=0 failed=0 skipped=2 rescued=0 ignored=0"
+RECAP_LINE_PATTERN = re.compile(r'^(?P<host>\S+)\s+:\s+(?P<counts>(?:\w+=\d+\s*)+)$')
+RECAP_COUNT_PATTERN = re.compile(r'(\w+)=(\d+)')
+
+STATUS_ALIASES = {
+    'skipping': 'skipped',
+    'fatal': 'failed',
+}
+
+# Printed on its own line after a failed result when ignore_errors is set
+IGNORING_LINE = '...ignoring'
+
+MAX_FAILURES = 50
+
+
+def strip_ansi(text: str) -> str:
+    """Remove ANSI colour codes (e.g. "\x1b[0;31mfatal: ...\x1b[0m")"""
+    return ANSI_PATTERN.sub('', text)
+
+
+class TaskStats:
+    """Aggregated results and wall-clock time of one playbook task"""
+
+    __slots__ = ('play', 'role', 'name', 'is_handler', 'runs', 'duration', 'results', 'hosts')
+
+    def __init__(self, play: str, role: Optional[str], name: str, is_handler: bool = False):
+        self.play = play
+        self.role = role
+        self.name = name
+        self.is_handler = is_handler
+        self.runs = 0
+        self.duration = 0.0
+        self.results: Counter = Counter()
+        self.hosts: Dict[str, str] = {}
+
+    @property
+    def key(self) -> str:
+        return f"{self.role} : {self.name}" if self.role else self.name
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'play': self.play,
+            'role': self.role,
+            'task': self.name,
+            'key': self.key,
+            'handler': self.is_handler,
+            'runs': self.runs,
+            'duration_seconds': self.duration,
+            'results': dict(self.results),
+            'hosts': dict(self.hosts)
+        }
+
+
+class AnsibleOutputParser:
+    """
+    Incremental parser for ansible-playbook output
+
+    Feed log entries (as yielded by ``stream_task_logs``) or raw lines one
+    at a time. The parser keeps only aggregates – one TaskStats per
+    distinct task, per-host counters, the recap and a bounded list of
+    recent failures – so memory does not grow with log length.
+
+    A task's wall-clock time runs from its TASK line to the next boundary
+    (TASK, PLAY, PLAY RECAP). Entry timestamps are used when present
+    (archived or replayed logs), arrival time otherwise.
+    """
+
+    def __init__(self):
+        self.plays: Dict[str, None] = {}
+        self.tasks: Dict[Tuple[str, Optional[str], str], TaskStats] = {}
+        self.host_results: Dict[str, Counter] = {}
+        self.recap: Dict[str, Dict[str, int]] = {}
+        self.failures: Deque[Dict[str, Any]] = deque(maxlen=MAX_FAILURES)
+
+        self.lines = 0
+        self.started_at: Optional[float] = None
+        self.last_seen: Optional[float] = None
+
+        self.current_play: Optional[str] = None
+        self.current_task: Optional[TaskStats] = None
+        self._task_started: Optional[float] = None
+        self._in_recap = False
+        # (host, previous task status of the host, failures entry) of the last failed result
+        self._last_failed: Optional[Tuple[str, Optional[str], Dict[str, Any]]] = None
+
+    # ═══════════════════════════════════════════════════════════
+    # FEEDING
+    # ═══════════════════════════════════════════════════════════
+
+    def feed(self, entry: Union[Dict[str, Any], str], timestamp: Optional[float] = None) -> None:
+        """
+        Consume one output line
+
+        Args:
+            entry: Log entry ({'output': ..., 'time': ...}) or raw line
+            timestamp: Unix time of the line (default: entry time or now)
+        """
+        if isinstance(entry, dict):
+            line = str(entry.get('output', ''))
+            raw_time = entry.get('time')
+        else:
+            line = entry
+            raw_time = None
+
+        if '\x1b' in line:
+            line = strip_ansi(line)
+        line = line.rstrip()
+        self.lines += 1
+        if not line:
+            return
+
+        if line[0] in 'PTR':
+            match = TASK_PATTERN.match(line)
+            if match:
+                at = self._time_of(raw_time, timestamp)
+                self._start_task(match.group('name'), match.group('kind') == 'RUNNING HANDLER', at)
+                return
+
+            if RECAP_PATTERN.match(line):
+                self._close_task(self._time_of(raw_time, timestamp))
+                self._in_recap = True
+                return
+
+            match = PLAY_PATTERN.match(line)
+            if match:
+                self._close_task(self._time_of(raw_time, timestamp))
+                self._in_recap = False
+                self.current_play = match.group('name')
+                # Plays repeat when a playbook loops; keep each name once
+                self.plays.setdefault(self.current_play, None)
+                return
+
+        if self._in_recap:
+            match = RECAP_LINE_PATTERN.match(line)
+            if match:
+                self.recap[match.group('host')] = {
+                    key: int(value)
+                    for key, value in RECAP_COUNT_PATTERN.findall(match.group('counts'))
+                }
+            return
+
+        if line == IGNORING_LINE:
+            self._ignore_last_failure()
+            return
+
+        match = RESULT_PATTERN.match(line)
+        if match:
+            self._record_result(match.group('status'), match.group('host'), match.group('rest'))
+
+    def feed_many(self, entries: Iterable[Union[Dict[str, Any], str]]) -> 'AnsibleOutputParser':
+        """Consume several lines (returns self for chaining)"""
+        for entry in entries:
+            self.feed(entry)
+        return self
+
+    def finish(self, timestamp: Optional[float] = None) -> None:
+        """Close the running task (end of log without PLAY RECAP)"""
+        self._close_task(timestamp if timestamp is not None else (self.last_seen or time.time()))
+
+    # ═══════════════════════════════════════════════════════════
+    # RESULTS
+    # ═══════════════════════════════════════════════════════════
+
+    @property
+    def failed(self) -> bool:
+        """True if any host failed or was unreachable"""
+        if self.recap:
+            return any(r.get('failed', 0) or r.get('unreachable', 0) for r in self.recap.values())
+        return any(c['failed'] or c['unreachable'] for c in self.host_results.values())
+
+    def role_durations(self) -> Dict[str, float]:
+        """Wall-clock seconds per role (tasks without role under '-'), longest first"""
+        durations: Counter = Counter()
+        for stats in self.tasks.values():
+            durations[stats.role or '-'] += stats.duration
+        return dict(durations.most_common())
+
+    def slowest_tasks(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Tasks with the longest wall-clock time"""
+        ranked = sorted(self.tasks.values(), key=lambda s: s.duration, reverse=True)
+        return [stats.to_dict() for stats in ranked[:limit]]
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Get structured model of the run so far
+
+        Returns:
+            Dict with plays, task/host/recap aggregates, role timings and failures
+        """
+        return {
+            'lines': self.lines,
+            'plays': list(self.plays),
+            'current_play': self.current_play,
+            'current_task': self.current_task.key if self.current_task else None,
+            'task_count': len(self.tasks),
+            'duration_seconds': (
+                self.last_seen - self.started_at
+                if self.started_at is not None and self.last_seen is not None else None
+            ),
+            'roles': self.role_durations(),
+            'slowest_tasks': self.slowest_tasks(),
+            'hosts': {host: dict(counts) for host, counts in self.host_results.items()},
+            'recap': dict(self.recap),
+            'failed': self.failed,
+            'failures': list(self.failures)
+        }
+
+    # ═══════════════════════════════════════════════════════════
+    # INTERNALS
+    # ═══════════════════════════════════════════════════════════
+
+    @staticmethod
+    def _time_of(raw_time: Optional[str], timestamp: Optional[float]) -> float:
+        # Timestamps are only needed on boundaries, so they are parsed lazily
+        if timestamp is not None:
+            return timestamp
+        parsed = _parse_time(raw_time) if raw_time else None
+        return parsed if parsed is not None else time.time()
+
+    def _start_task(self, full_name: str, is_handler: bool, at: float) -> None:
+        self._close_task(at)
+
+        role, _, name = full_name.partition(' : ')
+        if not name:
+            role, name = None, full_name
+
+        play = self.current_play or ''
+        key = (play, role, name)
+        stats = self.tasks.get(key)
+        if stats is None:
+            stats = TaskStats(play, role, name, is_handler)
+            self.tasks[key] = stats
+
+        stats.runs += 1
+        self.current_task = stats
+        self._task_started = at
+
+    def _close_task(self, at: float) -> None:
+        if self.started_at is None:
+            self.started_at = at
+        self.last_seen = at
+
+        if self.current_task is not None and self._task_started is not None:
+            self.current_task.duration += max(0.0, at - self._task_started)
+
+        self.current_task = None
+        self._task_started = None
+        self._last_failed = None
+
+    def _record_result(self, status: str, host: str, rest: str) -> None:
+        if 'UNREACHABLE!' in rest:
+            status = 'unreachable'
+        status = STATUS_ALIASES.get(status, status)
+        self._last_failed = None
+
+        counts = self.host_results.get(host)
+        if counts is None:
+            counts = Counter(ok=0, changed=0, failed=0, skipped=0, unreachable=0)
+            self.host_results[host] = counts
+        counts[status] += 1
+
+        task = self.current_task
+        previous = task.hosts.get(host) if task is not None else None
+        if task is not None:
+            task.results[status] += 1
+            # Worst result per host wins (loops report one line per item)
+            if _SEVERITY.get(status, 0) >= _SEVERITY.get(task.hosts.get(host), -1):
+                task.hosts[host] = status
+
+        if status in ('failed', 'unreachable'):
+            failure = {
+                'host': host,
+                'status': status,
+                'task': task.key if task else None,
+                'message': rest.split('=>', 1)[-1].strip()[:500]
+            }
+            self.failures.append(failure)
+            if status == 'failed':
+                self._last_failed = (host, previous, failure)
+
+    def _ignore_last_failure(self) -> None:
+        """Turn the last failed result into an ignored one (ignore_errors)"""
+        if self._last_failed is None:
+            return
+        host, previous, failure = self._last_failed
+        self._last_failed = None
+
+        counts = self.host_results[host]
+        counts['failed'] -= 1
+        counts['ignored'] += 1
+
+        task = self.current_task
+        if task is not None:
+            task.results['failed'] -= 1
+            if not task.results['failed']:
+                del task.results['failed']
+            task.results['ignored'] += 1
+            if _SEVERITY.get(previous, -1) >= _SEVERITY['ignored']:
+                task.hosts[host] = previous
+            else:
+                task.hosts[host] = 'ignored'
+
+        try:
+            self.failures.remove(failure)
+        except ValueError:
+            pass  # already rotated out of the bounded list
+
+
+_SEVERITY = {'skipped': 0, 'ok': 1, 'ignored': 2, 'rescued': 2, 'changed': 3, 'failed': 4, 'unreachable': 5}
+
+
+def _parse_time(value: str) -> Optional[float]:
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+    except (ValueError, AttributeError):
+        return None
+
+
+def parse_task_output(entries: Iterable[Union[Dict[str, Any], str]]) -> Dict[str, Any]:
+    """
+    Parse a complete task output
+
+    Args:
+        entries: Log entries or raw lines (e.g. TaskLogArchive.iter_lines)
+
+    Returns:
+        Parser summary (see AnsibleOutputParser.summary)
+    """
+    parser = AnsibleOutputParser().feed_many(entries)
+    parser.finish()
+    return parser.summary()
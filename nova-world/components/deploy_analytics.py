@@ -0,0 +1,308 @@
+"""
+Deployment Analytics
+Vectorised Duration Percentiles, Failure Rates and Trends over Task History
+"""
+
+import threading
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Deployment profiles, detected by template name
+PROFILES = ('minimal', 'standard', 'full')
+
+STATUS_CODES = {'success': 0, 'error': 1, 'stopped': 2}
+STATUS_OTHER = 3  # waiting / running / unknown
+
+PERCENTILES = (50, 95, 99)
+
+
+class TaskColumns:
+    """
+    Task history as columnar NumPy arrays
+
+    Timestamps are parsed in one vectorised pass (datetime64) instead of
+    one datetime.fromisoformat() call per task.
+    """
+
+    def __init__(
+        self,
+        ids: np.ndarray,
+        template_ids: np.ndarray,
+        status: np.ndarray,
+        start: np.ndarray,
+        end: np.ndarray
+    ):
+        self.ids = ids
+        self.template_ids = template_ids
+        self.status = status
+        self.start = start
+        self.end = end
+
+        # Seconds, NaN while a task has no start or end
+        self.duration = (end - start) / np.timedelta64(1, 's')
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def from_columns(cls, columns: Dict[str, List[Any]]) -> 'TaskColumns':
+        """
+        Build arrays from raw columns (see TaskHistoryStore.columns)
+
+        Args:
+            columns: Dict with id, template_id, status, start and end lists
+
+        Returns:
+            TaskColumns
+        """
+        status = np.fromiter(
+            (STATUS_CODES.get(s, STATUS_OTHER) for s in columns['status']),
+            dtype=np.int8,
+            count=len(columns['status'])
+        )
+        template_ids = np.array(
+            [t if t is not None else -1 for t in columns['template_id']],
+            dtype=np.int64
+        )
+
+        return cls(
+            ids=np.asarray(columns['id'], dtype=np.int64),
+            template_ids=template_ids,
+            status=status,
+            start=_to_datetime64(columns['start']),
+            end=_to_datetime64(columns['end'])
+        )
+
+    @classmethod
+    def from_tasks(cls, tasks: List[Dict[str, Any]]) -> 'TaskColumns':
+        """Build arrays from Semaphore task payloads"""
+        tasks = sorted(tasks, key=lambda t: t.get('id', 0))
+        return cls.from_columns({
+            'id': [t.get('id', 0) for t in tasks],
+            'template_id': [t.get('template_id') for t in tasks],
+            'status': [t.get('status') for t in tasks],
+            'start': [_strip_z(t.get('start')) for t in tasks],
+            'end': [_strip_z(t.get('end')) for t in tasks],
+        })
+
+
+class DeploymentAnalytics:
+    """
+    Per-template and per-profile deployment statistics
+
+    - Duration percentiles (p50/p95/p99) over successful runs
+    - Failure rate = error / (success + error); stopped runs are ignored
+    - Trend = change of the median duration of the last ``trend_window``
+      successful runs against all earlier ones
+    """
+
+    def __init__(self, columns: TaskColumns, trend_window: int = 10):
+        """
+        Initialize analytics
+
+        Args:
+            columns: Task history arrays (ordered by task ID)
+            trend_window: Number of latest successful runs compared for the trend
+        """
+        self.columns = columns
+        self.trend_window = trend_window
+
+    def by_template(self) -> Dict[int, Dict[str, Any]]:
+        """
+        Statistics per template
+
+        Returns:
+            Dict template_id → stats (see _stats)
+        """
+        cols = self.columns
+        if not len(cols):
+            return {}
+
+        templates, inverse = np.unique(cols.template_ids, return_inverse=True)
+        groups = len(templates)
+
+        success = np.bincount(inverse, weights=cols.status == STATUS_CODES['success'], minlength=groups)
+        failed = np.bincount(inverse, weights=cols.status == STATUS_CODES['error'], minlength=groups)
+        total = np.bincount(inverse, minlength=groups)
+
+        # Successful durations grouped by template (stable sort keeps ID order)
+        ok = (cols.status == STATUS_CODES['success']) & ~np.isnan(cols.duration)
+        ok_groups = inverse[ok]
+        ok_durations = cols.duration[ok]
+        order = np.argsort(ok_groups, kind='stable')
+        bounds = np.searchsorted(ok_groups[order], np.arange(groups + 1))
+        sorted_durations = ok_durations[order]
+
+        return {
+            int(template_id): self._stats(
+                sorted_durations[bounds[i]:bounds[i + 1]],
+                int(total[i]),
+                int(success[i]),
+                int(failed[i])
+            )
+            for i, template_id in enumerate(templates)
+        }
+
+    def by_profile(self, template_names: Dict[int, str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Statistics per deployment profile
+
+        Args:
+            template_names: Dict template_id → template name
+
+        Returns:
+            Dict profile → stats (profiles without runs are omitted)
+        """
+        cols = self.columns
+        results = {}
+
+        for profile in PROFILES:
+            template_ids = [tid for tid, name in template_names.items() if profile_of(name) == profile]
+            if not template_ids:
+                continue
+
+            mask = np.isin(cols.template_ids, template_ids)
+            if not mask.any():
+                continue
+
+            status = cols.status[mask]
+            durations = cols.duration[mask]
+            ok = (status == STATUS_CODES['success']) & ~np.isnan(durations)
+
+            results[profile] = self._stats(
+                durations[ok],
+                int(mask.sum()),
+                int((status == STATUS_CODES['success']).sum()),
+                int((status == STATUS_CODES['error']).sum())
+            )
+
+        return results
+
+    def _stats(
+        self,
+        durations: np.ndarray,
+        total: int,
+        success: int,
+        failed: int
+    ) -> Dict[str, Any]:
+        """Stats for one group (durations of successful runs in ID order)"""
+        finished = success + failed
+        stats: Dict[str, Any] = {
+            'runs': total,
+            'success': success,
+            'failed': failed,
+            'failure_rate': failed / finished if finished else None,
+            'samples': int(len(durations)),
+            'mean': float(durations.mean()) if len(durations) else None,
+            'trend': None
+        }
+
+        if len(durations):
+            values = np.percentile(durations, PERCENTILES)
+            for pct, value in zip(PERCENTILES, values):
+                stats[f'p{pct}'] = float(value)
+        else:
+            for pct in PERCENTILES:
+                stats[f'p{pct}'] = None
+
+        window = self.trend_window
+        if len(durations) >= 2 * window:
+            recent = np.median(durations[-window:])
+            earlier = np.median(durations[:-window])
+            if earlier > 0:
+                stats['trend'] = float((recent - earlier) / earlier)
+
+        return stats
+
+
+# ═══════════════════════════════════════════════════════════
+# HELPERS
+# ═══════════════════════════════════════════════════════════
+
+def profile_of(template_name: Optional[str]) -> Optional[str]:
+    """Detect deployment profile from a template name ("Deploy Full Profile" → "full")"""
+    name = (template_name or '').lower()
+    return next((profile for profile in PROFILES if profile in name), None)
+
+
+def format_duration(seconds: Optional[float]) -> str:
+    """Human-readable duration (e.g. "12m 34s")"""
+    if seconds is None:
+        return 'N/A'
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return f"{seconds}s"
+    minutes, seconds = divmod(seconds, 60)
+    if minutes < 60:
+        return f"{minutes}m {seconds:02d}s"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h {minutes:02d}m"
+
+
+def format_estimate(stats: Optional[Dict[str, Any]], min_samples: int = 3) -> Optional[str]:
+    """
+    Duration estimate for a profile card
+
+    Args:
+        stats: Stats dict from DeploymentAnalytics
+        min_samples: Minimum successful runs required
+
+    Returns:
+        e.g. "~12m 30s (p95: 15m 10s, 42 Läufe)" or None if not enough data
+    """
+    if not stats or stats['samples'] < min_samples:
+        return None
+    return (
+        f"~{format_duration(stats['p50'])} "
+        f"(p95: {format_duration(stats['p95'])}, {stats['samples']} Läufe)"
+    )
+
+
+def _to_datetime64(values: List[Optional[str]]) -> np.ndarray:
+    """Vectorised ISO timestamp parsing (None → NaT)"""
+    return np.array(values, dtype='datetime64[ms]')
+
+
+def _strip_z(value: Optional[str]) -> Optional[str]:
+    return value[:-1] if value and value.endswith('Z') else value
+
+
+# ═══════════════════════════════════════════════════════════
+# CACHED ANALYTICS PER PROJECT
+# ═══════════════════════════════════════════════════════════
+
+_cache: Dict[int, Tuple[Tuple[Any, ...], DeploymentAnalytics]] = {}
+_cache_lock = threading.Lock()
+
+
+def get_deployment_analytics(store: Any, project_id: int) -> DeploymentAnalytics:
+    """
+    Get analytics for a project from the task history store
+
+    Arrays are rebuilt only after the store received new task data, so
+    page reruns reuse the last result.
+
+    Args:
+        store: TaskHistoryStore
+        project_id: Project ID
+
+    Returns:
+        DeploymentAnalytics
+    """
+    version = (id(store), store.revision)
+
+    with _cache_lock:
+        cached = _cache.get(project_id)
+        if cached and cached[0] == version:
+            return cached[1]
+
+    analytics = DeploymentAnalytics(TaskColumns.from_columns(store.columns(project_id)))
+
+    with _cache_lock:
+        _cache[project_id] = (version, analytics)
+
+    return analytics
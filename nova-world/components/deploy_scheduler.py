@@ -0,0 +1,390 @@
+"""
+Deployment Scheduler
+Priority Queue in front of run_task with per-Inventory Locking, Coalescing and a Concurrency Cap
+"""
+
+import heapq
+import itertools
+import time
+import threading
+import logging
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from .semaphore_api import SemaphoreAPIError
+from .semaphore_watcher import get_task_watcher
+
+logger = logging.getLogger(__name__)
+
+# Lower value runs first
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 5
+PRIORITY_LOW = 9
+
+DEFAULT_MAX_CONCURRENT = 2
+DEFAULT_DEPLOY_TIMEOUT = 4 * 3600
+
+
+class DeployRequest:
+    """
+    One queued or running deployment
+
+    ``future`` resolves to the final Semaphore task payload (or fails with
+    SemaphoreAPIError if the task could not be started or timed out).
+    """
+
+    __slots__ = (
+        'project_id', 'template_id', 'template_name', 'inventory_id', 'priority',
+        'submitted_at', 'started_at', 'finished_at', 'task_id', 'status', 'coalesced', 'future'
+    )
+
+    def __init__(
+        self,
+        project_id: int,
+        template_id: int,
+        template_name: str,
+        inventory_id: Optional[int],
+        priority: int
+    ):
+        self.project_id = project_id
+        self.template_id = template_id
+        self.template_name = template_name
+        self.inventory_id = inventory_id
+        self.priority = priority
+        self.submitted_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.task_id: Optional[int] = None
+        self.status = 'queued'
+        self.coalesced = 0
+        self.future: Future = Future()
+
+    @property
+    def template_key(self) -> Tuple[int, int]:
+        return (self.project_id, self.template_id)
+
+    @property
+    def inventory_key(self) -> Tuple[int, Any]:
+        # Templates without a known inventory serialise per template
+        if self.inventory_id is None:
+            return (self.project_id, ('template', self.template_id))
+        return (self.project_id, self.inventory_id)
+
+    @property
+    def wait_seconds(self) -> float:
+        """Time spent in the queue (so far)"""
+        return (self.started_at or time.time()) - self.submitted_at
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'project_id': self.project_id,
+            'template_id': self.template_id,
+            'template_name': self.template_name,
+            'inventory_id': self.inventory_id,
+            'priority': self.priority,
+            'status': self.status,
+            'task_id': self.task_id,
+            'coalesced': self.coalesced,
+            'wait_seconds': self.wait_seconds,
+            'submitted_at': self.submitted_at,
+            'started_at': self.started_at
+        }
+
+
+class DeploymentScheduler:
+    """
+    Deployment queue in front of ``SemaphoreAPI.run_task``
+
+    - Priority queue (lower value first, FIFO within a priority)
+    - At most one running deployment per inventory (same target hosts)
+    - Duplicate requests for a template that is already queued are
+      coalesced into the queued request; a template that is running gets
+      at most one queued follow-up (it started before the latest change)
+    - At most ``max_concurrent`` deployments run at once
+
+    There is no scheduler thread: the queue is pumped on submit and
+    whenever a running deployment finishes (via the shared TaskWatcher).
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+        deploy_timeout: float = DEFAULT_DEPLOY_TIMEOUT,
+        history_size: int = 100
+    ):
+        """
+        Initialize scheduler
+
+        Args:
+            client: SemaphoreAPI client
+            max_concurrent: Maximum number of running deployments
+            deploy_timeout: Release the slot of a deployment after this many seconds
+            history_size: Finished requests kept for wait-time statistics
+        """
+        self.client = client
+        self.max_concurrent = max(1, max_concurrent)
+        self.deploy_timeout = deploy_timeout
+
+        self._heap: List[Tuple[int, int, DeployRequest]] = []
+        self._seq = itertools.count()
+        self._queued_by_template: Dict[Tuple[int, int], DeployRequest] = {}
+        self._running: Dict[Tuple[int, Any], DeployRequest] = {}
+        self._finished: Deque[DeployRequest] = deque(maxlen=history_size)
+        self._lock = threading.Lock()
+
+        self.submitted = 0
+        self.coalesced = 0
+        self.dispatched = 0
+
+    # ═══════════════════════════════════════════════════════════
+    # PUBLIC API
+    # ═══════════════════════════════════════════════════════════
+
+    def submit(
+        self,
+        project_id: int,
+        template: Dict[str, Any],
+        priority: int = PRIORITY_NORMAL
+    ) -> DeployRequest:
+        """
+        Queue a deployment
+
+        Args:
+            project_id: Project ID
+            template: Template payload (id, name, inventory_id)
+            priority: Queue priority (PRIORITY_HIGH … PRIORITY_LOW)
+
+        Returns:
+            New DeployRequest, or the queued one if coalesced
+        """
+        template_id = template['id']
+
+        with self._lock:
+            self.submitted += 1
+
+            existing = self._queued_by_template.get((project_id, template_id))
+            if existing is not None:
+                existing.coalesced += 1
+                self.coalesced += 1
+                if priority < existing.priority:
+                    self._reprioritize(existing, priority)
+                return existing
+
+            request = DeployRequest(
+                project_id,
+                template_id,
+                template.get('name', str(template_id)),
+                template.get('inventory_id'),
+                priority
+            )
+            self._queued_by_template[request.template_key] = request
+            heapq.heappush(self._heap, (priority, next(self._seq), request))
+
+        self._pump()
+        return request
+
+    def cancel(self, request: DeployRequest) -> bool:
+        """
+        Remove a queued deployment (running ones are not stopped)
+
+        Returns:
+            True if the request was still queued
+        """
+        with self._lock:
+            if request.status != 'queued':
+                return False
+            self._heap = [item for item in self._heap if item[2] is not request]
+            heapq.heapify(self._heap)
+            self._queued_by_template.pop(request.template_key, None)
+            request.status = 'cancelled'
+            request.finished_at = time.time()
+
+        request.future.cancel()
+        return True
+
+    def position(self, request: DeployRequest) -> Optional[int]:
+        """1-based queue position of a queued request (None if not queued)"""
+        with self._lock:
+            if request.status != 'queued':
+                return None
+            ordered = sorted(self._heap)
+            return next(i for i, item in enumerate(ordered, 1) if item[2] is request)
+
+    def snapshot(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get queued (in dispatch order) and running deployments
+
+        Returns:
+            Dict with 'queued' and 'running' request dicts
+        """
+        with self._lock:
+            return {
+                'queued': [item[2].to_dict() for item in sorted(self._heap)],
+                'running': [r.to_dict() for r in self._running.values()]
+            }
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get queue statistics
+
+        Returns:
+            Dict with queue depth, running count, counters and wait times
+            (current queue and recently started requests)
+        """
+        now = time.time()
+        with self._lock:
+            waits = [r.wait_seconds for r in self._finished if r.started_at is not None]
+            waits += [r.wait_seconds for r in self._running.values()]
+            queued_waits = [now - item[2].submitted_at for item in self._heap]
+
+            return {
+                'queued': len(self._heap),
+                'running': len(self._running),
+                'max_concurrent': self.max_concurrent,
+                'submitted': self.submitted,
+                'coalesced': self.coalesced,
+                'dispatched': self.dispatched,
+                'avg_wait_seconds': sum(waits) / len(waits) if waits else None,
+                'max_wait_seconds': max(waits) if waits else None,
+                'oldest_queued_seconds': max(queued_waits) if queued_waits else None
+            }
+
+    # ═══════════════════════════════════════════════════════════
+    # DISPATCH
+    # ═══════════════════════════════════════════════════════════
+
+    def _pump(self) -> None:
+        """Start queued deployments while slots and inventories are free"""
+        while True:
+            with self._lock:
+                request = self._next_runnable()
+                if request is None:
+                    return
+                request.status = 'starting'
+                request.started_at = time.time()
+                self._running[request.inventory_key] = request
+                # Later requests for this template queue up as its follow-up
+                if self._queued_by_template.get(request.template_key) is request:
+                    del self._queued_by_template[request.template_key]
+
+            try:
+                task = self.client.run_task(request.project_id, request.template_id)
+            except Exception as e:
+                logger.warning(f"Deployment of '{request.template_name}' could not be started: {e}")
+                self._release(request, 'failed')
+                if request.future.set_running_or_notify_cancel():
+                    request.future.set_exception(
+                        e if isinstance(e, SemaphoreAPIError) else SemaphoreAPIError(str(e))
+                    )
+                continue
+
+            if task.get('id') is None:
+                logger.warning(f"Deployment of '{request.template_name}' returned no task id")
+                self._release(request, 'failed')
+                if request.future.set_running_or_notify_cancel():
+                    request.future.set_exception(SemaphoreAPIError("Semaphore returned no task id"))
+                continue
+
+            with self._lock:
+                request.task_id = task['id']
+                request.status = 'running'
+                self.dispatched += 1
+
+            watch = get_task_watcher(self.client).watch(
+                request.project_id,
+                request.task_id,
+                timeout=self.deploy_timeout
+            )
+            watch.add_done_callback(lambda f, r=request: self._on_finished(r, f))
+
+    def _next_runnable(self) -> Optional[DeployRequest]:
+        """Pop the best queued request whose inventory is free (lock must be held)"""
+        if len(self._running) >= self.max_concurrent:
+            return None
+
+        skipped = []
+        request = None
+        while self._heap:
+            item = heapq.heappop(self._heap)
+            if item[2].inventory_key in self._running:
+                skipped.append(item)
+                continue
+            request = item[2]
+            break
+
+        for item in skipped:
+            heapq.heappush(self._heap, item)
+
+        return request
+
+    def _on_finished(self, request: DeployRequest, watch: Future) -> None:
+        """Resolve the request and start the next deployment"""
+        if watch.cancelled():
+            self._release(request, 'cancelled')
+            request.future.cancel()
+        elif watch.exception() is not None:
+            self._release(request, 'failed')
+            if request.future.set_running_or_notify_cancel():
+                request.future.set_exception(watch.exception())
+        else:
+            task = watch.result()
+            self._release(request, task.get('status', 'finished'))
+            if request.future.set_running_or_notify_cancel():
+                request.future.set_result(task)
+
+        self._pump()
+
+    def _release(self, request: DeployRequest, status: str) -> None:
+        with self._lock:
+            request.status = status
+            request.finished_at = time.time()
+            if self._running.get(request.inventory_key) is request:
+                del self._running[request.inventory_key]
+            self._finished.append(request)
+
+    def _reprioritize(self, request: DeployRequest, priority: int) -> None:
+        """Raise priority of a queued request (lock must be held)"""
+        for i, item in enumerate(self._heap):
+            if item[2] is request:
+                self._heap[i] = (priority, item[1], request)
+                break
+        request.priority = priority
+        heapq.heapify(self._heap)
+
+
+# ═══════════════════════════════════════════════════════════
+# SHARED SCHEDULERS
+# ═══════════════════════════════════════════════════════════
+
+_schedulers: Dict[Tuple[str, str], DeploymentScheduler] = {}
+_schedulers_lock = threading.Lock()
+
+
+def get_deploy_scheduler(client: Any) -> DeploymentScheduler:
+    """
+    Get process-wide deployment scheduler for a Semaphore instance
+
+    Args:
+        client: SemaphoreAPI client
+
+    Returns:
+        DeploymentScheduler (max_concurrent from semaphore.max_concurrent_deploys)
+    """
+    key = client.client_key
+
+    with _schedulers_lock:
+        scheduler = _schedulers.get(key)
+        if scheduler is None:
+            max_concurrent = DEFAULT_MAX_CONCURRENT
+            try:
+                import streamlit as st
+                max_concurrent = int(
+                    st.secrets.get("semaphore", {}).get("max_concurrent_deploys", DEFAULT_MAX_CONCURRENT)
+                )
+            except Exception:
+                pass
+            scheduler = DeploymentScheduler(client, max_concurrent=max_concurrent)
+            _schedulers[key] = scheduler
+        return scheduler
@@ -0,0 +1,451 @@
+"""
+Docker Engine Backend
+Container Operations over the Engine API (Unix Socket) with docker CLI Fallback
+"""
+
+import json
+import re
+import subprocess
+import threading
+import time
+import logging
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SOCKET = 'unix:///var/run/docker.sock'
+
+COMPOSE_PROJECT_LABEL = 'com.docker.compose.project'
+COMPOSE_SERVICE_LABEL = 'com.docker.compose.service'
+
+# "Up 2 hours (healthy)", "Up 3 seconds (health: starting)"
+HEALTH_PATTERN = re.compile(r'\((healthy|unhealthy|health: starting)\)')
+
+
+class DockerBackendError(Exception):
+    """Docker daemon or CLI error"""
+    pass
+
+
+class ContainerInfo:
+    """Structured container summary (one entry of `docker ps -a`)"""
+
+    __slots__ = ('id', 'name', 'image', 'state', 'status', 'health', 'labels', 'created')
+
+    def __init__(
+        self,
+        id: str,
+        name: str,
+        image: str,
+        state: str,
+        status: str = '',
+        health: Optional[str] = None,
+        labels: Optional[Dict[str, str]] = None,
+        created: Optional[float] = None
+    ):
+        self.id = id
+        self.name = name
+        self.image = image
+        self.state = state
+        self.status = status
+        self.health = health
+        self.labels = labels or {}
+        self.created = created
+
+    @property
+    def is_running(self) -> bool:
+        return self.state == 'running'
+
+    @property
+    def compose_project(self) -> Optional[str]:
+        return self.labels.get(COMPOSE_PROJECT_LABEL)
+
+    @property
+    def compose_service(self) -> Optional[str]:
+        return self.labels.get(COMPOSE_SERVICE_LABEL)
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> 'ContainerInfo':
+        """Build from an Engine API /containers/json entry"""
+        status = data.get('Status', '')
+        names = data.get('Names') or [data.get('Id', '')[:12]]
+        return cls(
+            id=data.get('Id', ''),
+            name=names[0].lstrip('/'),
+            image=data.get('Image', ''),
+            state=data.get('State', ''),
+            status=status,
+            health=_health_of(status, (data.get('Health') or {}).get('Status')),
+            labels=data.get('Labels') or {},
+            created=data.get('Created')
+        )
+
+    @classmethod
+    def from_cli(cls, data: Dict[str, Any]) -> 'ContainerInfo':
+        """Build from a `docker ps --format '{{json .}}'` line"""
+        status = data.get('Status', '')
+        labels = _parse_cli_labels(data.get('Labels') or '')
+        return cls(
+            id=data.get('ID', ''),
+            name=data.get('Names', '').split(',')[0],
+            image=data.get('Image', ''),
+            state=data.get('State', '') or ('running' if status.startswith('Up') else 'exited'),
+            status=status,
+            health=_health_of(status),
+            labels=labels
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'id': self.id,
+            'name': self.name,
+            'image': self.image,
+            'state': self.state,
+            'status': self.status,
+            'health': self.health,
+            'compose_project': self.compose_project,
+            'compose_service': self.compose_service,
+            'labels': dict(self.labels)
+        }
+
+
+def _parse_cli_labels(text: str) -> Dict[str, str]:
+    """
+    Parse the "k1=v1,k2=v2" Labels column of `docker ps`
+
+    Values may contain commas (com.docker.compose.depends_on:
+    "db:service_healthy:false,cache:service_started:false"), so a comma
+    only starts a new label if the next chunk has a "key=".
+    """
+    labels: Dict[str, str] = {}
+    key = None
+    for chunk in text.split(','):
+        name, sep, value = chunk.partition('=')
+        if sep and name and ':' not in name:
+            key = name
+            labels[key] = value
+        elif key is not None:
+            labels[key] += ',' + chunk
+    return labels
+
+
+def _health_of(status: str, health: Optional[str] = None) -> Optional[str]:
+    """Health from the API field or the status text ('starting', 'healthy', 'unhealthy')"""
+    if health:
+        return health
+    match = HEALTH_PATTERN.search(status or '')
+    if not match:
+        return None
+    return 'starting' if match.group(1) == 'health: starting' else match.group(1)
+
+
+def _state_of(state: Dict[str, Any]) -> Dict[str, Any]:
+    """Condensed container State (docker inspect)"""
+    return {
+        'status': state.get('Status', ''),
+        'health': (state.get('Health') or {}).get('Status'),
+        'exit_code': state.get('ExitCode')
+    }
+
+
+# ═══════════════════════════════════════════════════════════
+# ENGINE API BACKEND
+# ═══════════════════════════════════════════════════════════
+
+class DockerEngine:
+    """
+    Docker Engine API backend
+
+    Uses the low-level ``docker.APIClient`` over the unix socket: one
+    persistent connection pool per process, JSON responses instead of
+    parsed CLI text, and one socket round-trip per call instead of a
+    process spawn.
+    """
+
+    name = 'engine'
+
+    def __init__(
+        self,
+        base_url: str = DEFAULT_SOCKET,
+        timeout: int = 60,
+        max_pool_size: int = 16
+    ):
+        """
+        Initialize Engine API backend
+
+        Args:
+            base_url: Docker socket URL (e.g. unix:///var/run/docker.sock)
+            timeout: Default HTTP timeout in seconds
+            max_pool_size: Pooled connections (bounds parallel operations)
+
+        Raises:
+            DockerBackendError: If the docker SDK is missing or the daemon is unreachable
+        """
+        try:
+            import docker
+        except ImportError as e:
+            raise DockerBackendError("docker SDK not installed (pip install docker)") from e
+
+        self._errors = docker.errors
+        self.base_url = base_url
+        try:
+            self.api = docker.APIClient(
+                base_url=base_url,
+                version='auto',
+                timeout=timeout,
+                max_pool_size=max_pool_size
+            )
+        except docker.errors.DockerException as e:
+            # version='auto' asks the daemon, so an unreachable socket fails here
+            raise DockerBackendError(f"Docker daemon not reachable at {base_url}: {e}") from e
+
+    def ping(self) -> bool:
+        """True if the daemon answers"""
+        try:
+            return bool(self.api.ping())
+        except Exception:
+            return False
+
+    def containers(self, all: bool = True) -> List[ContainerInfo]:
+        """
+        List containers in one API call
+
+        Args:
+            all: Include stopped containers
+
+        Returns:
+            List of ContainerInfo
+        """
+        return [ContainerInfo.from_api(c) for c in self._call(self.api.containers, all=all)]
+
+    def start(self, container: str) -> None:
+        """Start a container"""
+        self._call(self.api.start, container)
+
+    def stop(self, container: str, timeout: int = 10) -> None:
+        """Stop a container (SIGKILL after ``timeout`` seconds)"""
+        self._call(self.api.stop, container, timeout=timeout)
+
+    def restart(self, container: str, timeout: int = 10) -> None:
+        """Restart a container"""
+        self._call(self.api.restart, container, timeout=timeout)
+
+    def inspect_state(self, container: str) -> Dict[str, Any]:
+        """
+        Current state of one container (fresh, not from the listing)
+
+        Returns:
+            Dict with status, health (None without healthcheck) and exit_code
+        """
+        return _state_of(self._call(self.api.inspect_container, container).get('State') or {})
+
+    def logs(self, container: str, tail: int = 50) -> str:
+        """Last lines of a container's stdout and stderr"""
+        output = self._call(self.api.logs, container, tail=tail, stdout=True, stderr=True)
+        return output.decode('utf-8', errors='replace') if isinstance(output, bytes) else str(output)
+
+    def events(self, since: Optional[float] = None) -> Any:
+        """
+        Subscribe to container events
+        
+        The request is sent immediately, so events that happen after this
+        call are not lost while the caller does other work.
+        
+        Args:
+            since: Replay events since this Unix time
+        
+        Returns:
+            Iterable of event dicts (Type, Action, id, Actor, time) with close()
+        """
+        return self._call(
+            self.api.events,
+            since=int(since) if since is not None else None,
+            filters={'type': 'container'},
+            decode=True
+        )
+
+    def prune(self) -> Dict[str, Any]:
+        """
+        Remove stopped containers, unused images, networks and volumes
+        (like `docker system prune -af --volumes`)
+
+        Returns:
+            Dict with deleted counts and reclaimed bytes
+        """
+        containers = self._call(self.api.prune_containers) or {}
+        images = self._call(self.api.prune_images, filters={'dangling': False}) or {}
+        networks = self._call(self.api.prune_networks) or {}
+        volumes = self._call(self.api.prune_volumes) or {}
+
+        return {
+            'containers': len(containers.get('ContainersDeleted') or []),
+            'images': len(images.get('ImagesDeleted') or []),
+            'networks': len(networks.get('NetworksDeleted') or []),
+            'volumes': len(volumes.get('VolumesDeleted') or []),
+            'space_reclaimed': (
+                (containers.get('SpaceReclaimed') or 0)
+                + (images.get('SpaceReclaimed') or 0)
+                + (volumes.get('SpaceReclaimed') or 0)
+            )
+        }
+
+    def _call(self, fn, *args, **kwargs) -> Any:
+        try:
+            return fn(*args, **kwargs)
+        except self._errors.NotFound as e:
+            raise DockerBackendError(f"Container not found: {args[0] if args else e}") from e
+        except self._errors.DockerException as e:
+            raise DockerBackendError(str(e)) from e
+        except Exception as e:
+            # requests timeouts / socket errors
+            raise DockerBackendError(f"Docker Engine API error: {e}") from e
+
+
+# ═══════════════════════════════════════════════════════════
+# CLI FALLBACK
+# ═══════════════════════════════════════════════════════════
+
+class DockerCLI:
+    """
+    docker CLI backend (fallback without SDK or socket access)
+
+    Same interface as DockerEngine; every call spawns a `docker` process.
+    """
+
+    name = 'cli'
+
+    def __init__(self, timeout: int = 30):
+        self.timeout = timeout
+
+    def ping(self) -> bool:
+        try:
+            return self._run('version', '--format', '{{.Server.Version}}', timeout=5).returncode == 0
+        except DockerBackendError:
+            return False
+
+    def containers(self, all: bool = True) -> List[ContainerInfo]:
+        args = ['ps', '--no-trunc', '--format', '{{json .}}'] + (['-a'] if all else [])
+        result = self._checked(*args)
+        return [
+            ContainerInfo.from_cli(json.loads(line))
+            for line in result.stdout.splitlines() if line.strip()
+        ]
+
+    def start(self, container: str) -> None:
+        self._checked('start', container)
+
+    def stop(self, container: str, timeout: int = 10) -> None:
+        self._checked('stop', '-t', str(timeout), container, timeout=self.timeout + timeout)
+
+    def restart(self, container: str, timeout: int = 10) -> None:
+        self._checked('restart', '-t', str(timeout), container, timeout=self.timeout + timeout)
+
+    def inspect_state(self, container: str) -> Dict[str, Any]:
+        result = self._checked('inspect', '--format', '{{json .State}}', container)
+        return _state_of(json.loads(result.stdout or '{}'))
+
+    def logs(self, container: str, tail: int = 50) -> str:
+        result = self._checked('logs', '--tail', str(tail), container)
+        return result.stdout + result.stderr
+
+    def events(self, since: Optional[float] = None) -> '_CLIEventStream':
+        args = ['docker', 'events', '--format', '{{json .}}', '--filter', 'type=container']
+        if since is not None:
+            args += ['--since', str(int(since))]
+        try:
+            process = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+        except FileNotFoundError as e:
+            raise DockerBackendError("Docker not found. Is Docker installed?") from e
+        return _CLIEventStream(process)
+
+    def prune(self) -> Dict[str, Any]:
+        result = self._checked('system', 'prune', '-af', '--volumes', timeout=120)
+        return {'output': result.stdout}
+
+    def _checked(self, *args: str, timeout: Optional[int] = None) -> subprocess.CompletedProcess:
+        result = self._run(*args, timeout=timeout)
+        if result.returncode != 0:
+            raise DockerBackendError(result.stderr.strip() or f"docker {args[0]} failed")
+        return result
+
+    def _run(self, *args: str, timeout: Optional[int] = None) -> subprocess.CompletedProcess:
+        try:
+            return subprocess.run(
+                ['docker', *args],
+                capture_output=True,
+                text=True,
+                timeout=timeout or self.timeout,
+                check=False
+            )
+        except subprocess.TimeoutExpired as e:
+            raise DockerBackendError(f"Timeout: docker {args[0]} took too long") from e
+        except FileNotFoundError as e:
+            raise DockerBackendError("Docker not found. Is Docker installed?") from e
+
+
+class _CLIEventStream:
+    """`docker events` process as an iterable of event dicts (close() ends it)"""
+
+    def __init__(self, process: subprocess.Popen):
+        self.process = process
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for line in self.process.stdout:
+            if line.strip():
+                yield json.loads(line)
+        if self.process.wait() != 0:
+            raise DockerBackendError(f"docker events exited with code {self.process.returncode}")
+
+    def close(self) -> None:
+        if self.process.poll() is None:
+            self.process.terminate()
+
+
+# ═══════════════════════════════════════════════════════════
+# SHARED BACKEND
+# ═══════════════════════════════════════════════════════════
+
+_backend: Optional[Any] = None
+_backend_fallback_until = 0.0
+_backend_lock = threading.Lock()
+
+# How long the CLI fallback is used before the Engine API is tried again
+FALLBACK_RETRY_SECONDS = 60
+
+
+def get_docker_backend(base_url: Optional[str] = None) -> Any:
+    """
+    Get process-wide Docker backend
+
+    Prefers the Engine API (docker SDK + reachable socket) and falls back
+    to the docker CLI. The fallback is only cached for
+    FALLBACK_RETRY_SECONDS, so a socket that was not ready at start-up
+    does not disable the Engine API for the life of the process.
+
+    Args:
+        base_url: Docker socket URL (if None, reads system.docker_socket from secrets)
+
+    Returns:
+        DockerEngine or DockerCLI
+    """
+    global _backend, _backend_fallback_until
+    with _backend_lock:
+        if _backend is None or (_backend.name == 'cli' and time.monotonic() >= _backend_fallback_until):
+            if base_url is None:
+                try:
+                    import streamlit as st
+                    base_url = st.secrets.get("system", {}).get("docker_socket")
+                except Exception:
+                    base_url = None
+
+            try:
+                engine = DockerEngine(base_url or DEFAULT_SOCKET)
+                if not engine.ping():
+                    raise DockerBackendError(f"Docker daemon not reachable at {engine.base_url}")
+                _backend = engine
+            except DockerBackendError as e:
+                if _backend is None:
+                    logger.info(f"Using docker CLI backend: {e}")
+                    _backend = DockerCLI()
+                _backend_fallback_until = time.monotonic() + FALLBACK_RETRY_SECONDS
+        return _backend
@@ -0,0 +1,330 @@
+"""
+Docker Event Cache
+Live Container State maintained from the Docker Events Stream
+"""
+
+import time
+import threading
+import logging
+from typing import Any, Dict, Optional
+
+from .docker_engine import ContainerInfo, get_docker_backend
+from .docker_inventory import ContainerInventory
+
+logger = logging.getLogger(__name__)
+
+# Event attributes that are not container labels
+EVENT_META_ATTRIBUTES = ('name', 'image', 'exitCode', 'signal')
+
+
+class ContainerStateCache:
+    """
+    Container state kept current by a background events subscriber
+
+    On (re)connect the subscriber opens the events stream (replaying the
+    last second) and then does one full listing, so no transition between
+    the two is lost.
+    After that start/die/pause/health_status/... events are applied
+    incrementally and every change bumps ``version``; readers get an
+    indexed ContainerInventory without talking to the daemon.
+
+    If the stream drops, ``live`` turns False (callers fall back to
+    polling) until the subscriber has reconnected and resynced.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[Any] = None,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 30.0
+    ):
+        """
+        Initialize cache (call start() to subscribe)
+
+        Args:
+            backend: DockerEngine or DockerCLI (default: the shared backend,
+                looked up again on every reconnect)
+            reconnect_delay: First wait before reconnecting after a stream error
+            max_reconnect_delay: Upper bound of the exponential reconnect backoff
+        """
+        self._fixed_backend = backend
+        self.backend = backend or get_docker_backend()
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+
+        self._containers: Dict[str, ContainerInfo] = {}
+        self._inventory: Optional[ContainerInventory] = None
+        self._version = 0
+        self._live = False
+        self._changed = threading.Condition()
+
+        self._stream: Optional[Any] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.events = 0
+        self.applied = 0
+        self.resyncs = 0
+        self.last_event_at: Optional[float] = None
+        self.last_error: Optional[str] = None
+
+    # ═══════════════════════════════════════════════════════════
+    # PUBLIC API
+    # ═══════════════════════════════════════════════════════════
+
+    @property
+    def version(self) -> int:
+        """Incremented on every applied state change"""
+        with self._changed:
+            return self._version
+
+    @property
+    def live(self) -> bool:
+        """True while the events stream is connected and the state is synced"""
+        with self._changed:
+            return self._live
+
+    def start(self) -> None:
+        """Start the subscriber thread"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='docker-events', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the subscriber and close the stream"""
+        self._stop.set()
+        stream = self._stream
+        if stream is not None:
+            self._close(stream)
+
+    def inventory(self) -> ContainerInventory:
+        """
+        Get the current state as ContainerInventory
+
+        The inventory is built once per version, so repeated reads between
+        changes return the same object.
+
+        Returns:
+            ContainerInventory (version set)
+        """
+        with self._changed:
+            if self._inventory is None or self._inventory.version != self._version:
+                self._inventory = ContainerInventory(
+                    list(self._containers.values()),
+                    version=self._version
+                )
+            return self._inventory
+
+    def wait_for_change(self, version: int, timeout: Optional[float] = None) -> int:
+        """
+        Block until the state version differs from ``version``
+
+        Args:
+            version: Version the caller has already rendered
+            timeout: Maximum wait in seconds
+
+        Returns:
+            Current version (equal to ``version`` on timeout)
+        """
+        with self._changed:
+            self._changed.wait_for(lambda: self._version != version, timeout=timeout)
+            return self._version
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get subscriber statistics
+
+        Returns:
+            Dict with version, live flag, container count, event counters,
+            resyncs and the last stream error
+        """
+        with self._changed:
+            return {
+                'backend': self.backend.name,
+                'version': self._version,
+                'live': self._live,
+                'containers': len(self._containers),
+                'events': self.events,
+                'applied': self.applied,
+                'resyncs': self.resyncs,
+                'last_event_at': self.last_event_at,
+                'last_error': self.last_error
+            }
+
+    # ═══════════════════════════════════════════════════════════
+    # SUBSCRIBER
+    # ═══════════════════════════════════════════════════════════
+
+    def _run(self) -> None:
+        delay = self.reconnect_delay
+
+        while not self._stop.is_set():
+            stream = None
+            try:
+                if self._fixed_backend is None:
+                    self.backend = get_docker_backend()
+                # Replay the last second: `docker events` may subscribe only
+                # after the listing below (duplicates are harmless in _apply)
+                stream = self.backend.events(since=time.time() - 1)
+                self._stream = stream
+                self._resync()
+                delay = self.reconnect_delay
+
+                for event in stream:
+                    if self._stop.is_set():
+                        break
+                    self._apply(event)
+
+                if not self._stop.is_set():
+                    self.last_error = 'Event stream ended'
+            except Exception as e:
+                if not self._stop.is_set():
+                    if str(e) != self.last_error:
+                        logger.warning(f"Docker event stream lost: {e}")
+                    self.last_error = str(e)
+            finally:
+                with self._changed:
+                    self._live = False
+                self._stream = None
+                if stream is not None:
+                    self._close(stream)
+
+            if self._stop.wait(delay):
+                break
+            delay = min(delay * 2, self.max_reconnect_delay)
+
+    def _resync(self) -> None:
+        """Replace the state with a full listing"""
+        containers = {c.id: c for c in self.backend.containers(all=True)}
+
+        with self._changed:
+            self.resyncs += 1
+            if _fingerprint(containers) != _fingerprint(self._containers):
+                self._containers = containers
+                self._bump()
+            else:
+                self._containers = containers
+            self._live = True
+
+    def _apply(self, event: Dict[str, Any]) -> None:
+        """Apply one container event to the state"""
+        if event.get('Type', 'container') != 'container':
+            return
+
+        actor = event.get('Actor') or {}
+        container_id = event.get('id') or actor.get('ID')
+        action = event.get('Action') or event.get('status') or ''
+        attributes = actor.get('Attributes') or {}
+
+        with self._changed:
+            self.events += 1
+            self.last_event_at = time.time()
+
+            current = self._containers.get(container_id)
+            if current is None and action != 'destroy':
+                current = _from_attributes(container_id, attributes)
+
+            if action == 'destroy':
+                if self._containers.pop(container_id, None) is None:
+                    return
+            elif action == 'create':
+                self._containers[container_id] = current
+            elif action in ('start', 'unpause'):
+                self._containers[container_id] = _replace(
+                    current,
+                    state='running',
+                    status='Up',
+                    health=current.health if action == 'unpause' else None
+                )
+            elif action == 'die':
+                self._containers[container_id] = _replace(
+                    current,
+                    state='exited',
+                    status=f"Exited ({attributes.get('exitCode', '?')})",
+                    health=None
+                )
+            elif action == 'pause':
+                self._containers[container_id] = _replace(current, state='paused', status='Up (Paused)')
+            elif action.startswith('health_status'):
+                self._containers[container_id] = _replace(
+                    current,
+                    health=action.partition(':')[2].strip() or None
+                )
+            elif action == 'rename' and attributes.get('name'):
+                self._containers[container_id] = _replace(current, name=attributes['name'])
+            else:
+                # kill, stop, exec_*, attach, ... (die carries the state change)
+                return
+
+            self.applied += 1
+            self._bump()
+
+    def _bump(self) -> None:
+        """New version (lock must be held)"""
+        self._version += 1
+        self._changed.notify_all()
+
+    @staticmethod
+    def _close(stream: Any) -> None:
+        try:
+            stream.close()
+        except Exception:
+            pass
+
+
+def _from_attributes(container_id: str, attributes: Dict[str, str]) -> ContainerInfo:
+    """ContainerInfo for a container first seen in an event"""
+    return ContainerInfo(
+        id=container_id,
+        name=attributes.get('name', container_id[:12]),
+        image=attributes.get('image', ''),
+        state='created',
+        status='Created',
+        labels={k: v for k, v in attributes.items() if k not in EVENT_META_ATTRIBUTES}
+    )
+
+
+def _replace(container: ContainerInfo, **changes: Any) -> ContainerInfo:
+    """Copy with changed fields (inventories already handed out stay unchanged)"""
+    fields = {name: getattr(container, name) for name in ContainerInfo.__slots__}
+    fields.update(changes)
+    return ContainerInfo(**fields)
+
+
+def _fingerprint(containers: Dict[str, ContainerInfo]) -> set:
+    return {(c.id, c.name, c.state, c.health) for c in containers.values()}
+
+
+# ═══════════════════════════════════════════════════════════
+# SHARED CACHE
+# ═══════════════════════════════════════════════════════════
+
+_cache: Optional[ContainerStateCache] = None
+_cache_disabled = False
+_cache_lock = threading.Lock()
+
+
+def get_container_state_cache() -> Optional[ContainerStateCache]:
+    """
+    Get process-wide container state cache (subscriber started on first use)
+
+    Disabled with ``docker_events = false`` in the [system] secrets section.
+
+    Returns:
+        ContainerStateCache, or None if disabled
+    """
+    global _cache, _cache_disabled
+    with _cache_lock:
+        if _cache is None and not _cache_disabled:
+            try:
+                import streamlit as st
+                _cache_disabled = not st.secrets.get("system", {}).get("docker_events", True)
+            except Exception:
+                pass
+
+            if not _cache_disabled:
+                _cache = ContainerStateCache()
+                _cache.start()
+        return _cache
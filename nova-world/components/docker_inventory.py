@@ -0,0 +1,180 @@
+"""
+Docker Container Inventory
+One consistent Snapshot of all Containers, indexed by State, Compose Project and Health
+"""
+
+import time
+import threading
+import logging
+from typing import Any, Dict, List, Optional
+
+from .docker_engine import ContainerInfo, get_docker_backend
+from .single_flight import get_single_flight
+
+logger = logging.getLogger(__name__)
+
+# States counted as "stopped" (paused / restarting / removing are neither)
+STOPPED_STATES = ('exited', 'dead', 'created')
+
+
+class ContainerInventory:
+    """
+    Indexed in-memory model of one `docker ps -a` snapshot
+
+    All counts and lists derive from the same fetch, so running + stopped
+    + other always equals total.
+    """
+
+    def __init__(
+        self,
+        containers: List[ContainerInfo],
+        fetched_at: Optional[float] = None,
+        version: Optional[int] = None
+    ):
+        """
+        Build indexes
+
+        Args:
+            containers: Containers of one listing
+            fetched_at: Unix time of the listing (default: now)
+            version: State version of the event cache the snapshot came from
+                (None for polled listings)
+        """
+        self.containers = sorted(containers, key=lambda c: c.name)
+        self.fetched_at = fetched_at if fetched_at is not None else time.time()
+        self.version = version
+
+        self.by_name: Dict[str, ContainerInfo] = {}
+        self.by_state: Dict[str, List[ContainerInfo]] = {}
+        self.by_project: Dict[Optional[str], List[ContainerInfo]] = {}
+        self.by_health: Dict[Optional[str], List[ContainerInfo]] = {}
+
+        for container in self.containers:
+            self.by_name[container.name] = container
+            self.by_state.setdefault(container.state, []).append(container)
+            self.by_project.setdefault(container.compose_project, []).append(container)
+            self.by_health.setdefault(container.health, []).append(container)
+
+    def __len__(self) -> int:
+        return len(self.containers)
+
+    @property
+    def running(self) -> List[ContainerInfo]:
+        return self.by_state.get('running', [])
+
+    @property
+    def stopped(self) -> List[ContainerInfo]:
+        return [c for state in STOPPED_STATES for c in self.by_state.get(state, [])]
+
+    @property
+    def unhealthy(self) -> List[ContainerInfo]:
+        return self.by_health.get('unhealthy', [])
+
+    def get(self, name: str) -> Optional[ContainerInfo]:
+        """Container by name"""
+        return self.by_name.get(name)
+
+    def project(self, name: Optional[str]) -> List[ContainerInfo]:
+        """Containers of a compose project (None: containers outside compose)"""
+        return self.by_project.get(name, [])
+
+    def state_counts(self) -> Dict[str, int]:
+        return {state: len(containers) for state, containers in self.by_state.items()}
+
+    def health_counts(self) -> Dict[str, int]:
+        """Counts per health status (containers without healthcheck under 'none')"""
+        return {health or 'none': len(containers) for health, containers in self.by_health.items()}
+
+    def project_counts(self) -> Dict[str, Dict[str, int]]:
+        """Running / total per compose project ('-' for containers outside compose)"""
+        return {
+            project or '-': {
+                'running': sum(1 for c in containers if c.is_running),
+                'total': len(containers)
+            }
+            for project, containers in self.by_project.items()
+        }
+
+    def to_status(self) -> Dict[str, Any]:
+        """
+        Status dict as used by the pages (docker_status_check)
+
+        Returns:
+            Dict with running/stopped/total counts, container name lists
+            and the state, health and compose project breakdowns
+        """
+        running = self.running
+        stopped = self.stopped
+        return {
+            'running': len(running),
+            'stopped': len(stopped),
+            'total': len(self.containers),
+            'containers': {
+                'running': [c.name for c in running],
+                'stopped': [c.name for c in stopped],
+                'unhealthy': [c.name for c in self.unhealthy]
+            },
+            'states': self.state_counts(),
+            'health': self.health_counts(),
+            'projects': self.project_counts(),
+            'fetched_at': self.fetched_at,
+            'version': self.version
+        }
+
+
+# ═══════════════════════════════════════════════════════════
+# SHARED SNAPSHOT
+# ═══════════════════════════════════════════════════════════
+
+_inventory: Optional[ContainerInventory] = None
+_inventory_lock = threading.Lock()
+
+
+def load_container_inventory(max_age: float = 2.0) -> ContainerInventory:
+    """
+    Get a container inventory, fetching at most once per ``max_age``
+
+    While the event-fed ContainerStateCache is live its current state is
+    returned without any daemon call. Otherwise pages share one polled
+    snapshot within ``max_age``, and concurrent misses share one daemon
+    call (docker single-flight group).
+
+    Args:
+        max_age: Seconds a snapshot may be reused (0 forces a fetch)
+
+    Returns:
+        ContainerInventory
+
+    Raises:
+        DockerBackendError: If the listing fails
+    """
+    from .docker_events import get_container_state_cache
+
+    state_cache = get_container_state_cache()
+    if state_cache is not None and state_cache.live:
+        return state_cache.inventory()
+
+    global _inventory
+    with _inventory_lock:
+        cached = _inventory
+    if cached is not None and time.time() - cached.fetched_at < max_age:
+        return cached
+
+    backend = get_docker_backend()
+
+    def _fetch() -> ContainerInventory:
+        return ContainerInventory(backend.containers(all=True))
+
+    inventory = get_single_flight('docker').do(('inventory', backend.name), _fetch)
+
+    with _inventory_lock:
+        if _inventory is None or inventory.fetched_at >= _inventory.fetched_at:
+            _inventory = inventory
+    return inventory
+
+
+def invalidate_container_inventory() -> None:
+    """Drop the shared snapshot (after start/stop/restart)"""
+    global _inventory
+    with _inventory_lock:
+        _inventory = None
@@ -0,0 +1,219 @@
+"""
+Docker Lifecycle Executor
+Parallel start/stop/restart of Containers with per-Container Timeouts
+"""
+
+import time
+import threading
+import logging
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from .docker_engine import DockerBackendError, get_docker_backend
+
+logger = logging.getLogger(__name__)
+
+ACTIONS = ('start', 'stop', 'restart')
+
+DEFAULT_MAX_WORKERS = 16  # = DockerEngine connection pool size
+DEFAULT_STOP_TIMEOUT = 10
+
+# Slack on top of the stop grace period before a container counts as timed out
+OPERATION_SLACK = 30
+
+
+class LifecycleResult:
+    """Outcome of one container operation"""
+
+    __slots__ = ('container', 'action', 'success', 'error', 'timed_out', 'duration')
+
+    def __init__(
+        self,
+        container: str,
+        action: str,
+        success: bool,
+        error: Optional[str] = None,
+        timed_out: bool = False,
+        duration: float = 0.0
+    ):
+        self.container = container
+        self.action = action
+        self.success = success
+        self.error = error
+        self.timed_out = timed_out
+        self.duration = duration
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'container': self.container,
+            'action': self.action,
+            'success': self.success,
+            'error': self.error,
+            'timed_out': self.timed_out,
+            'duration_seconds': self.duration
+        }
+
+
+class LifecycleExecutor:
+    """
+    Run one lifecycle action on many containers concurrently
+
+    Every container is its own call (no shared batch timeout): up to
+    ``max_workers`` run at once, each gets its own deadline, and results
+    are yielded as they complete. Stopping a stack therefore takes about
+    as long as its slowest container instead of the sum of all of them.
+
+        for result in executor.run('stop', ['db', 'web', 'worker']):
+            print(result.container, result.success)
+    """
+
+    def __init__(
+        self,
+        backend: Any,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        stop_timeout: int = DEFAULT_STOP_TIMEOUT,
+        operation_timeout: Optional[float] = None
+    ):
+        """
+        Initialize executor
+
+        Args:
+            backend: DockerEngine or DockerCLI
+            max_workers: Containers operated on at once
+            stop_timeout: Grace period before SIGKILL on stop/restart
+            operation_timeout: Deadline per container in seconds
+                (default: stop_timeout + 30 s)
+        """
+        self.backend = backend
+        self.max_workers = max(1, max_workers)
+        self.stop_timeout = stop_timeout
+        self.operation_timeout = operation_timeout or stop_timeout + OPERATION_SLACK
+
+    def run(self, action: str, containers: Iterable[str]) -> Iterator[LifecycleResult]:
+        """
+        Apply ``action`` to every container, yielding results as they complete
+
+        A container that exceeds the deadline is reported as timed out and
+        its worker is abandoned; the remaining containers are not held up.
+
+        Args:
+            action: "start", "stop" or "restart"
+            containers: Container names or IDs
+
+        Yields:
+            LifecycleResult per container (completion order)
+        """
+        if action not in ACTIONS:
+            raise ValueError(f"Unknown action: {action}")
+
+        containers = list(containers)
+        if not containers:
+            return
+
+        started_at: Dict[str, float] = {}
+        started_lock = threading.Lock()
+
+        def operate(container: str) -> float:
+            begin = time.monotonic()
+            with started_lock:
+                started_at[container] = begin
+            if action == 'start':
+                self.backend.start(container)
+            else:
+                getattr(self.backend, action)(container, timeout=self.stop_timeout)
+            return time.monotonic() - begin
+
+        pool = ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(containers)),
+            thread_name_prefix=f'docker-{action}'
+        )
+        pending: Dict[Future, str] = {pool.submit(operate, c): c for c in containers}
+
+        try:
+            while pending:
+                now = time.monotonic()
+
+                # Deadlines only run from the moment a worker picked the container up
+                with started_lock:
+                    deadlines = {
+                        future: started_at[container] + self.operation_timeout
+                        for future, container in pending.items() if container in started_at
+                    }
+
+                for future, deadline in deadlines.items():
+                    if deadline <= now and not future.done():
+                        container = pending.pop(future)
+                        yield LifecycleResult(
+                            container, action, False,
+                            error=f"Timeout after {self.operation_timeout:.0f}s",
+                            timed_out=True,
+                            duration=now - started_at[container]
+                        )
+
+                if not pending:
+                    break
+
+                next_deadline = min(
+                    (d for f, d in deadlines.items() if f in pending),
+                    default=None
+                )
+                # Poll at least once a second so newly started containers get a deadline
+                timeout = 1.0 if next_deadline is None else max(0.0, min(1.0, next_deadline - now))
+                done, _ = wait(list(pending), timeout=timeout, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    container = pending.pop(future)
+                    try:
+                        yield LifecycleResult(container, action, True, duration=future.result())
+                    except DockerBackendError as e:
+                        yield LifecycleResult(
+                            container, action, False,
+                            error=str(e),
+                            duration=time.monotonic() - started_at.get(container, now)
+                        )
+        finally:
+            for future in pending:
+                future.cancel()
+            pool.shutdown(wait=False)
+
+    def run_all(self, action: str, containers: Iterable[str]) -> Dict[str, Any]:
+        """
+        Apply ``action`` to every container and summarize
+
+        Returns:
+            Dict with success, succeeded and failed container lists,
+            errors by container, per-container results and wall_seconds
+        """
+        started = time.monotonic()
+        results = list(self.run(action, containers))
+
+        return {
+            'success': all(r.success for r in results),
+            'succeeded': [r.container for r in results if r.success],
+            'failed': {r.container: r.error for r in results if not r.success},
+            'results': [r.to_dict() for r in results],
+            'wall_seconds': time.monotonic() - started
+        }
+
+
+def get_lifecycle_executor() -> LifecycleExecutor:
+    """
+    Get lifecycle executor for the shared Docker backend
+
+    Worker cap and stop grace period come from system.docker_max_workers
+    and system.docker_stop_timeout.
+
+    Returns:
+        LifecycleExecutor
+    """
+    max_workers = DEFAULT_MAX_WORKERS
+    stop_timeout = DEFAULT_STOP_TIMEOUT
+    try:
+        import streamlit as st
+        system = st.secrets.get("system", {})
+        max_workers = int(system.get("docker_max_workers", DEFAULT_MAX_WORKERS))
+        stop_timeout = int(system.get("docker_stop_timeout", DEFAULT_STOP_TIMEOUT))
+    except Exception:
+        pass
+
+    return LifecycleExecutor(get_docker_backend(), max_workers=max_workers, stop_timeout=stop_timeout)
@@ -0,0 +1,449 @@
+"""
+Docker Startup Planner
+Dependency-ordered parallel Cold Start from Compose depends_on and Container Labels
+"""
+
+import time
+import logging
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+import yaml
+
+from .docker_engine import ContainerInfo, DockerBackendError, get_docker_backend
+from .docker_events import get_container_state_cache
+from .docker_lifecycle import LifecycleExecutor, get_lifecycle_executor
+
+logger = logging.getLogger(__name__)
+
+# Rendered by infrastructure/roles/docker_services (docker_base_path)
+DEFAULT_COMPOSE_FILE = '/opt/docker/docker-compose.yml'
+
+# Set by docker compose v2 on every container: "db:service_healthy:false,cache:service_started:false"
+COMPOSE_DEPENDS_ON_LABEL = 'com.docker.compose.depends_on'
+# Same format, for containers outside compose
+NOVA_DEPENDS_ON_LABEL = 'nova.depends_on'
+
+CONDITION_STARTED = 'service_started'
+CONDITION_HEALTHY = 'service_healthy'
+CONDITION_COMPLETED = 'service_completed_successfully'
+
+DEFAULT_HEALTH_TIMEOUT = 180
+
+
+def parse_depends_on(value: Any) -> Dict[str, str]:
+    """
+    Normalize a depends_on declaration to {service: condition}
+
+    Accepts the compose list form (["db"]), the long form
+    ({"db": {"condition": "service_healthy"}}) and the label form
+    ("db:service_healthy:false,cache").
+    """
+    if not value:
+        return {}
+
+    if isinstance(value, str):
+        depends_on = {}
+        for item in value.split(','):
+            parts = item.strip().split(':')
+            if parts[0]:
+                depends_on[parts[0]] = parts[1] if len(parts) > 1 and parts[1] else CONDITION_STARTED
+        return depends_on
+
+    if isinstance(value, dict):
+        return {
+            service: (spec or {}).get('condition', CONDITION_STARTED)
+            for service, spec in value.items()
+        }
+
+    return {service: CONDITION_STARTED for service in value}
+
+
+def load_compose_services(path: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Read the services section of the rendered compose file
+
+    Args:
+        path: docker-compose.yml (if None, reads system.compose_file from
+            secrets, default /opt/docker/docker-compose.yml)
+
+    Returns:
+        Services by name (empty if the file is missing or unreadable)
+    """
+    if path is None:
+        try:
+            import streamlit as st
+            path = st.secrets.get("system", {}).get("compose_file")
+        except Exception:
+            path = None
+
+    try:
+        with open(path or DEFAULT_COMPOSE_FILE) as f:
+            data = yaml.safe_load(f) or {}
+    except (OSError, yaml.YAMLError) as e:
+        logger.debug(f"Compose file not used: {e}")
+        return {}
+
+    return data.get('services') or {}
+
+
+class ServiceNode:
+    """
+    One container in the startup graph
+
+    Nodes are keyed by container name: replicas of a scaled service and
+    equally named services of different compose projects are separate
+    nodes. ``depends_on`` maps container names to conditions.
+    """
+
+    __slots__ = ('service', 'project', 'container', 'running', 'depends_on', 'level')
+
+    def __init__(self, service: str, project: Optional[str], container: str, running: bool):
+        self.service = service
+        self.project = project
+        self.container = container
+        self.running = running
+        self.depends_on: Dict[str, str] = {}
+        self.level = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'service': self.service,
+            'project': self.project,
+            'container': self.container,
+            'running': self.running,
+            'depends_on': dict(self.depends_on),
+            'level': self.level
+        }
+
+
+class StartupPlan:
+    """
+    Containers grouped into dependency levels
+
+    Level 0 has no dependencies; every node of level n only depends on
+    nodes of lower levels, so a level can start in parallel once the
+    conditions of its dependencies hold.
+    """
+
+    def __init__(self, nodes: Dict[str, ServiceNode], levels: List[List[ServiceNode]], warnings: List[str]):
+        """
+        Args:
+            nodes: ServiceNodes by container name
+            levels: Nodes per dependency level
+            warnings: Ignored references and broken cycles
+        """
+        self.nodes = nodes
+        self.levels = levels
+        self.warnings = warnings
+
+    @property
+    def needs_health(self) -> Set[str]:
+        """Containers some dependant waits on to become healthy"""
+        return {
+            container
+            for node in self.nodes.values()
+            for container, condition in node.depends_on.items()
+            if condition == CONDITION_HEALTHY
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'levels': [[node.container for node in level] for level in self.levels],
+            'nodes': {container: node.to_dict() for container, node in self.nodes.items()},
+            'needs_health': sorted(self.needs_health),
+            'warnings': list(self.warnings)
+        }
+
+
+def build_startup_plan(
+    containers: Iterable[ContainerInfo],
+    compose_services: Optional[Dict[str, Dict[str, Any]]] = None
+) -> StartupPlan:
+    """
+    Build the dependency graph and its levels
+
+    Dependencies are merged from the compose file, the compose
+    depends_on label and the nova.depends_on label. A reference names a
+    service (all its replicas, preferring the dependant's own compose
+    project) or a container; unknown ones are dropped with a warning,
+    and a cycle is broken by putting its members into one last level.
+
+    Args:
+        containers: Containers to plan (usually the whole inventory)
+        compose_services: Services section of the compose file
+
+    Returns:
+        StartupPlan
+    """
+    compose_services = compose_services or {}
+    warnings: List[str] = []
+
+    nodes: Dict[str, ServiceNode] = {}
+    by_service: Dict[str, List[ServiceNode]] = {}
+    for container in containers:
+        node = ServiceNode(
+            container.compose_service or container.name,
+            container.compose_project,
+            container.name,
+            container.is_running
+        )
+        node.depends_on.update(parse_depends_on(container.labels.get(COMPOSE_DEPENDS_ON_LABEL)))
+        node.depends_on.update(parse_depends_on(container.labels.get(NOVA_DEPENDS_ON_LABEL)))
+        nodes[node.container] = node
+        by_service.setdefault(node.service, []).append(node)
+
+    for service, spec in compose_services.items():
+        spec = spec or {}
+        targets = [nodes[spec['container_name']]] if spec.get('container_name') in nodes else by_service.get(service, [])
+        for node in targets:
+            node.depends_on.update(parse_depends_on(spec.get('depends_on')))
+
+    # Resolve references to containers (service replicas first, then container name)
+    for node in nodes.values():
+        resolved = {}
+        for reference, condition in node.depends_on.items():
+            targets = by_service.get(reference, [])
+            same_project = [t for t in targets if t.project == node.project]
+            targets = same_project or targets
+            if not targets and reference in nodes:
+                targets = [nodes[reference]]
+            if not targets:
+                warnings.append(f"{node.container}: unknown dependency '{reference}' ignored")
+            for target in targets:
+                if target is not node:
+                    resolved[target.container] = condition
+        node.depends_on = resolved
+
+    # Kahn's algorithm, one level per round
+    remaining = {name: set(node.depends_on) for name, node in nodes.items()}
+    levels: List[List[ServiceNode]] = []
+    while remaining:
+        ready = sorted(name for name, deps in remaining.items() if not deps)
+        if not ready:
+            cycle = sorted(remaining)
+            warnings.append(f"Dependency cycle between {', '.join(cycle)}; started together")
+            ready = cycle
+        for name in ready:
+            nodes[name].level = len(levels)
+            del remaining[name]
+        for deps in remaining.values():
+            deps.difference_update(ready)
+        levels.append([nodes[name] for name in ready])
+
+    return StartupPlan(nodes, levels, warnings)
+
+
+# ═══════════════════════════════════════════════════════════
+# EXECUTION
+# ═══════════════════════════════════════════════════════════
+
+def _condition_state(backend: Any, node: ServiceNode, condition: str) -> Tuple[Optional[bool], str]:
+    """
+    Check one dependency condition
+
+    Returns:
+        (True: met, False: cannot be met any more, None: not yet), detail
+    """
+    try:
+        state = backend.inspect_state(node.container)
+    except DockerBackendError as e:
+        return False, str(e)
+
+    status, health = state['status'], state['health']
+
+    if condition == CONDITION_COMPLETED:
+        if status == 'exited':
+            return (True, 'completed') if state['exit_code'] == 0 else (False, f"exit code {state['exit_code']}")
+        return None, status
+
+    if status != 'running':
+        return (False, status) if status in ('exited', 'dead') else (None, status)
+    if condition != CONDITION_HEALTHY or health is None or health == 'healthy':
+        # No healthcheck: running is as good as it gets
+        return True, health or 'running'
+    if health == 'unhealthy':
+        return False, 'unhealthy'
+    return None, health
+
+
+def _wait_for_conditions(
+    backend: Any,
+    plan: StartupPlan,
+    conditions: Set[Tuple[str, str]],
+    timeout: float
+) -> Dict[str, str]:
+    """
+    Wait until all (container, condition) pairs hold
+
+    Wakes on container events when the state cache is live, else polls
+    once a second.
+
+    Returns:
+        Errors by container for conditions that failed or timed out
+    """
+    deadline = time.monotonic() + timeout
+    pending = set(conditions)
+    errors: Dict[str, str] = {}
+    state_cache = get_container_state_cache()
+
+    while pending:
+        version = state_cache.version if state_cache is not None else None
+
+        for name, condition in list(pending):
+            met, detail = _condition_state(backend, plan.nodes[name], condition)
+            if met is not None:
+                pending.discard((name, condition))
+                if not met:
+                    errors[name] = detail
+
+        remaining = deadline - time.monotonic()
+        if not pending:
+            break
+        if remaining <= 0:
+            for name, condition in pending:
+                errors[name] = f"{condition} not reached within {timeout:.0f}s"
+            break
+
+        if state_cache is not None and state_cache.live:
+            state_cache.wait_for_change(version, timeout=min(1.0, remaining))
+        else:
+            time.sleep(min(1.0, remaining))
+
+    return errors
+
+
+def execute_startup_plan(
+    plan: StartupPlan,
+    executor: Optional[LifecycleExecutor] = None,
+    health_timeout: float = DEFAULT_HEALTH_TIMEOUT,
+    on_step: Optional[Callable[[Dict[str, Any]], None]] = None
+) -> Dict[str, Any]:
+    """
+    Start the stopped containers of a plan level by level
+
+    Before a level starts, only the conditions its members declare are
+    awaited (healthchecks just where service_healthy is required); the
+    level's containers then start in parallel. Dependants of a failed
+    container are not started.
+
+    Args:
+        plan: StartupPlan
+        executor: LifecycleExecutor (default: shared backend and settings)
+        health_timeout: Maximum wait for the conditions of one level
+        on_step: Called with each event dict (level, container, service, event, detail)
+
+    Returns:
+        Dict with success, started, failed, blocked (by container name),
+        per-level timings and wall_seconds
+    """
+    executor = executor or get_lifecycle_executor()
+    started_at = time.monotonic()
+    started: List[str] = []
+    failed: Dict[str, str] = {}
+    blocked: Dict[str, str] = {}
+    levels = []
+
+    def step(level: int, container: str, event: str, detail: str = '') -> None:
+        if on_step is not None:
+            on_step({
+                'level': level,
+                'container': container,
+                'service': plan.nodes[container].service,
+                'event': event,
+                'detail': detail
+            })
+
+    for index, level in enumerate(plan.levels):
+        level_started = time.monotonic()
+
+        # Dependants of anything that failed are skipped without waiting
+        runnable = []
+        for node in level:
+            broken = [dep for dep in node.depends_on if dep in failed or dep in blocked]
+            if broken:
+                blocked[node.container] = f"dependency failed: {', '.join(broken)}"
+                step(index, node.container, 'blocked', blocked[node.container])
+            else:
+                runnable.append(node)
+
+        conditions = {
+            (dep, condition)
+            for node in runnable
+            for dep, condition in node.depends_on.items()
+            if plan.nodes[dep].level < index
+        }
+        waits = [dep for dep, condition in conditions if condition != CONDITION_STARTED]
+        if conditions:
+            for dep in sorted(set(waits)):
+                step(index, dep, 'waiting')
+            errors = _wait_for_conditions(executor.backend, plan, conditions, health_timeout)
+            for dep in sorted(set(waits) - set(errors)):
+                step(index, dep, 'ready')
+            for dep, error in errors.items():
+                failed.setdefault(dep, error)
+                step(index, dep, 'failed', error)
+            if errors:
+                still_runnable = []
+                for node in runnable:
+                    broken = [dep for dep in node.depends_on if dep in errors]
+                    if broken:
+                        blocked[node.container] = f"dependency failed: {', '.join(broken)}"
+                        step(index, node.container, 'blocked', blocked[node.container])
+                    else:
+                        still_runnable.append(node)
+                runnable = still_runnable
+
+        by_container = {node.container: node for node in runnable if not node.running}
+        for result in executor.run('start', list(by_container)):
+            node = by_container[result.container]
+            if result.success:
+                started.append(node.container)
+                step(index, node.container, 'started')
+            else:
+                failed[node.container] = result.error
+                step(index, node.container, 'failed', result.error)
+
+        levels.append({
+            'level': index,
+            'containers': [node.container for node in level],
+            'started': [name for name in by_container if name in started],
+            'seconds': time.monotonic() - level_started
+        })
+
+    return {
+        'success': not failed and not blocked,
+        'started': started,
+        'failed': failed,
+        'blocked': blocked,
+        'levels': levels,
+        'wall_seconds': time.monotonic() - started_at
+    }
+
+
+def start_in_dependency_order(
+    compose_file: Optional[str] = None,
+    health_timeout: float = DEFAULT_HEALTH_TIMEOUT,
+    on_step: Optional[Callable[[Dict[str, Any]], None]] = None
+) -> Dict[str, Any]:
+    """
+    Plan and run a cold start of all containers
+
+    Args:
+        compose_file: Compose file with depends_on (default: system.compose_file)
+        health_timeout: Maximum wait for the conditions of one level
+        on_step: Progress callback (see execute_startup_plan)
+
+    Returns:
+        execute_startup_plan result plus 'plan' (StartupPlan.to_dict())
+
+    Raises:
+        DockerBackendError: If the containers cannot be listed
+    """
+    containers = get_docker_backend().containers(all=True)
+    plan = build_startup_plan(containers, load_compose_services(compose_file))
+    for warning in plan.warnings:
+        logger.warning(f"Startup plan: {warning}")
+
+    result = execute_startup_plan(plan, health_timeout=health_timeout, on_step=on_step)
+    result['plan'] = plan.to_dict()
+    return result
@@ -10,13 +10,21 @@ CHANGES:
 """
 
 import streamlit as st
-import subprocess
 import requests
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any
 from datetime import datetime
 import psutil
+import time
 from components.secrets_manager import get_secrets_manager
 from components.semaphore_api import SemaphoreAPI, SemaphoreAPIError, create_semaphore_client
+from components.semaphore_templates import get_template_index
+from components.deploy_scheduler import PRIORITY_NORMAL, get_deploy_scheduler
+from components.single_flight import get_single_flight
+from components.docker_engine import ContainerInfo, DockerBackendError, get_docker_backend
+from components.docker_inventory import invalidate_container_inventory, load_container_inventory
+from components.docker_events import get_container_state_cache
+from components.docker_lifecycle import get_lifecycle_executor
+from components.docker_startup import start_in_dependency_order
 
 class QuickActions:
     """Vordefinierte Actions für häufige Tasks"""
@@ -44,17 +52,30 @@ class QuickActions:
     def deploy_full(self) -> Dict[str, Any]:
         return self._execute_semaphore_deploy("Deploy Full Profile")
 
-    def _execute_semaphore_deploy(self, template_name: str) -> Dict[str, Any]:
+    def _execute_semaphore_deploy(self, template_name: str, priority: int = PRIORITY_NORMAL) -> Dict[str, Any]:
         if not self.semaphore_client:
             return {"success": False, "message": "❌ Semaphore API nicht konfiguriert", "timestamp": datetime.now().isoformat()}
+        template_index = get_template_index(self.semaphore_client)
         try:
-            templates = self.semaphore_client.get_templates(self.semaphore_project_id)
-            template = next((t for t in templates if t['name'] == template_name), None)
+            template = template_index.get(self.semaphore_project_id, template_name)
             if not template:
                 return {"success": False, "message": f"❌ Template '{template_name}' nicht gefunden", "timestamp": datetime.now().isoformat()}
-            task = self.semaphore_client.execute_template(self.semaphore_project_id, template['id'])
-            return {"success": True, "message": f"✅ Deployment gestartet: {template_name}", "task_id": task.get('id'), "timestamp": datetime.now().isoformat()}
+            # Queued per inventory instead of firing straight into Semaphore
+            scheduler = get_deploy_scheduler(self.semaphore_client)
+            request = scheduler.submit(self.semaphore_project_id, template, priority=priority)
+            if request.future.done() and request.future.exception():
+                raise request.future.exception()
+            if request.status == 'queued':
+                position = scheduler.position(request)
+                label = "🔁 Deployment bereits eingereiht" if request.coalesced else "⏳ Deployment eingereiht"
+                message = f"{label}: {template_name} (Position {position})" if position else f"{label}: {template_name}"
+            elif request.coalesced:
+                message = f"🔁 Deployment gestartet (zusammengefasst): {template_name}"
+            else:
+                message = f"✅ Deployment gestartet: {template_name}"
+            return {"success": True, "message": message, "task_id": request.task_id, "status": request.status, "coalesced": request.coalesced > 0, "timestamp": datetime.now().isoformat()}
         except SemaphoreAPIError as e:
+            template_index.invalidate(self.semaphore_project_id)
             return {"success": False, "message": f"❌ Semaphore API Error: {e}", "timestamp": datetime.now().isoformat()}
         except Exception as e:
             return {"success": False, "message": f"❌ Fehler: {e}", "timestamp": datetime.now().isoformat()}
@@ -77,248 +98,217 @@ class QuickActions:
         except Exception as e:
             return {"status": "error", "message": str(e)}
 
-    def docker_start_all(self) -> Dict[str, Any]:
+    # ═══════════════════════════════════════════════════════════
+    # 🐳 DOCKER (Engine API, CLI fallback)
+    # ═══════════════════════════════════════════════════════════
+
+    def docker_containers(self, all: bool = True) -> List[ContainerInfo]:
         """
-        Start all Docker containers
+        List containers as structured objects
+        
+        Several sessions refreshing at once share one daemon query
+        (process-wide 'docker' single-flight group).
         
-        SECURITY FIX: Removed shell=True to prevent shell injection
+        Raises:
+            DockerBackendError: If the daemon or CLI fails
+        """
+        backend = get_docker_backend()
+        return get_single_flight("docker").do(
+            ("containers", backend.name, all),
+            lambda: backend.containers(all=all)
+        )
+
+    def docker_status_check(self) -> Dict[str, Any]:
+        """
+        Docker status overview from one container listing
+        
+        Running, stopped and total come from the same snapshot (see
+        ContainerInventory): the live event cache when connected, else a
+        polled listing shared for a moment between callers.
         """
         try:
-            # Get all container IDs first
-            result_ps = subprocess.run(
-                ["docker", "ps", "-aq"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-                check=False
-            )
-            
-            if result_ps.returncode != 0:
-                return {
-                    "success": False,
-                    "message": "❌ Failed to list containers",
-                    "output": result_ps.stderr,
-                    "timestamp": datetime.now().isoformat()
-                }
-            
-            container_ids = result_ps.stdout.strip().split('\n')
-            container_ids = [cid.strip() for cid in container_ids if cid.strip()]
-            
-            if not container_ids:
-                return {
-                    "success": True,
-                    "message": "ℹ️ No containers to start",
-                    "timestamp": datetime.now().isoformat()
-                }
-            
-            # Start containers without shell=True
-            result = subprocess.run(
-                ["docker", "start"] + container_ids,
-                capture_output=True,
-                text=True,
-                timeout=30,
-                check=False
-            )
-            
-            return {
-                "success": result.returncode == 0,
-                "message": f"✅ Started {len(container_ids)} containers" if result.returncode == 0 else "❌ Failed to start containers",
-                "output": result.stdout,
-                "timestamp": datetime.now().isoformat()
-            }
-        except subprocess.TimeoutExpired:
-            return {
-                "success": False,
-                "message": "❌ Timeout: Docker command took too long",
-                "timestamp": datetime.now().isoformat()
-            }
-        except FileNotFoundError:
-            return {
-                "success": False,
-                "message": "❌ Docker not found. Is Docker installed?",
-                "timestamp": datetime.now().isoformat()
-            }
-        except Exception as e:
-            return {
-                "success": False,
-                "message": f"❌ Error: {str(e)}",
-                "timestamp": datetime.now().isoformat()
-            }
+            inventory = load_container_inventory()
+            status = inventory.to_status()
+        except DockerBackendError as e:
+            return {"success": False, "error": str(e), "message": f"❌ Error: {e}", "timestamp": datetime.now().isoformat()}
+        return {
+            "success": True,
+            **status,
+            "live": inventory.version is not None,
+            "timestamp": datetime.now().isoformat()
+        }
+
+    def docker_wait_for_change(self, version: Optional[int], timeout: float = 30.0) -> bool:
+        """
+        Block until the container state changes
+        
+        Uses the event cache version; without a live event stream this
+        simply waits ``timeout`` seconds.
+        
+        Args:
+            version: "version" of the last docker_status_check result
+            timeout: Maximum wait in seconds
+        
+        Returns:
+            True if the state changed (or is unknown), False on timeout
+        """
+        state_cache = get_container_state_cache()
+        if state_cache is None or not state_cache.live or version is None:
+            time.sleep(timeout)
+            return True
+        return state_cache.wait_for_change(version, timeout=timeout) != version
+
+    def docker_start_all(self, on_result: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """Start all stopped Docker containers (in parallel, see _docker_lifecycle_all)"""
+        return self._docker_lifecycle_all("start", running=False, on_result=on_result)
 
-    def docker_stop_all(self) -> Dict[str, Any]:
+    def docker_stop_all(self, on_result: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """Stop all running Docker containers (in parallel, see _docker_lifecycle_all)"""
+        return self._docker_lifecycle_all("stop", running=True, on_result=on_result)
+
+    def docker_restart_all(self, on_result: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """Restart all running Docker containers (in parallel, see _docker_lifecycle_all)"""
+        return self._docker_lifecycle_all("restart", running=True, on_result=on_result)
+
+    def docker_container_action(self, container: str, action: str) -> Dict[str, Any]:
         """
-        Stop all running Docker containers
+        Start, stop or restart a single container
         
-        SECURITY FIX: Removed shell=True to prevent shell injection
+        Args:
+            container: Container name or ID
+            action: "start", "stop" or "restart"
         """
+        if action not in ("start", "stop", "restart"):
+            return {"success": False, "error": f"Unknown action: {action}", "timestamp": datetime.now().isoformat()}
         try:
-            # Get running container IDs first
-            result_ps = subprocess.run(
-                ["docker", "ps", "-q"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-                check=False
-            )
-            
-            if result_ps.returncode != 0:
-                return {
-                    "success": False,
-                    "message": "❌ Failed to list containers",
-                    "output": result_ps.stderr,
-                    "timestamp": datetime.now().isoformat()
-                }
-            
-            container_ids = result_ps.stdout.strip().split('\n')
-            container_ids = [cid.strip() for cid in container_ids if cid.strip()]
-            
-            if not container_ids:
-                return {
-                    "success": True,
-                    "message": "ℹ️ No running containers to stop",
-                    "timestamp": datetime.now().isoformat()
-                }
-            
-            # Stop containers without shell=True
-            result = subprocess.run(
-                ["docker", "stop"] + container_ids,
-                capture_output=True,
-                text=True,
-                timeout=60,  # Longer timeout for graceful shutdown
-                check=False
+            getattr(get_docker_backend(), action)(container)
+            return {"success": True, "message": f"✅ {container}: {action} ok", "timestamp": datetime.now().isoformat()}
+        except DockerBackendError as e:
+            return {"success": False, "error": str(e), "message": f"❌ {container}: {e}", "timestamp": datetime.now().isoformat()}
+        finally:
+            invalidate_container_inventory()
+
+    def docker_logs(self, container: str, tail: int = 50) -> Dict[str, Any]:
+        """Last log lines of a container (stdout + stderr)"""
+        try:
+            return {"success": True, "output": get_docker_backend().logs(container, tail=tail), "timestamp": datetime.now().isoformat()}
+        except DockerBackendError as e:
+            return {"success": False, "error": str(e), "output": "", "timestamp": datetime.now().isoformat()}
+
+    def docker_cleanup(self) -> Dict[str, Any]:
+        """Clean up Docker system (remove unused containers, images, networks, volumes)"""
+        try:
+            pruned = get_docker_backend().prune()
+        except DockerBackendError as e:
+            return {"success": False, "error": str(e), "message": f"❌ Cleanup failed: {e}", "timestamp": datetime.now().isoformat()}
+        
+        if "output" in pruned:
+            output = pruned["output"]
+        else:
+            output = (
+                f"Container: {pruned['containers']} · Images: {pruned['images']} · "
+                f"Netzwerke: {pruned['networks']} · Volumes: {pruned['volumes']} · "
+                f"Freigegeben: {pruned['space_reclaimed'] / 1024 / 1024:.1f} MB"
             )
-            
-            return {
-                "success": result.returncode == 0,
-                "message": f"✅ Stopped {len(container_ids)} containers" if result.returncode == 0 else "❌ Failed to stop containers",
-                "output": result.stdout,
-                "timestamp": datetime.now().isoformat()
-            }
-        except subprocess.TimeoutExpired:
-            return {
-                "success": False,
-                "message": "❌ Timeout: Docker stop took too long",
-                "timestamp": datetime.now().isoformat()
-            }
-        except FileNotFoundError:
-            return {
-                "success": False,
-                "message": "❌ Docker not found. Is Docker installed?",
-                "timestamp": datetime.now().isoformat()
-            }
-        except Exception as e:
-            return {
-                "success": False,
-                "message": f"❌ Error: {str(e)}",
-                "timestamp": datetime.now().isoformat()
-            }
+        return {"success": True, "message": "✅ Docker cleanup complete", "output": output, "details": pruned, "timestamp": datetime.now().isoformat()}
 
-    def docker_restart_all(self) -> Dict[str, Any]:
+    def _docker_lifecycle_all(
+        self,
+        action: str,
+        running: bool,
+        on_result: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
         """
-        Restart all running Docker containers
+        Apply start/stop/restart to every container in the given state
+        
+        Containers are handled concurrently by the LifecycleExecutor, each
+        with its own timeout, so one slow container neither blocks nor
+        fails the others.
         
-        SECURITY FIX: Removed shell=True to prevent shell injection
+        Args:
+            action: "start", "stop" or "restart"
+            running: Select running (True) or stopped (False) containers
+            on_result: Called in the caller's thread with each container
+                result (container, success, error, done, total) as it completes
         """
         try:
-            # Get running container IDs first
-            result_ps = subprocess.run(
-                ["docker", "ps", "-q"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-                check=False
-            )
-            
-            if result_ps.returncode != 0:
-                return {
-                    "success": False,
-                    "message": "❌ Failed to list containers",
-                    "output": result_ps.stderr,
-                    "timestamp": datetime.now().isoformat()
-                }
-            
-            container_ids = result_ps.stdout.strip().split('\n')
-            container_ids = [cid.strip() for cid in container_ids if cid.strip()]
-            
-            if not container_ids:
-                return {
-                    "success": True,
-                    "message": "ℹ️ No running containers to restart",
-                    "timestamp": datetime.now().isoformat()
-                }
-            
-            # Restart containers without shell=True
-            result = subprocess.run(
-                ["docker", "restart"] + container_ids,
-                capture_output=True,
-                text=True,
-                timeout=90,  # Longer timeout for restart
-                check=False
-            )
-            
-            return {
-                "success": result.returncode == 0,
-                "message": f"✅ Restarted {len(container_ids)} containers" if result.returncode == 0 else "❌ Failed to restart containers",
-                "output": result.stdout,
-                "timestamp": datetime.now().isoformat()
-            }
-        except subprocess.TimeoutExpired:
-            return {
-                "success": False,
-                "message": "❌ Timeout: Docker restart took too long",
-                "timestamp": datetime.now().isoformat()
-            }
-        except FileNotFoundError:
-            return {
-                "success": False,
-                "message": "❌ Docker not found. Is Docker installed?",
-                "timestamp": datetime.now().isoformat()
-            }
-        except Exception as e:
-            return {
-                "success": False,
-                "message": f"❌ Error: {str(e)}",
-                "timestamp": datetime.now().isoformat()
-            }
+            inventory = load_container_inventory(max_age=0)
+            targets = [c.name for c in (inventory.running if running else inventory.stopped)]
+        except DockerBackendError as e:
+            return {"success": False, "error": str(e), "message": f"❌ Failed to list containers: {e}", "timestamp": datetime.now().isoformat()}
+        
+        if not targets:
+            return {"success": True, "message": f"ℹ️ No containers to {action}", "timestamp": datetime.now().isoformat()}
+        
+        started = time.monotonic()
+        done, failed = [], {}
+        for result in get_lifecycle_executor().run(action, targets):
+            if result.success:
+                done.append(result.container)
+            else:
+                failed[result.container] = result.error
+            if on_result is not None:
+                on_result({**result.to_dict(), "done": len(done) + len(failed), "total": len(targets)})
+        invalidate_container_inventory()
+        
+        past = {"start": "started", "stop": "stopped", "restart": "restarted"}[action]
+        result = {
+            "success": not failed,
+            "message": f"✅ {past.capitalize()} {len(done)} containers" if not failed else f"❌ {len(failed)}/{len(targets)} containers failed to {action}",
+            past: done,
+            "failed": failed,
+            "wall_seconds": time.monotonic() - started,
+            "timestamp": datetime.now().isoformat()
+        }
+        if failed:
+            result["error"] = "; ".join(f"{name}: {error}" for name, error in failed.items())
+        return result
 
-    def docker_cleanup(self) -> Dict[str, Any]:
+    # ═══════════════════════════════════════════════════════════
+    # 🌅 ROUTINES
+    # ═══════════════════════════════════════════════════════════
+
+    def morning_routine(self, on_step: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
         """
-        Clean up Docker system (remove unused containers, images, volumes)
+        Morning Startup Routine
+        
+        Starts the stopped containers in dependency order (compose
+        depends_on / labels, see docker_startup): each level in parallel,
+        waiting for healthchecks only where a dependant requires them.
+        Then checks the deployment status.
         
-        SECURITY: Already safe (no shell=True)
+        Args:
+            on_step: Progress callback (level, service, event, detail)
         """
+        results = {"success": True, "steps": []}
+        
+        # Step 1: Start containers level by level
         try:
-            result = subprocess.run(
-                ["docker", "system", "prune", "-af", "--volumes"],
-                capture_output=True,
-                text=True,
-                timeout=120,  # Cleanup can take time
-                check=False
-            )
-            
-            return {
-                "success": result.returncode == 0,
-                "message": "✅ Docker cleanup complete" if result.returncode == 0 else "❌ Cleanup failed",
-                "output": result.stdout,
-                "timestamp": datetime.now().isoformat()
-            }
-        except subprocess.TimeoutExpired:
-            return {
-                "success": False,
-                "message": "❌ Timeout: Docker cleanup took too long",
-                "timestamp": datetime.now().isoformat()
-            }
-        except FileNotFoundError:
-            return {
-                "success": False,
-                "message": "❌ Docker not found. Is Docker installed?",
-                "timestamp": datetime.now().isoformat()
-            }
-        except Exception as e:
-            return {
-                "success": False,
-                "message": f"❌ Error: {str(e)}",
-                "timestamp": datetime.now().isoformat()
-            }
+            startup = start_in_dependency_order(on_step=on_step)
+            for level in startup["levels"]:
+                results["steps"].append({
+                    "name": f"Start Level {level['level'] + 1}: {', '.join(level['containers'])}",
+                    "success": not any(c in startup["failed"] or c in startup["blocked"] for c in level["containers"]),
+                    "message": f"{len(level['started'])} gestartet in {level['seconds']:.1f}s"
+                })
+            for container, error in {**startup["failed"], **startup["blocked"]}.items():
+                results["steps"].append({"name": f"Container {container}", "success": False, "message": error})
+            results["startup"] = startup
+        except DockerBackendError as e:
+            results["steps"].append({"name": "Start Docker Containers", "success": False, "message": str(e)})
+        invalidate_container_inventory()
+        
+        # Step 2: Semaphore / deployment status
+        deployment = self.get_deployment_status()
+        results["steps"].append({
+            "name": "Semaphore Status",
+            "success": deployment.get("status") not in ("unavailable", "error"),
+            "message": deployment.get("message")
+        })
+        
+        results["success"] = all(step["success"] for step in results["steps"])
+        results["message"] = "Morning Routine abgeschlossen!"
+        results["timestamp"] = datetime.now().isoformat()
+        return results
 
     # ... Rest of the methods remain unchanged ...
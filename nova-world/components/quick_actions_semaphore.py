@@ -4,8 +4,24 @@ Extended Quick Actions with Semaphore API
 """
 
 import streamlit as st
+import time
 from typing import Dict, List, Optional, Any
+from .ansible_output_parser import AnsibleOutputParser, parse_task_output
 from .semaphore_api import SemaphoreAPI, SemaphoreAPIError, create_semaphore_client
+from .semaphore_batch import resolve_targets, run_batch
+from .semaphore_async import fetch_status_snapshot, get_async_semaphore_client, run_sync
+from .semaphore_logs import TaskLogFollower
+from .semaphore_polling import DEFAULT_POLL_POLICY
+from .semaphore_templates import get_template_index
+from .single_flight import get_single_flight, single_flight_stats
+from .task_history_store import get_task_history_store
+from .task_log_archive import get_task_log_archive
+from .task_log_search import get_task_log_index
+from .task_timings import get_task_timing_store, regressions_to_csv
+from .deploy_analytics import format_duration, format_estimate, get_deployment_analytics
+from .deploy_scheduler import get_deploy_scheduler
+from .docker_engine import DockerBackendError
+from .docker_startup import start_in_dependency_order
 
 
 # ═══════════════════════════════════════════════════════════
@@ -88,6 +104,10 @@ def execute_semaphore_action(
     """
     Execute Semaphore-based quick action
     
+    Deployment actions are submitted to the shared DeploymentScheduler
+    (task_id is None while the request is queued); all other templates
+    are started directly.
+    
     Args:
         action: Action definition
         client: SemaphoreAPI client (optional, will be created if None)
@@ -109,7 +129,7 @@ def execute_semaphore_action(
                         "message": "Please configure Semaphore API token in secrets.toml"
                     }
                 
-                client = SemaphoreAPI(base_url=base_url, api_token=api_token)
+                client = create_semaphore_client(base_url=base_url, api_token=api_token)
             except Exception as e:
                 return {
                     "success": False,
@@ -127,23 +147,50 @@ def execute_semaphore_action(
                 "error": "Template name not specified in action"
             }
         
-        templates = client.get_templates(project_id)
-        template = next(
-            (t for t in templates if t.get('name') == template_name),
-            None
-        )
+        template_index = get_template_index(client)
+        template = template_index.get(project_id, template_name)
         
         if not template:
             return {
                 "success": False,
                 "error": f"Template '{template_name}' not found",
-                "available_templates": [t.get('name') for t in templates]
+                "available_templates": template_index.names(project_id)
             }
         
         template_id = template.get('id')
         
+        # Deployments go through the scheduler (per-inventory lock, queue, coalescing)
+        if action.get("category") == "deployment":
+            request = get_deploy_scheduler(client).submit(project_id, template)
+            if request.future.done() and request.future.exception():
+                template_index.invalidate(project_id)
+                raise request.future.exception()
+            
+            if request.status == 'queued':
+                message = "Deployment queued behind a running deployment of the same inventory"
+            elif request.coalesced:
+                message = f"Task {request.task_id} started (coalesced)"
+            else:
+                message = f"Task {request.task_id} started successfully"
+            
+            return {
+                "success": True,
+                "task_id": request.task_id,
+                "status": request.status,
+                "coalesced": request.coalesced > 0,
+                "project_id": project_id,
+                "template_id": template_id,
+                "template_name": template_name,
+                "message": message
+            }
+        
         # Run task
-        result = client.run_task(project_id, template_id)
+        try:
+            result = client.run_task(project_id, template_id)
+        except SemaphoreAPIError:
+            # Template may have been deleted or recreated
+            template_index.invalidate(project_id)
+            raise
         task_id = result.get('id')
         
         if not task_id:
@@ -174,6 +221,88 @@ def execute_semaphore_action(
         }
 
 
+def execute_semaphore_batch_action(
+    action: Dict[str, Any],
+    project_ids: Optional[List[int]] = None,
+    max_concurrent: int = 4,
+    timeout: Optional[float] = 3600,
+    client: Optional[SemaphoreAPI] = None
+) -> Dict[str, Any]:
+    """
+    Execute a Semaphore quick action in every project (e.g. "Health Check")
+    
+    Args:
+        action: Action definition (template_name is matched as substring)
+        project_ids: Projects to run in (default: all projects)
+        max_concurrent: Maximum number of running tasks
+        timeout: Overall deadline in seconds
+        client: SemaphoreAPI client (optional, will be created if None)
+    
+    Returns:
+        Combined result (see run_batch)
+    """
+    try:
+        if client is None:
+            client = create_semaphore_client()
+        
+        template_name = action.get("template_name")
+        if not template_name:
+            return {"success": False, "error": "Template name not specified in action"}
+        
+        targets = resolve_targets(client, template_name, project_ids)
+        if not targets:
+            return {"success": False, "error": f"Template '{template_name}' not found in any project"}
+        
+        return run_batch(client, targets, max_concurrent=max_concurrent, timeout=timeout)
+    
+    except ValueError as e:
+        return {"success": False, "error": str(e)}
+    
+    except SemaphoreAPIError as e:
+        return {"success": False, "error": f"Semaphore API error: {str(e)}"}
+
+
+def render_semaphore_batch_result(result: Dict[str, Any]):
+    """
+    Render combined result of a batch execution
+    
+    Args:
+        result: Result of execute_semaphore_batch_action / run_batch
+    """
+    if "tasks" not in result:
+        st.error(f"❌ Action failed: {result.get('error', 'Unknown error')}")
+        return
+    
+    summary = (
+        f"{result['succeeded']}/{result['total']} erfolgreich "
+        f"in {format_duration(result['wall_seconds'])}"
+    )
+    if result["success"]:
+        st.success(f"✅ {summary}")
+    else:
+        st.error(f"❌ {summary}")
+    
+    import pandas as pd
+    
+    status_emoji = {'success': '✅', 'error': '❌', 'stopped': '⏹️', 'timeout': '⏱️', 'skipped': '⏭️'}
+    
+    st.dataframe(
+        pd.DataFrame([
+            {
+                'Projekt': task['project_id'],
+                'Template': task['template_name'],
+                'Task ID': task['task_id'],
+                'Status': f"{status_emoji.get(task['status'], '❓')} {task['status']}",
+                'Dauer': format_duration(task['duration_seconds']),
+                'Fehler': task['error'] or ''
+            }
+            for task in result['tasks']
+        ]),
+        use_container_width=True,
+        hide_index=True
+    )
+
+
 def render_semaphore_action_result(result: Dict[str, Any]):
     """
     Render Semaphore action result in Streamlit
@@ -186,6 +315,11 @@ def render_semaphore_action_result(result: Dict[str, Any]):
         project_id = result.get("project_id")
         template_name = result.get("template_name")
         
+        if task_id is None:
+            # Deployment waiting in the scheduler queue
+            st.info(f"⏳ {template_name}: {result.get('message', 'queued')}")
+            return
+        
         st.success(f"✅ {template_name} started!")
         
         # Show task details
@@ -217,6 +351,9 @@ def render_semaphore_action_result(result: Dict[str, Any]):
                 if status.get("message"):
                     st.code(status.get("message"), language="text")
         
+            if status.get("is_running") and st.toggle("📜 Follow live logs", key=f"follow_logs_{task_id}"):
+                render_task_log_stream(client, project_id, task_id)
+        
         except Exception as e:
             st.warning(f"Could not fetch task status: {str(e)}")
     
@@ -231,6 +368,223 @@ def render_semaphore_action_result(result: Dict[str, Any]):
                     st.write(f"- {template}")
 
 
+def render_log_search(project_id: int, limit: int = 50):
+    """
+    Render full-text search over archived task logs
+    
+    Args:
+        project_id: Project ID
+        limit: Maximum number of matching lines
+    """
+    with st.expander("🔎 Log-Suche"):
+        query = st.text_input(
+            "Suche",
+            placeholder="FAILED! => ... paperless",
+            help="Phrasen in Reihenfolge auf derselben Zeile, getrennt durch '...'",
+            key="log_search_query"
+        )
+        
+        if not query:
+            index_stats = get_task_log_index().stats()
+            st.caption(f"{index_stats['tasks']} Logs indiziert · {index_stats['terms']} Begriffe")
+            return
+        
+        started = time.perf_counter()
+        matches = get_task_log_index().search(query, project_id=project_id, limit=limit)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        
+        if not matches:
+            st.info(f"Keine Treffer ({elapsed_ms:.0f} ms)")
+            return
+        
+        import pandas as pd
+        
+        archive = get_task_log_archive()
+        base_url = st.secrets.get("semaphore", {}).get("url", "http://localhost:3000")
+        
+        data = []
+        for match in matches:
+            lines = archive.read_lines(project_id, match['task_id'], match['line'], 1)
+            data.append({
+                'Task ID': match['task_id'],
+                'Zeile': match['line'] + 1,
+                'Output': lines[0]['output'] if lines else '',
+                'Semaphore': f"{base_url}/project/{project_id}/history?t={match['task_id']}"
+            })
+        
+        st.dataframe(
+            pd.DataFrame(data),
+            use_container_width=True,
+            hide_index=True,
+            column_config={'Semaphore': st.column_config.LinkColumn(display_text="öffnen")}
+        )
+        st.caption(f"{len(matches)} Treffer in {elapsed_ms:.0f} ms")
+
+
+def render_task_log_stream(
+    client: SemaphoreAPI,
+    project_id: int,
+    task_id: int,
+    max_lines: int = 200
+):
+    """
+    Render live task output with throughput metrics
+    
+    Only new lines are fetched on each poll; the view shows the most recent
+    lines from the follower's ring buffer. Lines are also fed to an
+    AnsibleOutputParser for the current task and per-role timings.
+    
+    Args:
+        client: SemaphoreAPI client
+        project_id: Project ID
+        task_id: Task ID
+        max_lines: Number of recent lines to display
+    """
+    follower = TaskLogFollower(client, project_id, task_id, buffer_size=max_lines)
+    parser = AnsibleOutputParser()
+    schedule = DEFAULT_POLL_POLICY.schedule()
+    
+    log_placeholder = st.empty()
+    stats_placeholder = st.empty()
+    
+    while True:
+        new_entries = follower.poll()
+        if new_entries:
+            parser.feed_many(new_entries)
+            log_placeholder.code(
+                "\n".join(str(entry.get('output', '')) for entry in follower.recent),
+                language="text"
+            )
+        
+        stats = follower.stats()
+        stats_placeholder.caption(
+            f"📈 {stats['lines_total']} lines · {stats['lines_per_second']:.1f} lines/s · "
+            f"{stats['bytes_per_second'] / 1024:.1f} KB/s · {stats['requests']} requests"
+            + (f" · ▶️ {parser.current_task.key}" if parser.current_task else "")
+        )
+        
+        if follower.is_done:
+            break
+        
+        time.sleep(schedule.next_interval(activity=bool(new_entries)))
+    
+    st.write("**Final Status:**", follower.status or "unknown")
+    
+    parser.finish()
+    render_ansible_timings(parser.summary())
+    
+    # Keep the full log beyond this rerun
+    try:
+        get_task_log_archive().archive_task(client, project_id, task_id, status=follower.status)
+    except Exception as e:
+        st.caption(f"⚠️ Log konnte nicht archiviert werden: {e}")
+
+
+def render_ansible_timings(summary: Dict[str, Any], top_tasks: int = 10):
+    """
+    Render per-role and per-task wall-clock time of a playbook run
+    
+    Args:
+        summary: Parser summary (see AnsibleOutputParser.summary)
+        top_tasks: Number of slowest tasks to list
+    """
+    if not summary.get('task_count'):
+        return
+    
+    import pandas as pd
+    
+    total = sum(summary['roles'].values()) or 1.0
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("**⏱️ Zeit pro Rolle**")
+        st.dataframe(
+            pd.DataFrame([
+                {'Rolle': role, 'Dauer': format_duration(seconds), 'Anteil': f"{seconds / total * 100:.0f}%"}
+                for role, seconds in summary['roles'].items()
+            ]),
+            use_container_width=True,
+            hide_index=True
+        )
+    
+    with col2:
+        st.markdown("**🐢 Langsamste Tasks**")
+        st.dataframe(
+            pd.DataFrame([
+                {'Task': task['key'], 'Dauer': format_duration(task['duration_seconds']), 'Läufe': task['runs']}
+                for task in summary['slowest_tasks'][:top_tasks]
+            ]),
+            use_container_width=True,
+            hide_index=True
+        )
+    
+    if summary['recap']:
+        st.markdown("**📋 PLAY RECAP**")
+        st.dataframe(
+            pd.DataFrame([{'Host': host, **counts} for host, counts in summary['recap'].items()]),
+            use_container_width=True,
+            hide_index=True
+        )
+    
+    for failure in summary['failures'][-5:]:
+        st.error(f"❌ {failure['host']} · {failure['task']}: {failure['message'][:200]}")
+
+
+def render_deploy_queue():
+    """
+    Render deployment queue depth, running deployments and wait times
+    
+    Deployments go through the shared DeploymentScheduler (one per
+    inventory at a time, duplicate clicks coalesced).
+    """
+    try:
+        scheduler = get_deploy_scheduler(create_semaphore_client())
+    except ValueError:
+        return
+    
+    stats = scheduler.stats()
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("Warteschlange", stats['queued'])
+    
+    with col2:
+        st.metric("Laufend", f"{stats['running']} / {stats['max_concurrent']}")
+    
+    with col3:
+        st.metric("Ø Wartezeit", format_duration(stats['avg_wait_seconds']))
+    
+    with col4:
+        st.metric("Max. Wartezeit", format_duration(stats['max_wait_seconds']))
+    
+    snapshot = scheduler.snapshot()
+    entries = snapshot['running'] + snapshot['queued']
+    
+    if entries:
+        import pandas as pd
+        
+        st.dataframe(
+            pd.DataFrame([
+                {
+                    'Template': entry['template_name'],
+                    'Status': '🔄 läuft' if entry['status'] in ('starting', 'running') else '⏳ wartet',
+                    'Inventory': entry['inventory_id'],
+                    'Task ID': entry['task_id'],
+                    'Wartezeit': format_duration(entry['wait_seconds']),
+                    'Zusammengefasst': entry['coalesced']
+                }
+                for entry in entries
+            ]),
+            use_container_width=True,
+            hide_index=True
+        )
+    
+    if stats['coalesced']:
+        st.caption(f"🔁 {stats['coalesced']} doppelte Deploy-Anfragen zusammengefasst")
+
+
 def render_semaphore_status_widget():
     """
     Render Semaphore status widget
@@ -241,24 +595,33 @@ def render_semaphore_status_widget():
     - Running tasks
     """
     try:
-        client = create_semaphore_client()
+        semaphore_config = st.secrets.get("semaphore", {})
+        base_url = semaphore_config.get("url", "http://localhost:3000")
+        api_token = semaphore_config.get("api_token")
+        project_id = semaphore_config.get("project_id", 1)
+        
+        if not api_token:
+            raise ValueError("Semaphore API token required")
+        
+        # Ping, templates and recent tasks in one concurrent round
+        # Sessions rerunning at the same moment share one snapshot round
+        client = get_async_semaphore_client(base_url, api_token)
+        snapshot = get_single_flight('semaphore').do(
+            (base_url, api_token, 'status_snapshot', project_id),
+            lambda: run_sync(fetch_status_snapshot(client, project_id), timeout=client.timeout)
+        )
         
         # Check connection
-        if not client.ping():
+        if not snapshot.get("reachable"):
             st.error("❌ Semaphore is not reachable")
             return
         
-        # Get project ID
-        project_id = st.secrets.get("semaphore", {}).get("project_id", 1)
-        
-        # Get deployment status
-        from .semaphore_api import get_deployment_status
-        status = get_deployment_status(client, project_id)
-        
-        if status.get("error"):
-            st.warning(f"⚠️ Could not fetch deployment status: {status['error']}")
+        if snapshot.get("error"):
+            st.warning(f"⚠️ Could not fetch deployment status: {snapshot['error']}")
             return
         
+        status = snapshot["status"]
+        
         # Show status
         col1, col2, col3, col4 = st.columns(4)
         
@@ -293,6 +656,13 @@ def render_semaphore_status_widget():
             
             if latest.get('duration_seconds'):
                 st.write(f"Duration: {latest['duration_seconds']:.1f}s")
+        
+        shared = [
+            f"{name}: {stats['coalesced']}/{stats['calls']}"
+            for name, stats in single_flight_stats().items() if stats['calls']
+        ]
+        if shared:
+            st.caption("🔁 Geteilte Requests (zusammengefasst/gesamt) · " + " · ".join(shared))
     
     except Exception as e:
         st.error(f"❌ Semaphore error: {str(e)}")
@@ -304,6 +674,9 @@ def get_semaphore_task_history(
     """
     Get Semaphore task history
     
+    Reads from the local task history store; new tasks are pulled from
+    Semaphore in the background (see sync_task_history).
+    
     Args:
         limit: Maximum number of tasks to return
     
@@ -311,16 +684,294 @@ def get_semaphore_task_history(
         List of task summaries
     """
     try:
-        client = create_semaphore_client()
         project_id = st.secrets.get("semaphore", {}).get("project_id", 1)
+        sync_task_history(project_id)
         
-        return client.get_recent_tasks(project_id, limit=limit)
+        return get_task_history_store().recent(project_id, limit=limit)
     
     except Exception as e:
-        st.error(f"Failed to fetch task history: {str(e)}")
+        st.error(f"Failed to load task history: {str(e)}")
         return []
 
 
+def sync_task_history(
+    project_id: int,
+    max_age: float = 30
+) -> bool:
+    """
+    Start a background sync of the local task history if it is stale
+    
+    Args:
+        project_id: Project ID
+        max_age: Seconds after which the local mirror is refreshed
+    
+    Returns:
+        True if a sync was started
+    """
+    store = get_task_history_store()
+    last_sync = store.last_sync(project_id)
+    
+    if last_sync is not None and time.time() - last_sync < max_age:
+        return False
+    
+    try:
+        client = create_semaphore_client()
+    except ValueError:
+        # No API token configured – history stays local only
+        return False
+    
+    return store.sync_in_background(client, project_id, then=archive_finished_logs)
+
+
+def archive_finished_logs(
+    client: SemaphoreAPI,
+    project_id: int,
+    limit: int = 20
+) -> int:
+    """
+    Archive output of recently finished tasks (newest first), add the
+    new logs to the search index and record their task timings
+    
+    Args:
+        client: SemaphoreAPI client
+        project_id: Project ID
+        limit: Maximum number of logs fetched per call
+    
+    Returns:
+        Number of archived logs
+    """
+    archive = get_task_log_archive()
+    recent = get_task_history_store().recent(project_id, limit=100)
+    archived = archive.archive_missing(client, project_id, recent, limit=limit)
+    
+    get_task_log_index().index_archived(archive, project_id, limit=limit)
+    get_task_timing_store().record_archived(archive, project_id, limit=limit)
+    return archived
+
+
+def render_recent_deployments(limit: int = 10):
+    """
+    Render recent deployments from the local task history store
+    
+    Renders in milliseconds from SQLite and keeps working while Semaphore
+    is slow or offline; the mirror is refreshed in the background.
+    
+    Args:
+        limit: Number of deployments to show
+    """
+    project_id = st.secrets.get("semaphore", {}).get("project_id", 1)
+    store = get_task_history_store()
+    
+    sync_task_history(project_id)
+    
+    counts = store.status_counts(project_id)
+    total = sum(counts.values())
+    
+    if total == 0:
+        if store.is_syncing(project_id):
+            st.info("⏳ Deployment-Historie wird von Semaphore synchronisiert...")
+        else:
+            st.info("Noch keine Deployments in der lokalen Historie")
+        return
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("Deployments", total)
+    
+    with col2:
+        st.metric("Success", counts.get('success', 0))
+    
+    with col3:
+        st.metric("Failed", counts.get('error', 0))
+    
+    with col4:
+        success_rate = counts.get('success', 0) / total * 100
+        st.metric("Success Rate", f"{success_rate:.0f}%")
+    
+    render_task_history_table(store.recent(project_id, limit=limit))
+    
+    last_sync = store.last_sync(project_id)
+    if store.is_syncing(project_id):
+        st.caption("🔄 Synchronisiere mit Semaphore...")
+    elif last_sync:
+        st.caption(f"Lokal gespiegelt · letzter Sync vor {time.time() - last_sync:.0f}s")
+    
+    render_archived_logs(project_id)
+    render_log_search(project_id)
+
+
+def render_archived_logs(project_id: int, page_lines: int = 200):
+    """
+    Render a line-range viewer for archived task logs
+    
+    Args:
+        project_id: Project ID
+        page_lines: Lines shown per page
+    """
+    archive = get_task_log_archive()
+    archives = archive.list_archives(project_id, limit=50)
+    
+    if not archives:
+        return
+    
+    with st.expander("📄 Archivierte Logs"):
+        labels = {
+            f"Task {a['task_id']} · {a['status']} · {a['lines']} Zeilen": a
+            for a in archives
+        }
+        selected = labels[st.selectbox("Task", list(labels), key="archived_log_task")]
+        
+        max_page = max(0, (selected['lines'] - 1) // page_lines)
+        page = st.number_input(
+            f"Seite (à {page_lines} Zeilen)",
+            min_value=1,
+            max_value=max_page + 1,
+            value=max_page + 1,
+            key=f"archived_log_page_{selected['task_id']}"
+        )
+        
+        start = (page - 1) * page_lines
+        entries = archive.read_lines(project_id, selected['task_id'], start, page_lines)
+        
+        st.code(
+            "\n".join(f"{e['line'] + 1:>6}  {e['output']}" for e in entries),
+            language="text"
+        )
+        
+        if st.checkbox("⏱️ Zeit pro Rolle / Task", key=f"archived_log_timings_{selected['task_id']}"):
+            render_ansible_timings(
+                parse_task_output(archive.iter_lines(project_id, selected['task_id']))
+            )
+        
+        stats = archive.stats()
+        st.caption(
+            f"{stats['archives']} Logs archiviert · "
+            f"{stats['stored_bytes'] / 1024 / 1024:.1f} MB (Kompression {stats['compression_ratio']:.1f}×)"
+        )
+
+
+def _template_names(project_id: int) -> Dict[int, str]:
+    """Template ID → name from the shared template index (empty if unavailable)"""
+    try:
+        client = create_semaphore_client()
+        return {
+            t['id']: t.get('name', '')
+            for t in get_template_index(client).templates(project_id)
+        }
+    except Exception:
+        return {}
+
+
+def get_profile_duration_estimates(project_id: Optional[int] = None) -> Dict[str, str]:
+    """
+    Get duration estimates per deployment profile from local task history
+    
+    Args:
+        project_id: Project ID (if None, reads semaphore.project_id from secrets)
+    
+    Returns:
+        Dict profile (minimal/standard/full) → estimate text; profiles without
+        enough successful runs are omitted
+    """
+    if project_id is None:
+        project_id = st.secrets.get("semaphore", {}).get("project_id", 1)
+    
+    try:
+        analytics = get_deployment_analytics(get_task_history_store(), project_id)
+        profiles = analytics.by_profile(_template_names(project_id))
+    except Exception:
+        return {}
+    
+    estimates = {}
+    for profile, stats in profiles.items():
+        estimate = format_estimate(stats)
+        if estimate:
+            estimates[profile] = estimate
+    return estimates
+
+
+def render_deployment_analytics(project_id: Optional[int] = None):
+    """
+    Render duration percentiles, failure rate and trend per template
+    
+    Args:
+        project_id: Project ID (if None, reads semaphore.project_id from secrets)
+    """
+    if project_id is None:
+        project_id = st.secrets.get("semaphore", {}).get("project_id", 1)
+    
+    analytics = get_deployment_analytics(get_task_history_store(), project_id)
+    stats_by_template = analytics.by_template()
+    
+    if not stats_by_template:
+        st.info("Noch keine Deployment-Historie für Auswertungen")
+        return
+    
+    import pandas as pd
+    
+    names = _template_names(project_id)
+    
+    data = []
+    for template_id, stats in sorted(stats_by_template.items()):
+        trend = stats.get('trend')
+        failure_rate = stats.get('failure_rate')
+        
+        data.append({
+            'Template': names.get(template_id, template_id),
+            'Runs': stats['runs'],
+            'p50': format_duration(stats['p50']),
+            'p95': format_duration(stats['p95']),
+            'p99': format_duration(stats['p99']),
+            'Failure Rate': f"{failure_rate * 100:.1f}%" if failure_rate is not None else 'N/A',
+            'Trend': f"{'📈' if trend > 0 else '📉'} {trend * 100:+.0f}%" if trend is not None else '–'
+        })
+    
+    st.dataframe(pd.DataFrame(data), use_container_width=True, hide_index=True)
+    st.caption("Dauer über erfolgreiche Läufe · Trend: Median der letzten 10 Läufe vs. davor")
+
+
+def render_task_regressions(project_id: Optional[int] = None, factor: float = 3.0):
+    """
+    Render playbook tasks that got slower than their rolling baseline
+    
+    Args:
+        project_id: Project ID (if None, reads semaphore.project_id from secrets)
+        factor: Minimum slowdown against the baseline median
+    """
+    if project_id is None:
+        project_id = st.secrets.get("semaphore", {}).get("project_id", 1)
+    
+    regressions = get_task_timing_store().detect_regressions(project_id, factor=factor)
+    
+    if not regressions:
+        st.success(f"✅ Kein Task ist {factor:g}× langsamer als in den letzten 7 Tagen")
+        return
+    
+    import pandas as pd
+    
+    data = [
+        {
+            'Task': f"{r['role']} : {r['task']}" if r['role'] else r['task'],
+            'Dauer': format_duration(r['duration']),
+            'Baseline': format_duration(r['baseline']),
+            'Faktor': f"{r['ratio']:.1f}×" if r['ratio'] else '–',
+            'Semaphore Task': r['task_id'],
+            'Start': r['started_at']
+        }
+        for r in regressions
+    ]
+    
+    st.dataframe(pd.DataFrame(data), use_container_width=True, hide_index=True)
+    st.download_button(
+        "📥 Export CSV",
+        data=regressions_to_csv(regressions),
+        file_name=f"task_regressions_project_{project_id}.csv",
+        mime="text/csv"
+    )
+    st.caption("Baseline: Median der erfolgreichen Läufe der 7 Tage davor (mind. 3 Läufe)")
+
+
 def render_task_history_table(tasks: List[Dict[str, Any]]):
     """
     Render task history as table
@@ -365,7 +1016,7 @@ def execute_morning_routine_with_semaphore() -> Dict[str, Any]:
     Execute morning routine with Semaphore integration
     
     Steps:
-    1. Start Docker containers
+    1. Start Docker containers (dependency order)
     2. Start Semaphore
     3. Run health check via Semaphore
     4. Show deployment status
@@ -378,53 +1029,76 @@ def execute_morning_routine_with_semaphore() -> Dict[str, Any]:
         "success": True
     }
     
-    # Step 1: Start Docker
+    # Step 1: Start Docker (dependency order, see docker_startup)
     st.write("🐳 Starting Docker containers...")
-    # ... (existing Docker start logic)
-    results["steps"].append({"name": "Docker Start", "success": True})
+    try:
+        startup = start_in_dependency_order(
+            on_step=lambda s: st.caption(f"Level {s['level'] + 1} · {s['container']}: {s['event']} {s['detail']}")
+        )
+        results["steps"].append({
+            "name": "Docker Start",
+            "success": startup["success"],
+            "started": startup["started"],
+            "error": "; ".join(f"{k}: {v}" for k, v in {**startup["failed"], **startup["blocked"]}.items()) or None
+        })
+        if not startup["success"]:
+            results["success"] = False
+            st.error("❌ Docker start incomplete")
+            for container, error in startup["failed"].items():
+                st.write(f"- **{container}**: {error}")
+            for container, error in startup["blocked"].items():
+                st.write(f"- **{container}** (blocked): {error}")
+    except DockerBackendError as e:
+        results["steps"].append({"name": "Docker Start", "success": False, "error": str(e)})
+        st.error(f"❌ Docker start failed: {e}")
+        results["success"] = False
     
     # Step 2: Start Semaphore
     st.write("🎭 Starting Semaphore...")
     # ... (existing Semaphore start logic)
     results["steps"].append({"name": "Semaphore Start", "success": True})
     
-    # Step 3: Health Check via Semaphore
+    # Step 3: Health Check via Semaphore (pointless while containers are down)
     st.write("🏥 Running health check...")
-    try:
-        client = create_semaphore_client()
-        project_id = st.secrets.get("semaphore", {}).get("project_id", 1)
+    if not results["success"]:
+        results["steps"].append({
+            "name": "Health Check",
+            "success": False,
+            "error": "Skipped: Docker start failed"
+        })
+        st.warning("⚠️ Health check skipped: Docker start failed")
+    else:
+        try:
+            client = create_semaphore_client()
+            project_id = st.secrets.get("semaphore", {}).get("project_id", 1)
         
-        # Find health check template
-        templates = client.get_templates(project_id)
-        health_template = next(
-            (t for t in templates if 'health' in t.get('name', '').lower()),
-            None
-        )
+            # Find health check template
+            health_template = get_template_index(client).find(project_id, 'health')
         
-        if health_template:
-            result = client.run_task(project_id, health_template['id'])
-            results["steps"].append({
-                "name": "Health Check",
-                "success": True,
-                "task_id": result.get('id')
-            })
-            st.success("✅ Health check started")
-        else:
+            if health_template:
+                result = client.run_task(project_id, health_template['id'])
+                results["steps"].append({
+                    "name": "Health Check",
+                    "success": True,
+                    "task_id": result.get('id')
+                })
+                st.success("✅ Health check started")
+            else:
+                results["steps"].append({
+                    "name": "Health Check",
+                    "success": False,
+                    "error": "Health check template not found"
+                })
+                st.warning("⚠️ Health check template not found")
+        
+        except Exception as e:
             results["steps"].append({
                 "name": "Health Check",
                 "success": False,
-                "error": "Health check template not found"
+                "error": str(e)
             })
-            st.warning("⚠️ Health check template not found")
-    
-    except Exception as e:
-        results["steps"].append({
-            "name": "Health Check",
-            "success": False,
-            "error": str(e)
-        })
-        st.error(f"❌ Health check failed: {str(e)}")
-        results["success"] = False
+            st.error(f"❌ Health check failed: {str(e)}")
+            results["success"] = False
     
     # Step 4: Show status
     st.write("📊 Deployment status:")
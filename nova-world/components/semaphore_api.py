@@ -4,19 +4,40 @@ Full REST API Integration for Ansible Semaphore
 """
 
 import requests
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Any, Union
 from datetime import datetime
 import time
 import logging
 
+from .semaphore_pagination import TaskPager, TimeBound
+from .semaphore_polling import PollPolicy
+from .semaphore_resilience import backoff_delay, get_circuit_breaker, get_retry_budget
+from .single_flight import get_single_flight
+
+if TYPE_CHECKING:
+    from .semaphore_cache import ResponseCache
+
 logger = logging.getLogger(__name__)
 
+# Task states that never change again
+TERMINAL_STATUSES = ('success', 'error', 'stopped')
+
+
+# Requests that may be retried safely
+IDEMPOTENT_METHODS = ('GET', 'HEAD')
+
 
 class SemaphoreAPIError(Exception):
     """Base exception for Semaphore API errors"""
     pass
 
 
+class SemaphoreUnavailableError(SemaphoreAPIError):
+    """Raised without a request while the circuit breaker is open"""
+    pass
+
+
 class SemaphoreAPI:
     """
     Semaphore REST API Client
@@ -34,7 +55,11 @@ class SemaphoreAPI:
         base_url: str,
         api_token: str,
         timeout: int = 30,
-        max_retries: int = 3
+        max_retries: int = 3,
+        cache: Optional['ResponseCache'] = None,
+        max_backoff: float = 0.5,
+        session: Optional[requests.Session] = None,
+        coalesce: bool = True
     ):
         """
         Initialize Semaphore API client
@@ -43,18 +68,35 @@ class SemaphoreAPI:
             base_url: Semaphore base URL (e.g., http://localhost:3000)
             api_token: API token from Semaphore user settings
             timeout: Request timeout in seconds
-            max_retries: Maximum number of retry attempts
+            max_retries: Maximum number of attempts for idempotent requests
+            cache: Optional ResponseCache for GET requests
+            max_backoff: Upper bound for a single retry delay in seconds
+            session: Shared requests.Session (e.g. from SemaphoreClientRegistry);
+                auth headers are then sent per request
+            coalesce: Share concurrent identical GETs and pings with other
+                threads (process-wide 'semaphore' single-flight group)
         """
         self.base_url = base_url.rstrip('/')
         self.api_url = f"{self.base_url}/api"
         self.timeout = timeout
         self.max_retries = max_retries
+        self.max_backoff = max_backoff
+        self.cache = cache
+        
+        self.breaker = get_circuit_breaker(self.base_url, probe=self._probe)
+        self.retry_budget = get_retry_budget(self.base_url)
         
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.client_key = (self.base_url, api_token)
+        self.single_flight = get_single_flight('semaphore') if coalesce else None
+        self.headers = {
             'Authorization': f'Bearer {api_token}',
             'Content-Type': 'application/json'
-        })
+        }
+        
+        if session is None:
+            session = requests.Session()
+            session.headers.update(self.headers)
+        self.session = session
     
     def _request(
         self,
@@ -63,7 +105,12 @@ class SemaphoreAPI:
         **kwargs
     ) -> Dict[str, Any]:
         """
-        Make HTTP request with retry logic
+        Make HTTP request with circuit breaker and budgeted retries
+        
+        Only idempotent requests are retried, on timeouts, connection errors
+        and 5xx responses, with short jittered backoff while the retry budget
+        allows it. Once the circuit for this base URL is open, requests fail
+        fast (or serve a cached response) until a background probe succeeds.
         
         Args:
             method: HTTP method (GET, POST, PUT, DELETE)
@@ -74,60 +121,123 @@ class SemaphoreAPI:
             Response JSON data
         
         Raises:
+            SemaphoreUnavailableError: While the circuit is open
             SemaphoreAPIError: On API error
         """
+        # Concurrent identical reads (e.g. several sessions rerunning at
+        # once) share one request and its result
+        if method == 'GET' and self.single_flight is not None and 'headers' not in kwargs:
+            params = kwargs.get('params') or {}
+            key = (self.client_key, endpoint, tuple(sorted((k, str(v)) for k, v in params.items())))
+            return self.single_flight.do(key, lambda: self._send(method, endpoint, **kwargs))
+        
+        return self._send(method, endpoint, **kwargs)
+    
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Send one request (cache, breaker, retries; see _request)"""
         url = f"{self.api_url}/{endpoint.lstrip('/')}"
         
+        # Serve fresh cache entries, revalidate stale ones
+        cached = None
+        if self.cache is not None and method == 'GET':
+            cached = self.cache.lookup(endpoint, kwargs.get('params'))
+            if cached is not None:
+                if cached.is_fresh:
+                    return self.cache.hit(cached)
+                kwargs['headers'] = {**kwargs.get('headers', {}), **cached.conditional_headers()}
+        
+        # Fail fast while Semaphore is known to be down
+        if not self.breaker.allow_request():
+            if cached is not None:
+                return self.cache.hit(cached)
+            raise SemaphoreUnavailableError(f"Semaphore unavailable: circuit open for {self.base_url}")
+        
+        self.retry_budget.deposit()
+        
         for attempt in range(self.max_retries):
             try:
                 response = self.session.request(
                     method=method,
                     url=url,
                     timeout=self.timeout,
-                    **kwargs
+                    headers={**self.headers, **kwargs.get('headers', {})},
+                    **{k: v for k, v in kwargs.items() if k != 'headers'}
                 )
-                
-                # Handle different status codes
-                if response.status_code == 200:
-                    return response.json() if response.content else {}
-                elif response.status_code == 201:
-                    return response.json() if response.content else {}
-                elif response.status_code == 204:
-                    return {}
-                elif response.status_code == 401:
-                    raise SemaphoreAPIError("Unauthorized: Invalid API token")
-                elif response.status_code == 404:
-                    raise SemaphoreAPIError(f"Not found: {endpoint}")
-                elif response.status_code >= 500:
-                    # Retry on server errors
-                    if attempt < self.max_retries - 1:
-                        time.sleep(2 ** attempt)  # Exponential backoff
-                        continue
-                    raise SemaphoreAPIError(f"Server error: {response.status_code}")
-                else:
-                    error_msg = response.text or f"HTTP {response.status_code}"
-                    raise SemaphoreAPIError(f"API error: {error_msg}")
-            
             except requests.exceptions.Timeout:
-                if attempt < self.max_retries - 1:
-                    time.sleep(2 ** attempt)
-                    continue
-                raise SemaphoreAPIError("Request timeout")
-            
+                error = SemaphoreAPIError("Request timeout")
             except requests.exceptions.ConnectionError:
-                if attempt < self.max_retries - 1:
-                    time.sleep(2 ** attempt)
-                    continue
-                raise SemaphoreAPIError("Connection error: Cannot reach Semaphore")
-            
-            except Exception as e:
-                if attempt < self.max_retries - 1:
-                    time.sleep(2 ** attempt)
-                    continue
+                error = SemaphoreAPIError("Connection error: Cannot reach Semaphore")
+            except requests.exceptions.RequestException as e:
                 raise SemaphoreAPIError(f"Unexpected error: {str(e)}")
+            else:
+                if response.status_code < 500:
+                    self.breaker.record_success()
+                    return self._handle_response(method, endpoint, response, cached, kwargs.get('params'))
+                error = SemaphoreAPIError(f"Server error: {response.status_code}")
+            
+            if (
+                method not in IDEMPOTENT_METHODS
+                or attempt >= self.max_retries - 1
+                or self.breaker.is_open
+                or not self.retry_budget.try_withdraw()
+            ):
+                # One failure per request, not per attempt
+                self.breaker.record_failure()
+                raise error
+            
+            time.sleep(backoff_delay(attempt, cap=self.max_backoff))
         
         raise SemaphoreAPIError("Max retries exceeded")
     
+    def _handle_response(
+        self,
+        method: str,
+        endpoint: str,
+        response: requests.Response,
+        cached: Optional[Any],
+        params: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Map a non-5xx response to data or SemaphoreAPIError
+        
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+            response: HTTP response
+            cached: Cache entry used for revalidation (if any)
+            params: Query parameters
+        
+        Returns:
+            Response JSON data
+        """
+        try:
+            if response.status_code == 304 and cached is not None:
+                return self.cache.revalidated(endpoint, cached)
+            elif response.status_code == 200:
+                data = response.json() if response.content else {}
+                if self.cache is not None and method == 'GET':
+                    self.cache.store(endpoint, params, data, len(response.content), response.headers)
+                return data
+            elif response.status_code == 201:
+                return response.json() if response.content else {}
+            elif response.status_code == 204:
+                return {}
+        except ValueError as e:
+            raise SemaphoreAPIError(f"Invalid response from Semaphore: {str(e)}")
+        
+        if response.status_code == 401:
+            raise SemaphoreAPIError("Unauthorized: Invalid API token")
+        elif response.status_code == 404:
+            raise SemaphoreAPIError(f"Not found: {endpoint}")
+        
+        error_msg = response.text or f"HTTP {response.status_code}"
+        raise SemaphoreAPIError(f"API error: {error_msg}")
+    
     # ═══════════════════════════════════════════════════════════
     # HEALTH & INFO
     # ═══════════════════════════════════════════════════════════
@@ -136,16 +246,36 @@ class SemaphoreAPI:
         """
         Check if Semaphore is reachable
         
+        The result feeds the circuit breaker. While the circuit is open this
+        returns False immediately; recovery is detected by the breaker's
+        background probe.
+        
         Returns:
             True if Semaphore is reachable, False otherwise
         """
+        if not self.breaker.allow_request():
+            return False
+        
+        if self.single_flight is not None:
+            reachable = self.single_flight.do((self.base_url, 'ping'), self._probe)
+        else:
+            reachable = self._probe()
+        if reachable:
+            self.breaker.record_success()
+        else:
+            self.breaker.record_failure()
+        return reachable
+    
+    def _probe(self) -> bool:
+        """Raw health check against /api/ping (no breaker involved)"""
         try:
             response = self.session.get(
                 f"{self.base_url}/api/ping",
+                headers=self.headers,
                 timeout=5
             )
             return response.status_code == 200
-        except:
+        except requests.exceptions.RequestException:
             return False
     
     def get_info(self) -> Dict[str, Any]:
@@ -274,6 +404,52 @@ class SemaphoreAPI:
             params={'limit': limit}
         )
     
+    def iter_tasks(
+        self,
+        project_id: int,
+        template_id: Optional[int] = None,
+        status: Union[str, Iterable[str], None] = None,
+        since: TimeBound = None,
+        until: TimeBound = None,
+        page_size: int = 50,
+        max_tasks: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over task history, newest first (generator)
+        
+        Pages are fetched on demand, so memory stays flat and no further
+        requests are made once the caller stops iterating. See TaskPager
+        for filtering and cursor details.
+        
+        Args:
+            project_id: Project ID
+            template_id: Only tasks of this template
+            status: Only tasks with this status (or one of these statuses)
+            since: Only tasks created at or after this time (datetime or ISO string)
+            until: Only tasks created at or before this time (datetime or ISO string)
+            page_size: Tasks per request
+            max_tasks: Stop after this many tasks
+        
+        Yields:
+            Tasks
+        """
+        pager = TaskPager(
+            template_id=template_id,
+            status=status,
+            since=since,
+            until=until,
+            page_size=page_size,
+            max_tasks=max_tasks
+        )
+        
+        while not pager.done:
+            page = self._request(
+                'GET',
+                f'/project/{project_id}/tasks',
+                params=pager.params()
+            )
+            yield from pager.ingest(page or [])
+    
     def get_task(
         self,
         project_id: int,
@@ -297,7 +473,8 @@ class SemaphoreAPI:
     def get_task_output(
         self,
         project_id: int,
-        task_id: int
+        task_id: int,
+        offset: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
         Get task output (logs)
@@ -305,13 +482,17 @@ class SemaphoreAPI:
         Args:
             project_id: Project ID
             task_id: Task ID
+            offset: Only return lines after this many lines (None = full log)
         
         Returns:
             List of log entries
         """
+        params = {'offset': offset} if offset else None
+        
         return self._request(
             'GET',
-            f'/project/{project_id}/tasks/{task_id}/output'
+            f'/project/{project_id}/tasks/{task_id}/output',
+            params=params
         )
     
     def stop_task(
@@ -343,16 +524,22 @@ class SemaphoreAPI:
         project_id: int,
         task_id: int,
         timeout: int = 600,
-        poll_interval: int = 2
+        poll_interval: Optional[float] = None,
+        policy: Optional[PollPolicy] = None
     ) -> Dict[str, Any]:
         """
         Wait for task to complete
         
+        Polls fast right after start, backs off with jitter while the status
+        does not change and speeds up again on every status change. While
+        the circuit breaker is open polling continues until ``timeout``.
+        
         Args:
             project_id: Project ID
             task_id: Task ID
             timeout: Maximum wait time in seconds
-            poll_interval: Polling interval in seconds
+            poll_interval: Fixed polling interval in seconds (disables adaptive polling)
+            policy: Adaptive polling policy (default: DEFAULT_POLL_POLICY)
         
         Returns:
             Final task status
@@ -360,16 +547,28 @@ class SemaphoreAPI:
         Raises:
             SemaphoreAPIError: On timeout or error
         """
+        schedule = PollPolicy.resolve(policy, poll_interval).schedule()
         start_time = time.time()
+        last_status = None
         
         while time.time() - start_time < timeout:
-            task = self.get_task(project_id, task_id)
+            try:
+                task = self.get_task(project_id, task_id)
+            except SemaphoreUnavailableError:
+                # Circuit open: keep waiting until our own timeout, not the breaker's
+                remaining = timeout - (time.time() - start_time)
+                time.sleep(max(0, min(schedule.next_interval(activity=False), remaining)))
+                continue
             status = task.get('status', '')
             
-            if status in ['success', 'error', 'stopped']:
+            if status in TERMINAL_STATUSES:
                 return task
             
-            time.sleep(poll_interval)
+            interval = schedule.next_interval(activity=status != last_status)
+            last_status = status
+            
+            remaining = timeout - (time.time() - start_time)
+            time.sleep(max(0, min(interval, remaining)))
         
         raise SemaphoreAPIError(f"Task {task_id} timeout after {timeout}s")
     
@@ -389,34 +588,42 @@ class SemaphoreAPI:
             Status summary with human-readable info
         """
         task = self.get_task(project_id, task_id)
+        return summarize_task(task, task_id)
+    
+    def get_tasks_batch(
+        self,
+        project_id: int,
+        task_ids: List[int],
+        max_workers: int = 8
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Get details for several tasks concurrently
         
-        status = task.get('status', 'unknown')
-        start = task.get('start', '')
-        end = task.get('end', '')
+        Args:
+            project_id: Project ID
+            task_ids: Task IDs to fetch
+            max_workers: Maximum number of parallel requests
         
-        # Calculate duration
-        duration = None
-        if start and end:
-            try:
-                start_dt = datetime.fromisoformat(start.replace('Z', '+00:00'))
-                end_dt = datetime.fromisoformat(end.replace('Z', '+00:00'))
-                duration = (end_dt - start_dt).total_seconds()
-            except:
-                pass
+        Returns:
+            Task details keyed by task ID (failed fetches are omitted)
+        """
+        if not task_ids:
+            return {}
+        
+        results = {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(task_ids))) as pool:
+            futures = {
+                pool.submit(self.get_task, project_id, task_id): task_id
+                for task_id in task_ids
+            }
+            for future in as_completed(futures):
+                task_id = futures[future]
+                try:
+                    results[task_id] = future.result()
+                except SemaphoreAPIError as e:
+                    logger.debug(f"Could not fetch task {task_id}: {e}")
         
-        return {
-            'task_id': task_id,
-            'status': status,
-            'template_id': task.get('template_id'),
-            'start': start,
-            'end': end,
-            'duration_seconds': duration,
-            'message': task.get('message', ''),
-            'is_running': status == 'running',
-            'is_success': status == 'success',
-            'is_failed': status == 'error',
-            'is_stopped': status == 'stopped'
-        }
+        return results
     
     def get_recent_tasks(
         self,
@@ -426,6 +633,9 @@ class SemaphoreAPI:
         """
         Get recent tasks with status summaries
         
+        Summaries are built from the task list payload. Only tasks that are
+        not yet finished are re-fetched (concurrently) for fresh details.
+        
         Args:
             project_id: Project ID
             limit: Maximum number of tasks
@@ -433,81 +643,106 @@ class SemaphoreAPI:
         Returns:
             List of task summaries
         """
-        tasks = self.get_tasks(project_id, limit=limit)
+        tasks = [t for t in self.get_tasks(project_id, limit=limit) if t.get('id')]
         
-        summaries = []
-        for task in tasks:
-            task_id = task.get('id')
-            if task_id:
-                try:
-                    summary = self.get_task_status_summary(project_id, task_id)
-                    summaries.append(summary)
-                except:
-                    # Skip failed tasks
-                    pass
+        active_ids = [t['id'] for t in tasks if t.get('status') not in TERMINAL_STATUSES]
+        fresh = self.get_tasks_batch(project_id, active_ids)
         
-        return summaries
+        return [summarize_task(fresh.get(t['id'], t), t['id']) for t in tasks]
     
     def stream_task_logs(
         self,
         project_id: int,
         task_id: int,
         follow: bool = True,
-        poll_interval: int = 2
+        poll_interval: Optional[float] = None,
+        policy: Optional[PollPolicy] = None
     ):
         """
         Stream task logs (generator)
         
+        Only new lines are requested on each poll (see TaskLogFollower).
+        Polling speeds up while lines arrive and backs off while idle.
+        
         Args:
             project_id: Project ID
             task_id: Task ID
             follow: Follow logs until task completes
-            poll_interval: Polling interval in seconds
+            poll_interval: Fixed polling interval in seconds (disables adaptive polling)
+            policy: Adaptive polling policy (default: DEFAULT_POLL_POLICY)
         
         Yields:
             Log entries
         """
-        last_log_id = 0
+        from .semaphore_logs import TaskLogFollower
         
-        while True:
-            # Get task status
-            task = self.get_task(project_id, task_id)
-            status = task.get('status', '')
-            
-            # Get logs
-            logs = self.get_task_output(project_id, task_id)
-            
-            # Yield new logs
-            for log in logs:
-                log_id = log.get('id', 0)
-                if log_id > last_log_id:
-                    yield log
-                    last_log_id = log_id
-            
-            # Check if task is done
-            if status in ['success', 'error', 'stopped']:
-                break
-            
-            if not follow:
-                break
-            
-            time.sleep(poll_interval)
+        follower = TaskLogFollower(self, project_id, task_id)
+        yield from follower.follow(follow=follow, poll_interval=poll_interval, policy=policy)
 
 
 # ═══════════════════════════════════════════════════════════
 # CONVENIENCE FUNCTIONS
 # ═══════════════════════════════════════════════════════════
 
+def summarize_task(
+    task: Dict[str, Any],
+    task_id: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Build status summary from a task payload
+    
+    Args:
+        task: Task payload as returned by Semaphore
+        task_id: Task ID (defaults to task['id'])
+    
+    Returns:
+        Status summary with human-readable info
+    """
+    status = task.get('status', 'unknown')
+    start = task.get('start', '')
+    end = task.get('end', '')
+    
+    # Calculate duration
+    duration = None
+    if start and end:
+        try:
+            start_dt = datetime.fromisoformat(start.replace('Z', '+00:00'))
+            end_dt = datetime.fromisoformat(end.replace('Z', '+00:00'))
+            duration = (end_dt - start_dt).total_seconds()
+        except:
+            pass
+    
+    return {
+        'task_id': task_id if task_id is not None else task.get('id'),
+        'status': status,
+        'template_id': task.get('template_id'),
+        'start': start,
+        'end': end,
+        'duration_seconds': duration,
+        'message': task.get('message', ''),
+        'is_running': status == 'running',
+        'is_success': status == 'success',
+        'is_failed': status == 'error',
+        'is_stopped': status == 'stopped'
+    }
+
+
 def create_semaphore_client(
-    base_url: str = "http://localhost:3000",
-    api_token: Optional[str] = None
+    base_url: Optional[str] = None,
+    api_token: Optional[str] = None,
+    response_cache: Optional[bool] = None
 ) -> SemaphoreAPI:
     """
-    Create Semaphore API client from config
+    Get shared Semaphore API client from config
+    
+    Clients come from the process-wide SemaphoreClientRegistry, so every
+    Streamlit session and rerun reuses the same warm connections.
     
     Args:
-        base_url: Semaphore base URL
+        base_url: Semaphore base URL (if None, tries to get from secrets)
         api_token: API token (if None, tries to get from secrets)
+        response_cache: Use the shared response cache
+            (if None, reads semaphore.response_cache from secrets)
     
     Returns:
         SemaphoreAPI client
@@ -515,17 +750,32 @@ def create_semaphore_client(
     Raises:
         ValueError: If API token is not provided
     """
+    semaphore_config = {}
+    try:
+        import streamlit as st
+        semaphore_config = st.secrets.get("semaphore", {})
+    except:
+        pass
+    
+    if not base_url:
+        base_url = semaphore_config.get("url", "http://localhost:3000")
+    
     if not api_token:
-        try:
-            import streamlit as st
-            api_token = st.secrets.get("semaphore", {}).get("api_token")
-        except:
-            pass
+        api_token = semaphore_config.get("api_token")
     
     if not api_token:
         raise ValueError("Semaphore API token required")
     
-    return SemaphoreAPI(base_url=base_url, api_token=api_token)
+    if response_cache is None:
+        response_cache = bool(semaphore_config.get("response_cache", False))
+    
+    cache = None
+    if response_cache:
+        from .semaphore_cache import get_shared_response_cache
+        cache = get_shared_response_cache(base_url, api_token)
+    
+    from .semaphore_registry import get_client_registry
+    return get_client_registry().get(base_url, api_token, cache=cache)
 
 
 def get_deployment_status(
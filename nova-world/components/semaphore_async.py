@@ -0,0 +1,653 @@
+"""
+Async Semaphore API Client
+asyncio-native REST Client with pooled keep-alive Connections
+"""
+
+import asyncio
+import threading
+import time
+import logging
+from typing import Any, AsyncIterator, Awaitable, Dict, Iterable, List, Optional, Tuple, TypeVar, Union
+
+import httpx
+
+from .semaphore_api import (
+    IDEMPOTENT_METHODS,
+    TERMINAL_STATUSES,
+    SemaphoreAPIError,
+    SemaphoreUnavailableError,
+    summarize_task
+)
+from .semaphore_logs import TaskLogFollower
+from .semaphore_pagination import TaskPager, TimeBound
+from .semaphore_polling import PollPolicy
+from .semaphore_resilience import backoff_delay, get_circuit_breaker, get_retry_budget
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+class AsyncSemaphoreAPI:
+    """
+    Async Semaphore REST API Client
+
+    Same surface as SemaphoreAPI, but every method is a coroutine so the
+    dashboard can fan out project/template/task queries concurrently:
+
+        async with AsyncSemaphoreAPI(url, token) as client:
+            projects, templates = await asyncio.gather(
+                client.get_projects(),
+                client.get_templates(1)
+            )
+
+    All requests share one bounded keep-alive connection pool.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        api_token: str,
+        timeout: int = 30,
+        max_retries: int = 3,
+        max_backoff: float = 0.5,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 5,
+        keepalive_expiry: float = 30.0
+    ):
+        """
+        Initialize async Semaphore API client
+
+        Args:
+            base_url: Semaphore base URL (e.g., http://localhost:3000)
+            api_token: API token from Semaphore user settings
+            timeout: Request timeout in seconds
+            max_retries: Maximum number of attempts for idempotent requests
+            max_backoff: Upper bound for a single retry delay in seconds
+            max_connections: Upper bound for concurrent connections
+            max_keepalive_connections: Idle connections kept open for reuse
+            keepalive_expiry: Seconds an idle connection stays in the pool
+        """
+        self.base_url = base_url.rstrip('/')
+        self.api_url = f"{self.base_url}/api"
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.max_backoff = max_backoff
+
+        self.breaker = get_circuit_breaker(self.base_url, probe=self._probe)
+        self.retry_budget = get_retry_budget(self.base_url)
+
+        self.client = httpx.AsyncClient(
+            headers={
+                'Authorization': f'Bearer {api_token}',
+                'Content-Type': 'application/json'
+            },
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry
+            )
+        )
+
+    async def __aenter__(self) -> 'AsyncSemaphoreAPI':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close all pooled connections"""
+        await self.client.aclose()
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        **kwargs
+    ) -> Any:
+        """
+        Make HTTP request with circuit breaker and budgeted retries
+
+        Shares breaker and retry budget with SemaphoreAPI for the same base URL.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            endpoint: API endpoint (without /api prefix)
+            **kwargs: Additional arguments for httpx
+
+        Returns:
+            Response JSON data
+
+        Raises:
+            SemaphoreUnavailableError: While the circuit is open
+            SemaphoreAPIError: On API error
+        """
+        url = f"{self.api_url}/{endpoint.lstrip('/')}"
+
+        if not self.breaker.allow_request():
+            raise SemaphoreUnavailableError(f"Semaphore unavailable: circuit open for {self.base_url}")
+
+        self.retry_budget.deposit()
+
+        for attempt in range(self.max_retries):
+            try:
+                response = await self.client.request(method, url, **kwargs)
+            except httpx.TimeoutException:
+                error = SemaphoreAPIError("Request timeout")
+            except httpx.TransportError:
+                error = SemaphoreAPIError("Connection error: Cannot reach Semaphore")
+            else:
+                if response.status_code < 500:
+                    self.breaker.record_success()
+                    return self._handle_response(endpoint, response)
+                error = SemaphoreAPIError(f"Server error: {response.status_code}")
+
+            if (
+                method not in IDEMPOTENT_METHODS
+                or attempt >= self.max_retries - 1
+                or self.breaker.is_open
+                or not self.retry_budget.try_withdraw()
+            ):
+                # One failure per request, not per attempt
+                self.breaker.record_failure()
+                raise error
+
+            await asyncio.sleep(backoff_delay(attempt, cap=self.max_backoff))
+
+        raise SemaphoreAPIError("Max retries exceeded")
+
+    @staticmethod
+    def _handle_response(endpoint: str, response: httpx.Response) -> Any:
+        """Map a non-5xx response to data or SemaphoreAPIError"""
+        try:
+            if response.status_code in (200, 201):
+                return response.json() if response.content else {}
+            elif response.status_code == 204:
+                return {}
+        except ValueError as e:
+            raise SemaphoreAPIError(f"Invalid response from Semaphore: {str(e)}")
+
+        if response.status_code == 401:
+            raise SemaphoreAPIError("Unauthorized: Invalid API token")
+        elif response.status_code == 404:
+            raise SemaphoreAPIError(f"Not found: {endpoint}")
+
+        error_msg = response.text or f"HTTP {response.status_code}"
+        raise SemaphoreAPIError(f"API error: {error_msg}")
+
+    # ═══════════════════════════════════════════════════════════
+    # HEALTH & INFO
+    # ═══════════════════════════════════════════════════════════
+
+    async def ping(self) -> bool:
+        """
+        Check if Semaphore is reachable (feeds the circuit breaker)
+
+        Returns:
+            True if Semaphore is reachable, False otherwise
+        """
+        if not self.breaker.allow_request():
+            return False
+
+        try:
+            response = await self.client.get(f"{self.api_url}/ping", timeout=5)
+            reachable = response.status_code == 200
+        except httpx.HTTPError:
+            reachable = False
+
+        if reachable:
+            self.breaker.record_success()
+        else:
+            self.breaker.record_failure()
+        return reachable
+
+    def _probe(self) -> bool:
+        """Blocking health check for the breaker's background probe"""
+        try:
+            return httpx.get(f"{self.api_url}/ping", timeout=5).status_code == 200
+        except httpx.HTTPError:
+            return False
+
+    async def get_info(self) -> Dict[str, Any]:
+        """Get Semaphore server info"""
+        return await self._request('GET', '/info')
+
+    # ═══════════════════════════════════════════════════════════
+    # PROJECTS & TEMPLATES
+    # ═══════════════════════════════════════════════════════════
+
+    async def get_projects(self) -> List[Dict[str, Any]]:
+        """Get all projects"""
+        return await self._request('GET', '/projects')
+
+    async def get_project(self, project_id: int) -> Dict[str, Any]:
+        """Get project by ID"""
+        return await self._request('GET', f'/projects/{project_id}')
+
+    async def get_templates(self, project_id: int) -> List[Dict[str, Any]]:
+        """Get all task templates for a project"""
+        return await self._request('GET', f'/project/{project_id}/templates')
+
+    async def get_template(
+        self,
+        project_id: int,
+        template_id: int
+    ) -> Dict[str, Any]:
+        """Get task template by ID"""
+        return await self._request(
+            'GET',
+            f'/project/{project_id}/templates/{template_id}'
+        )
+
+    # ═══════════════════════════════════════════════════════════
+    # TASKS (JOBS)
+    # ═══════════════════════════════════════════════════════════
+
+    async def run_task(
+        self,
+        project_id: int,
+        template_id: int,
+        debug: bool = False,
+        dry_run: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Run a task (execute template)
+
+        Args:
+            project_id: Project ID
+            template_id: Template ID
+            debug: Enable debug mode
+            dry_run: Enable dry-run mode (check mode)
+
+        Returns:
+            Task execution info including task_id
+        """
+        payload = {
+            'template_id': template_id,
+            'debug': debug,
+            'dry_run': dry_run
+        }
+
+        return await self._request(
+            'POST',
+            f'/project/{project_id}/tasks',
+            json=payload
+        )
+
+    async def get_tasks(
+        self,
+        project_id: int,
+        limit: int = 50
+    ) -> List[Dict[str, Any]]:
+        """Get task history for a project"""
+        return await self._request(
+            'GET',
+            f'/project/{project_id}/tasks',
+            params={'limit': limit}
+        )
+
+    async def iter_tasks(
+        self,
+        project_id: int,
+        template_id: Optional[int] = None,
+        status: Union[str, Iterable[str], None] = None,
+        since: TimeBound = None,
+        until: TimeBound = None,
+        page_size: int = 50,
+        max_tasks: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over task history, newest first (see SemaphoreAPI.iter_tasks)"""
+        pager = TaskPager(
+            template_id=template_id,
+            status=status,
+            since=since,
+            until=until,
+            page_size=page_size,
+            max_tasks=max_tasks
+        )
+
+        while not pager.done:
+            page = await self._request(
+                'GET',
+                f'/project/{project_id}/tasks',
+                params=pager.params()
+            )
+            for task in pager.ingest(page or []):
+                yield task
+
+    async def get_task(
+        self,
+        project_id: int,
+        task_id: int
+    ) -> Dict[str, Any]:
+        """Get task details by ID"""
+        return await self._request(
+            'GET',
+            f'/project/{project_id}/tasks/{task_id}'
+        )
+
+    async def get_task_output(
+        self,
+        project_id: int,
+        task_id: int,
+        offset: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Get task output (logs), optionally only lines after offset"""
+        params = {'offset': offset} if offset else None
+
+        return await self._request(
+            'GET',
+            f'/project/{project_id}/tasks/{task_id}/output',
+            params=params
+        )
+
+    async def stop_task(
+        self,
+        project_id: int,
+        task_id: int
+    ) -> Dict[str, Any]:
+        """Stop a running task"""
+        return await self._request(
+            'POST',
+            f'/project/{project_id}/tasks/{task_id}/stop'
+        )
+
+    # ═══════════════════════════════════════════════════════════
+    # HELPER METHODS
+    # ═══════════════════════════════════════════════════════════
+
+    async def wait_for_task(
+        self,
+        project_id: int,
+        task_id: int,
+        timeout: int = 600,
+        poll_interval: Optional[float] = None,
+        policy: Optional[PollPolicy] = None
+    ) -> Dict[str, Any]:
+        """
+        Wait for task to complete without blocking the event loop
+
+        While the circuit breaker is open polling continues until ``timeout``.
+
+        Args:
+            project_id: Project ID
+            task_id: Task ID
+            timeout: Maximum wait time in seconds
+            poll_interval: Fixed polling interval in seconds (disables adaptive polling)
+            policy: Adaptive polling policy (default: DEFAULT_POLL_POLICY)
+
+        Returns:
+            Final task status
+
+        Raises:
+            SemaphoreAPIError: On timeout or error
+        """
+        schedule = PollPolicy.resolve(policy, poll_interval).schedule()
+        start_time = time.monotonic()
+        last_status = None
+
+        while time.monotonic() - start_time < timeout:
+            try:
+                task = await self.get_task(project_id, task_id)
+            except SemaphoreUnavailableError:
+                # Circuit open: keep waiting until our own timeout, not the breaker's
+                remaining = timeout - (time.monotonic() - start_time)
+                await asyncio.sleep(max(0, min(schedule.next_interval(activity=False), remaining)))
+                continue
+            status = task.get('status', '')
+
+            if status in TERMINAL_STATUSES:
+                return task
+
+            interval = schedule.next_interval(activity=status != last_status)
+            last_status = status
+
+            remaining = timeout - (time.monotonic() - start_time)
+            await asyncio.sleep(max(0, min(interval, remaining)))
+
+        raise SemaphoreAPIError(f"Task {task_id} timeout after {timeout}s")
+
+    async def get_task_status_summary(
+        self,
+        project_id: int,
+        task_id: int
+    ) -> Dict[str, Any]:
+        """Get task status summary"""
+        task = await self.get_task(project_id, task_id)
+        return summarize_task(task, task_id)
+
+    async def get_tasks_batch(
+        self,
+        project_id: int,
+        task_ids: List[int]
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Get details for several tasks concurrently
+
+        Args:
+            project_id: Project ID
+            task_ids: Task IDs to fetch
+
+        Returns:
+            Task details keyed by task ID (failed fetches are omitted)
+        """
+        results = await asyncio.gather(
+            *(self.get_task(project_id, task_id) for task_id in task_ids),
+            return_exceptions=True
+        )
+
+        return {
+            task_id: result
+            for task_id, result in zip(task_ids, results)
+            if not isinstance(result, BaseException)
+        }
+
+    async def get_recent_tasks(
+        self,
+        project_id: int,
+        limit: int = 10
+    ) -> List[Dict[str, Any]]:
+        """
+        Get recent tasks with status summaries
+
+        Summaries are built from the task list payload; only unfinished
+        tasks are re-fetched, concurrently over the shared pool.
+
+        Args:
+            project_id: Project ID
+            limit: Maximum number of tasks
+
+        Returns:
+            List of task summaries
+        """
+        tasks = [t for t in await self.get_tasks(project_id, limit=limit) if t.get('id')]
+
+        active_ids = [t['id'] for t in tasks if t.get('status') not in TERMINAL_STATUSES]
+        fresh = await self.get_tasks_batch(project_id, active_ids)
+
+        return [summarize_task(fresh.get(t['id'], t), t['id']) for t in tasks]
+
+    async def stream_task_logs(
+        self,
+        project_id: int,
+        task_id: int,
+        follow: bool = True,
+        poll_interval: Optional[float] = None,
+        policy: Optional[PollPolicy] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream task logs (async generator)
+
+        Task status and new output lines (offset-based) are requested
+        concurrently on every poll.
+
+        Args:
+            project_id: Project ID
+            task_id: Task ID
+            follow: Follow logs until task completes
+            poll_interval: Fixed polling interval in seconds (disables adaptive polling)
+            policy: Adaptive polling policy (default: DEFAULT_POLL_POLICY)
+
+        Yields:
+            Log entries
+        """
+        follower = TaskLogFollower(self, project_id, task_id)
+        schedule = PollPolicy.resolve(policy, poll_interval).schedule()
+
+        while True:
+            task, logs = await asyncio.gather(
+                self.get_task(project_id, task_id),
+                self.get_task_output(project_id, task_id, offset=follower.request_offset)
+            )
+            follower.status = task.get('status', '')
+
+            new_logs = follower.ingest(logs)
+            for log in new_logs:
+                yield log
+
+            if follower.is_done:
+                # Output may have grown while the status request was in flight
+                logs = await self.get_task_output(
+                    project_id, task_id, offset=follower.request_offset
+                )
+                for log in follower.ingest(logs):
+                    yield log
+                break
+
+            if not follow:
+                break
+
+            await asyncio.sleep(schedule.next_interval(activity=bool(new_logs)))
+
+
+# ═══════════════════════════════════════════════════════════
+# HELPERS
+# ═══════════════════════════════════════════════════════════
+
+async def fetch_status_snapshot(
+    client: AsyncSemaphoreAPI,
+    project_id: int,
+    limit: int = 10
+) -> Dict[str, Any]:
+    """
+    Fetch everything the status widgets need in one concurrent round
+
+    Ping, templates and recent tasks are requested in parallel, so the
+    snapshot costs roughly one round-trip of latency instead of several.
+
+    Args:
+        client: AsyncSemaphoreAPI client
+        project_id: Project ID
+        limit: Number of recent tasks
+
+    Returns:
+        Dict with reachable, templates, tasks and status (total_tasks,
+        running, success, failed, latest_task, is_healthy); reachable
+        False or an error message if Semaphore or the task list failed
+        (request errors are reported here, never raised)
+    """
+    reachable, templates, tasks = await asyncio.gather(
+        client.ping(),
+        client.get_templates(project_id),
+        client.get_recent_tasks(project_id, limit=limit),
+        return_exceptions=True
+    )
+
+    if reachable is not True:
+        return {'reachable': False, 'error': 'Semaphore is not reachable'}
+
+    if isinstance(tasks, BaseException):
+        return {'reachable': True, 'error': str(tasks)}
+
+    running = sum(1 for t in tasks if t['is_running'])
+    success = sum(1 for t in tasks if t['is_success'])
+    failed = sum(1 for t in tasks if t['is_failed'])
+
+    return {
+        'reachable': True,
+        'templates': [] if isinstance(templates, BaseException) else templates,
+        'tasks': tasks,
+        'status': {
+            'total_tasks': len(tasks),
+            'running': running,
+            'success': success,
+            'failed': failed,
+            'latest_task': tasks[0] if tasks else None,
+            'is_healthy': failed == 0 and running <= 1
+        }
+    }
+
+
+# ═══════════════════════════════════════════════════════════
+# SYNC BRIDGE (Streamlit)
+# ═══════════════════════════════════════════════════════════
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+_async_clients: Dict[Tuple[str, str], AsyncSemaphoreAPI] = {}
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Return the background event loop, starting it on first use"""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=_loop.run_forever,
+                name="semaphore-async-loop",
+                daemon=True
+            )
+            thread.start()
+        return _loop
+
+
+def run_sync(coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+    """
+    Run a coroutine on the background event loop and wait for it
+
+    Streamlit scripts are synchronous; the loop lives on a daemon thread so
+    pooled connections stay warm across reruns.
+
+    Args:
+        coro: Coroutine to execute
+        timeout: Maximum wait time in seconds (None waits indefinitely)
+
+    Returns:
+        Coroutine result
+
+    Raises:
+        concurrent.futures.TimeoutError: If the coroutine does not finish in time
+        Exception: Whatever the coroutine raises (e.g. SemaphoreAPIError)
+    """
+    future = asyncio.run_coroutine_threadsafe(coro, _get_loop())
+    return future.result(timeout)
+
+
+def get_async_semaphore_client(
+    base_url: str,
+    api_token: str
+) -> AsyncSemaphoreAPI:
+    """
+    Get shared AsyncSemaphoreAPI bound to the background loop
+
+    One client per base URL and token, so every Streamlit session reuses
+    the same pooled connections; use it only through run_sync(). The
+    client connects lazily, so nothing is raised here.
+
+    Args:
+        base_url: Semaphore base URL
+        api_token: API token
+
+    Returns:
+        AsyncSemaphoreAPI client
+    """
+    key = (base_url.rstrip('/'), api_token)
+
+    with _loop_lock:
+        client = _async_clients.get(key)
+        if client is None:
+            client = AsyncSemaphoreAPI(base_url=base_url, api_token=api_token)
+            _async_clients[key] = client
+        return client
@@ -0,0 +1,183 @@
+"""
+Semaphore Batch Execution
+Fan-out of Templates across Projects with a Concurrency Cap
+"""
+
+import time
+import logging
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional
+
+from .semaphore_api import SemaphoreAPIError, summarize_task
+from .semaphore_templates import get_template_index
+from .semaphore_watcher import get_task_watcher
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENT = 4
+
+
+def resolve_targets(
+    client: Any,
+    template_name: str,
+    project_ids: Optional[Iterable[int]] = None,
+    exact: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Find a template in several projects
+
+    Args:
+        client: SemaphoreAPI client
+        template_name: Template name, matched case-insensitively as
+            substring (e.g. "health") unless ``exact`` is set
+        project_ids: Projects to search (default: all projects)
+        exact: Require an exact name match
+
+    Returns:
+        Targets (project_id, template_id, template_name); projects without
+        a matching template are skipped
+    """
+    if project_ids is None:
+        project_ids = [p['id'] for p in client.get_projects()]
+
+    template_index = get_template_index(client)
+    targets = []
+
+    for project_id in project_ids:
+        if exact:
+            template = template_index.get(project_id, template_name)
+        else:
+            template = template_index.find(project_id, template_name)
+
+        if template:
+            targets.append({
+                'project_id': project_id,
+                'template_id': template['id'],
+                'template_name': template.get('name', template_name)
+            })
+
+    return targets
+
+
+def run_batch(
+    client: Any,
+    targets: List[Dict[str, Any]],
+    max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+    timeout: Optional[float] = None,
+    on_result: Optional[Callable[[Dict[str, Any]], None]] = None
+) -> Dict[str, Any]:
+    """
+    Run many templates and wait for all of them
+
+    At most ``max_concurrent`` tasks run at once; the next target starts as
+    soon as one finishes. All running tasks are tracked by the shared
+    TaskWatcher, so polling costs one list request per project per cycle
+    regardless of batch size.
+
+    Args:
+        client: SemaphoreAPI client
+        targets: Dicts with project_id, template_id and optional template_name
+            (see resolve_targets)
+        max_concurrent: Maximum number of running tasks
+        timeout: Overall deadline in seconds; unfinished tasks are reported
+            as 'timeout' and targets not started yet as 'skipped'
+        on_result: Called with each result entry as soon as it is final
+
+    Returns:
+        Dict with success, counts, wall_seconds and per-target results
+        (in target order)
+    """
+    started = time.monotonic()
+    deadline = started + timeout if timeout else None
+    watcher = get_task_watcher(client)
+
+    results = [
+        {
+            'project_id': target['project_id'],
+            'template_id': target['template_id'],
+            'template_name': target.get('template_name'),
+            'task_id': None,
+            'status': 'pending',
+            'duration_seconds': None,
+            'error': None
+        }
+        for target in targets
+    ]
+    pending: Deque[Dict[str, Any]] = deque(results)
+    in_flight: Dict[Future, Dict[str, Any]] = {}
+
+    def finish(result: Dict[str, Any]) -> None:
+        if on_result is not None:
+            try:
+                on_result(result)
+            except Exception as e:
+                logger.warning(f"Batch result callback failed: {e}")
+
+    while pending or in_flight:
+        if deadline and time.monotonic() >= deadline:
+            break
+
+        while pending and len(in_flight) < max(1, max_concurrent):
+            result = pending.popleft()
+            try:
+                task = client.run_task(result['project_id'], result['template_id'])
+            except SemaphoreAPIError as e:
+                result.update(status='error', error=str(e))
+                finish(result)
+                continue
+
+            if task.get('id') is None:
+                result.update(status='error', error='Semaphore returned no task id')
+                finish(result)
+                continue
+
+            result.update(task_id=task['id'], status=task.get('status', 'waiting'))
+            remaining = deadline - time.monotonic() if deadline else None
+            watch = watcher.watch(result['project_id'], result['task_id'], timeout=remaining)
+            in_flight[watch] = result
+
+        if not in_flight:
+            continue
+
+        remaining = deadline - time.monotonic() if deadline else None
+        if remaining is not None and remaining <= 0:
+            break
+
+        done, _ = wait(list(in_flight), timeout=remaining, return_when=FIRST_COMPLETED)
+
+        for future in done:
+            result = in_flight.pop(future)
+            try:
+                summary = summarize_task(future.result())
+                result.update(status=summary['status'], duration_seconds=summary['duration_seconds'])
+                if summary['status'] != 'success' and summary.get('message'):
+                    result['error'] = summary['message']
+            except Exception as e:
+                # The watch expires together with the batch deadline
+                expired = deadline is not None and time.monotonic() >= deadline
+                result.update(status='timeout' if expired else 'error', error=str(e))
+            finish(result)
+
+    for result in in_flight.values():
+        # Drop the batch's interest (other watchers of the task keep theirs)
+        watcher.unwatch(result['project_id'], result['task_id'])
+        result.update(status='timeout', error='Batch deadline reached')
+        finish(result)
+    for result in pending:
+        result.update(status='skipped', error='Batch deadline reached')
+        finish(result)
+
+    counts: Dict[str, int] = {}
+    for result in results:
+        counts[result['status']] = counts.get(result['status'], 0) + 1
+
+    return {
+        'success': bool(results) and counts.get('success', 0) == len(results),
+        'total': len(results),
+        'succeeded': counts.get('success', 0),
+        'failed': len(results) - counts.get('success', 0),
+        'counts': counts,
+        'wall_seconds': time.monotonic() - started,
+        'tasks': results
+    }
@@ -0,0 +1,280 @@
+"""
+Semaphore Response Cache
+LRU HTTP Response Cache with per-Endpoint TTLs and ETag / Last-Modified Revalidation
+"""
+
+import re
+import copy
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from .semaphore_api import TERMINAL_STATUSES
+
+# (endpoint regex, TTL in seconds); TTL 0 = always revalidate
+DEFAULT_TTLS: List[Tuple[str, float]] = [
+    (r'^/info$', 3600),
+    (r'^/projects$', 300),
+    (r'^/projects/\d+$', 300),
+    (r'^/project/\d+/templates(/\d+)?$', 300),
+    (r'^/project/\d+/tasks/\d+$', 2),
+]
+
+# Finished task documents never change again
+IMMUTABLE_TASK_PATTERN = re.compile(r'^/project/\d+/tasks/\d+$')
+
+
+class CacheEntry:
+    """One cached response"""
+
+    __slots__ = ('data', 'size', 'etag', 'last_modified', 'expires_at')
+
+    def __init__(
+        self,
+        data: Any,
+        size: int,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        expires_at: Optional[float]
+    ):
+        self.data = data
+        self.size = size
+        self.etag = etag
+        self.last_modified = last_modified
+        self.expires_at = expires_at  # None = immutable
+
+    @property
+    def is_fresh(self) -> bool:
+        return self.expires_at is None or time.monotonic() < self.expires_at
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Headers for a conditional GET"""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """
+    Opt-in response cache for SemaphoreAPI GET requests
+
+    - Per-endpoint TTLs (first matching regex wins)
+    - Stale entries are revalidated with If-None-Match / If-Modified-Since
+    - Terminal task documents (success, error, stopped) are cached permanently
+    - LRU eviction bounded by entry count and total bytes
+    """
+
+    def __init__(
+        self,
+        ttls: Optional[List[Tuple[str, float]]] = None,
+        max_entries: int = 512,
+        max_bytes: int = 8 * 1024 * 1024
+    ):
+        """
+        Initialize response cache
+
+        Args:
+            ttls: List of (endpoint regex, TTL seconds); unmatched endpoints are not cached
+            max_entries: Maximum number of cached responses
+            max_bytes: Maximum total size of cached response bodies
+        """
+        self.ttls = [(re.compile(pattern), ttl) for pattern, ttl in (ttls or DEFAULT_TTLS)]
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self._entries: 'OrderedDict[Tuple, CacheEntry]' = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+
+    # ═══════════════════════════════════════════════════════════
+    # LOOKUP & STORE
+    # ═══════════════════════════════════════════════════════════
+
+    def ttl_for(self, endpoint: str) -> Optional[float]:
+        """
+        Get TTL for an endpoint
+
+        Returns:
+            TTL in seconds or None if the endpoint is not cacheable
+        """
+        for pattern, ttl in self.ttls:
+            if pattern.search(endpoint):
+                return ttl
+        return None
+
+    def lookup(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Optional[CacheEntry]:
+        """
+        Get cached entry (fresh or stale) and mark it recently used
+
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+
+        Returns:
+            CacheEntry or None
+        """
+        key = self._key(endpoint, params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def hit(self, entry: CacheEntry) -> Any:
+        """Serve a fresh entry from memory"""
+        with self._lock:
+            self.hits += 1
+        return copy.deepcopy(entry.data)
+
+    def revalidated(self, endpoint: str, entry: CacheEntry) -> Any:
+        """Server answered 304 Not Modified: extend entry lifetime and serve it"""
+        ttl = self.ttl_for(endpoint) or 0
+        with self._lock:
+            self.revalidations += 1
+            if entry.expires_at is not None:
+                entry.expires_at = time.monotonic() + ttl
+        return copy.deepcopy(entry.data)
+
+    def store(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        data: Any,
+        size: int,
+        headers: Any
+    ) -> None:
+        """
+        Store a full response
+
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+            data: Decoded response JSON
+            size: Response body size in bytes
+            headers: Response headers
+        """
+        ttl = self.ttl_for(endpoint)
+        if ttl is None:
+            return
+
+        with self._lock:
+            self.misses += 1
+
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+
+        if self._is_immutable(endpoint, data):
+            expires_at = None
+        elif ttl > 0 or etag or last_modified:
+            expires_at = time.monotonic() + ttl
+        else:
+            return
+
+        if size > self.max_bytes:
+            return
+
+        key = self._key(endpoint, params)
+        entry = CacheEntry(copy.deepcopy(data), size, etag, last_modified, expires_at)
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old.size
+
+            self._entries[key] = entry
+            self._bytes += size
+            self._evict()
+
+    def invalidate(self, prefix: str = '') -> None:
+        """
+        Drop cached entries
+
+        Args:
+            prefix: Only drop endpoints starting with prefix ('' = everything)
+        """
+        with self._lock:
+            for key in [k for k in self._entries if k[0].startswith(prefix)]:
+                self._bytes -= self._entries.pop(key).size
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+
+        Returns:
+            Dict with hit/miss/revalidation counters and size info
+        """
+        with self._lock:
+            served = self.hits + self.revalidations
+            total = served + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'revalidations': self.revalidations,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'hit_rate': served / total if total else 0.0
+            }
+
+    # ═══════════════════════════════════════════════════════════
+    # INTERNALS
+    # ═══════════════════════════════════════════════════════════
+
+    @staticmethod
+    def _key(endpoint: str, params: Optional[Dict[str, Any]]) -> Tuple:
+        return (endpoint, tuple(sorted((params or {}).items())))
+
+    @staticmethod
+    def _is_immutable(endpoint: str, data: Any) -> bool:
+        return (
+            IMMUTABLE_TASK_PATTERN.search(endpoint) is not None
+            and isinstance(data, dict)
+            and data.get('status') in TERMINAL_STATUSES
+        )
+
+    def _evict(self) -> None:
+        """Evict least recently used entries (lock must be held)"""
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            _, entry = self._entries.popitem(last=False)
+            self._bytes -= entry.size
+            self.evictions += 1
+
+
+# ═══════════════════════════════════════════════════════════
+# SHARED CACHES
+# ═══════════════════════════════════════════════════════════
+
+_caches: Dict[Tuple[str, str], ResponseCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_shared_response_cache(base_url: str, api_token: str) -> ResponseCache:
+    """
+    Get process-wide response cache for a Semaphore instance and token
+
+    Args:
+        base_url: Semaphore base URL
+        api_token: API token
+
+    Returns:
+        ResponseCache
+    """
+    key = (base_url.rstrip('/'), api_token)
+
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = ResponseCache()
+            _caches[key] = cache
+        return cache
@@ -0,0 +1,190 @@
+"""
+Semaphore Log Follower
+Incremental, offset-based Task Output Streaming
+"""
+
+import time
+import logging
+from collections import deque
+from typing import Any, Deque, Dict, Iterator, List, Optional
+
+from .semaphore_api import TERMINAL_STATUSES
+from .semaphore_polling import PollPolicy
+
+logger = logging.getLogger(__name__)
+
+
+class TaskLogFollower:
+    """
+    Follows the output of one Semaphore task incrementally
+
+    Each poll requests only lines after the current offset
+    (GET /tasks/{id}/output?offset=N), so total transfer stays linear in the
+    log length. Servers that ignore the offset parameter are detected on the
+    first repeated response and handled by slicing client-side.
+
+    The last ``buffer_size`` lines are kept in a ring buffer for the UI, and
+    throughput (lines/s, bytes/s) is tracked from the first received line.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        project_id: int,
+        task_id: int,
+        buffer_size: int = 1000
+    ):
+        """
+        Initialize log follower
+
+        Args:
+            client: SemaphoreAPI client
+            project_id: Project ID
+            task_id: Task ID
+            buffer_size: Number of recent lines kept for display
+        """
+        self.client = client
+        self.project_id = project_id
+        self.task_id = task_id
+
+        self.recent: Deque[Dict[str, Any]] = deque(maxlen=buffer_size)
+        self.offset = 0
+        self.status = ''
+
+        # None = unknown, True = server honors offset, False = server ignores it
+        self.server_offset: Optional[bool] = None
+        self._first_entry: Optional[Dict[str, Any]] = None
+
+        self.requests = 0
+        self.lines_total = 0
+        self.bytes_total = 0
+        self.started_at: Optional[float] = None
+
+    @property
+    def request_offset(self) -> Optional[int]:
+        """Offset to send with the next output request (None = full log)"""
+        if self.server_offset is False:
+            return None
+        return self.offset
+
+    @property
+    def is_done(self) -> bool:
+        """True once the task reached a terminal state"""
+        return self.status in TERMINAL_STATUSES
+
+    def ingest(self, logs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Consume one output response and return the new lines
+
+        Args:
+            logs: Output entries as returned by Semaphore
+
+        Returns:
+            Entries not seen before
+        """
+        self.requests += 1
+
+        if not logs:
+            return []
+
+        if self.offset == 0:
+            self._first_entry = logs[0]
+            new_entries = logs
+        elif self.server_offset is False:
+            new_entries = logs[self.offset:]
+        elif self.server_offset is None and self._is_full_log(logs):
+            logger.debug("Semaphore ignores output offset, slicing client-side")
+            self.server_offset = False
+            new_entries = logs[self.offset:]
+        else:
+            self.server_offset = True
+            new_entries = logs
+
+        self.offset += len(new_entries)
+        self._record(new_entries)
+        return new_entries
+
+    def poll(self) -> List[Dict[str, Any]]:
+        """
+        Refresh task status and fetch new output lines
+
+        Returns:
+            New log entries since the last poll
+        """
+        task = self.client.get_task(self.project_id, self.task_id)
+        self.status = task.get('status', '')
+
+        logs = self.client.get_task_output(
+            self.project_id,
+            self.task_id,
+            offset=self.request_offset
+        )
+        return self.ingest(logs)
+
+    def follow(
+        self,
+        follow: bool = True,
+        poll_interval: Optional[float] = None,
+        policy: Optional[PollPolicy] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield new log entries until the task completes
+
+        Args:
+            follow: Keep polling until the task reaches a terminal state
+            poll_interval: Fixed polling interval in seconds (disables adaptive polling)
+            policy: Adaptive polling policy (default: DEFAULT_POLL_POLICY)
+
+        Yields:
+            Log entries
+        """
+        schedule = PollPolicy.resolve(policy, poll_interval).schedule()
+
+        while True:
+            new_entries = self.poll()
+            for entry in new_entries:
+                yield entry
+
+            if self.is_done or not follow:
+                break
+
+            time.sleep(schedule.next_interval(activity=bool(new_entries)))
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get throughput statistics
+
+        Returns:
+            Dict with line/byte totals and lines/s, bytes/s rates
+        """
+        elapsed = time.monotonic() - self.started_at if self.started_at else 0.0
+
+        return {
+            'task_id': self.task_id,
+            'status': self.status,
+            'requests': self.requests,
+            'lines_total': self.lines_total,
+            'bytes_total': self.bytes_total,
+            'elapsed_seconds': elapsed,
+            'lines_per_second': self.lines_total / elapsed if elapsed > 0 else 0.0,
+            'bytes_per_second': self.bytes_total / elapsed if elapsed > 0 else 0.0,
+            'server_offset': self.server_offset
+        }
+
+    def _is_full_log(self, logs: List[Dict[str, Any]]) -> bool:
+        """Check whether a response restarts at the first line we already saw"""
+        return len(logs) >= self.offset and logs[0] == self._first_entry
+
+    def _record(self, entries: List[Dict[str, Any]]) -> None:
+        """Update ring buffer and throughput counters"""
+        if not entries:
+            return
+
+        if self.started_at is None:
+            self.started_at = time.monotonic()
+
+        self.recent.extend(entries)
+        self.lines_total += len(entries)
+        self.bytes_total += sum(
+            len(str(entry.get('output', '')).encode('utf-8')) for entry in entries
+        )
@@ -0,0 +1,177 @@
+"""
+Semaphore Task Pagination
+Lazy, filtered Paging over Task History
+"""
+
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+TimeBound = Union[datetime, str, None]
+
+
+class TaskPager:
+    """
+    Paging state for one scan over a project's task history
+
+    Tasks are listed newest first. Each page is requested with ``limit`` and
+    ``offset`` plus server-side filter hints (template_id, status, since,
+    until). Filters are applied client-side as well, so servers that ignore
+    the hints still return correct results.
+
+    The smallest task ID seen so far acts as cursor: tasks created while
+    paging shift offsets, but IDs never repeat. Servers that ignore
+    ``offset`` are detected on the second page (it restarts at the newest
+    task) and paged by growing ``limit`` instead.
+
+    The scan ends when a page comes back short, ``max_tasks`` were
+    returned, or a task older than ``since`` is reached.
+    """
+
+    def __init__(
+        self,
+        template_id: Optional[int] = None,
+        status: Union[str, Iterable[str], None] = None,
+        since: TimeBound = None,
+        until: TimeBound = None,
+        page_size: int = 50,
+        max_tasks: Optional[int] = None
+    ):
+        """
+        Initialize task pager
+
+        Args:
+            template_id: Only tasks of this template
+            status: Only tasks with this status (or one of these statuses)
+            since: Only tasks created at or after this time
+            until: Only tasks created at or before this time
+            page_size: Tasks per request
+            max_tasks: Stop after this many matching tasks
+        """
+        self.template_id = template_id
+        self.statuses = (status,) if isinstance(status, str) else tuple(status or ())
+        self.since = _parse_time(since)
+        self.until = _parse_time(until)
+        self.page_size = max(1, page_size)
+        self.max_tasks = max_tasks
+
+        self.offset = 0
+        self.returned = 0
+        self.pages = 0
+        self.done = max_tasks is not None and max_tasks <= 0
+
+        # None = unknown, True = server honors offset, False = server ignores it
+        self.server_offset: Optional[bool] = None
+        self._first_id: Optional[int] = None
+        self._cursor: Optional[int] = None
+
+    def params(self) -> Dict[str, Any]:
+        """Query parameters for the next page"""
+        if self.server_offset is False:
+            params: Dict[str, Any] = {'limit': self.offset + self.page_size}
+        else:
+            params = {'limit': self.page_size}
+            if self.offset:
+                params['offset'] = self.offset
+
+        if self.template_id is not None:
+            params['template_id'] = self.template_id
+        if self.statuses:
+            params['status'] = ','.join(self.statuses)
+        if self.since is not None:
+            params['since'] = _format_time(self.since)
+        if self.until is not None:
+            params['until'] = _format_time(self.until)
+
+        return params
+
+    def ingest(self, page: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Consume one page and return the matching, not yet seen tasks
+
+        Args:
+            page: Task list as returned by Semaphore (newest first)
+
+        Returns:
+            Tasks to hand to the caller
+        """
+        requested = self.params()['limit']
+        self.pages += 1
+
+        if page and self.offset and self.server_offset is None:
+            if page[0].get('id', 0) >= (self._first_id or 0):
+                logger.debug("Semaphore ignores task list offset, paging by limit")
+                self.server_offset = False
+            else:
+                self.server_offset = True
+
+        if self.server_offset is False:
+            self.offset = len(page)
+        else:
+            self.offset += len(page)
+
+        if len(page) < requested:
+            self.done = True
+
+        matches = []
+        for task in page:
+            task_id = task.get('id')
+            if task_id is None:
+                continue
+            if self._cursor is not None and task_id >= self._cursor:
+                continue
+            self._cursor = task_id
+            if self._first_id is None:
+                self._first_id = task_id
+
+            created = _task_time(task)
+            if self.since is not None and created is not None and created < self.since:
+                self.done = True
+                break
+            if not self._matches(task, created):
+                continue
+
+            matches.append(task)
+            if self.max_tasks is not None and self.returned + len(matches) >= self.max_tasks:
+                self.done = True
+                break
+
+        self.returned += len(matches)
+        return matches
+
+    def _matches(self, task: Dict[str, Any], created: Optional[datetime]) -> bool:
+        if self.template_id is not None and task.get('template_id') != self.template_id:
+            return False
+        if self.statuses and task.get('status') not in self.statuses:
+            return False
+        if self.until is not None and created is not None and created > self.until:
+            return False
+        return True
+
+
+def _parse_time(value: TimeBound) -> Optional[datetime]:
+    """Normalize datetime / ISO string to an aware UTC datetime"""
+    if value is None or value == '':
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _format_time(value: datetime) -> str:
+    return value.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def _task_time(task: Dict[str, Any]) -> Optional[datetime]:
+    """Creation time of a task (falls back to start)"""
+    raw = task.get('created') or task.get('start')
+    if not raw:
+        return None
+    try:
+        return _parse_time(raw)
+    except ValueError:
+        return None
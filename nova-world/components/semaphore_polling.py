@@ -0,0 +1,119 @@
+"""
+Semaphore Polling Policy
+Adaptive Poll Intervals with Backoff and Jitter
+"""
+
+import time
+import random
+from typing import Optional
+
+
+class PollPolicy:
+    """
+    Adaptive polling configuration
+
+    - Fast polling (``initial``) during the first ``fast_window`` seconds,
+      right after a task was started
+    - Exponential backoff with jitter while nothing changes, up to ``max_interval``
+    - Immediate drop back to ``initial`` as soon as activity is seen
+      (new log lines, status change)
+
+    A policy is immutable configuration; every polling loop creates its own
+    PollSchedule via ``schedule()``.
+    """
+
+    def __init__(
+        self,
+        initial: float = 1.0,
+        fast_window: float = 10.0,
+        max_interval: float = 8.0,
+        multiplier: float = 1.6,
+        jitter: float = 0.2
+    ):
+        """
+        Initialize poll policy
+
+        Args:
+            initial: Interval in seconds right after start and after activity
+            fast_window: Seconds after start during which ``initial`` is used
+            max_interval: Upper bound for the backed-off interval
+            multiplier: Backoff factor per idle poll
+            jitter: Relative random spread (0.2 = ±20%)
+        """
+        self.initial = initial
+        self.fast_window = fast_window
+        self.max_interval = max(max_interval, initial)
+        self.multiplier = multiplier
+        self.jitter = jitter
+
+    @classmethod
+    def fixed(cls, interval: float) -> 'PollPolicy':
+        """Policy with a constant interval (previous poll_interval behaviour)"""
+        return cls(initial=interval, fast_window=0, max_interval=interval, multiplier=1.0, jitter=0)
+
+    @classmethod
+    def resolve(
+        cls,
+        policy: Optional['PollPolicy'] = None,
+        poll_interval: Optional[float] = None
+    ) -> 'PollPolicy':
+        """
+        Pick the policy for a polling call
+
+        Args:
+            policy: Explicit policy
+            poll_interval: Legacy fixed interval
+
+        Returns:
+            ``policy`` if given, a fixed policy for ``poll_interval``, else the default
+        """
+        if policy is not None:
+            return policy
+        if poll_interval is not None:
+            return cls.fixed(poll_interval)
+        return DEFAULT_POLL_POLICY
+
+    def schedule(self) -> 'PollSchedule':
+        """Start a new schedule for one polling loop"""
+        return PollSchedule(self)
+
+
+class PollSchedule:
+    """Stateful interval generator for one polling loop"""
+
+    def __init__(self, policy: PollPolicy):
+        self.policy = policy
+        self.polls = 0
+        self.reset()
+
+    def reset(self) -> None:
+        """Restart fast polling (e.g. after a new task was started)"""
+        self.started_at = time.monotonic()
+        self.current = self.policy.initial
+
+    def next_interval(self, activity: bool = False) -> float:
+        """
+        Get the sleep time before the next poll
+
+        Args:
+            activity: Whether the last poll saw new data
+
+        Returns:
+            Interval in seconds
+        """
+        policy = self.policy
+        self.polls += 1
+
+        in_fast_window = time.monotonic() - self.started_at < policy.fast_window
+
+        if activity or in_fast_window:
+            self.current = policy.initial
+        else:
+            self.current = min(self.current * policy.multiplier, policy.max_interval)
+
+        if policy.jitter:
+            return self.current * random.uniform(1 - policy.jitter, 1 + policy.jitter)
+        return self.current
+
+
+DEFAULT_POLL_POLICY = PollPolicy()
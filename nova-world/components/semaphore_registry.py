@@ -0,0 +1,169 @@
+"""
+Semaphore Client Registry
+Process-wide shared Clients on one pooled HTTP Transport
+"""
+
+import atexit
+import threading
+import logging
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .semaphore_api import SemaphoreAPI
+
+logger = logging.getLogger(__name__)
+
+
+class SemaphoreClientRegistry:
+    """
+    Thread-safe registry of shared SemaphoreAPI clients
+
+    Clients are keyed by (base_url, api_token) and all of them use one
+    requests.Session with a bounded keep-alive pool, so TCP/TLS handshakes
+    are paid once per process instead of once per Streamlit rerun.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 4,
+        pool_maxsize: int = 16
+    ):
+        """
+        Initialize client registry
+
+        Args:
+            pool_connections: Number of host pools kept (one per Semaphore host)
+            pool_maxsize: Keep-alive connections per host
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+
+        self._clients: Dict[Tuple[str, str], SemaphoreAPI] = {}
+        self._lock = threading.Lock()
+        self._session: Optional[requests.Session] = None
+
+    @property
+    def session(self) -> requests.Session:
+        """Shared pooled session (created on first use)"""
+        with self._lock:
+            if self._session is None:
+                self._session = self._create_session()
+            return self._session
+
+    def get(
+        self,
+        base_url: str,
+        api_token: str,
+        **client_kwargs: Any
+    ) -> SemaphoreAPI:
+        """
+        Get shared client for a Semaphore instance and token
+
+        Args:
+            base_url: Semaphore base URL
+            api_token: API token
+            **client_kwargs: Additional SemaphoreAPI arguments (first call only,
+                except ``cache`` which is attached if the client has none yet)
+
+        Returns:
+            SemaphoreAPI client
+        """
+        key = (base_url.rstrip('/'), api_token)
+        session = self.session
+
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = SemaphoreAPI(
+                    base_url=base_url,
+                    api_token=api_token,
+                    session=session,
+                    **client_kwargs
+                )
+                self._clients[key] = client
+            elif client.cache is None and client_kwargs.get('cache') is not None:
+                client.cache = client_kwargs['cache']
+            return client
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get connection reuse statistics
+
+        Returns:
+            Dict with client count, requests, opened connections and reuse ratio
+        """
+        requests_sent = 0
+        connections = 0
+
+        with self._lock:
+            clients = len(self._clients)
+            session = self._session
+
+        if session is not None:
+            # The same adapter is mounted for http:// and https://
+            adapters = {id(a): a for a in session.adapters.values()}
+            for adapter in adapters.values():
+                pools = adapter.poolmanager.pools
+                for key in list(pools.keys()):
+                    pool = pools.get(key)
+                    if pool is None:
+                        continue
+                    requests_sent += pool.num_requests
+                    connections += pool.num_connections
+
+        reused = max(requests_sent - connections, 0)
+
+        return {
+            'clients': clients,
+            'requests': requests_sent,
+            'connections_opened': connections,
+            'connections_reused': reused,
+            'reuse_ratio': reused / requests_sent if requests_sent else 0.0
+        }
+
+    def shutdown(self) -> None:
+        """Close all pooled connections and forget all clients"""
+        with self._lock:
+            session = self._session
+            self._session = None
+            self._clients.clear()
+
+        if session is not None:
+            session.close()
+
+    def _create_session(self) -> requests.Session:
+        """Create the pooled session (lock must be held)"""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=0
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+
+# ═══════════════════════════════════════════════════════════
+# SINGLETON
+# ═══════════════════════════════════════════════════════════
+
+_registry: Optional[SemaphoreClientRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_client_registry() -> SemaphoreClientRegistry:
+    """
+    Get process-wide client registry
+
+    Returns:
+        SemaphoreClientRegistry instance
+    """
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = SemaphoreClientRegistry()
+            atexit.register(_registry.shutdown)
+        return _registry
@@ -0,0 +1,251 @@
+"""
+Semaphore Resilience
+Circuit Breaker per Base URL, Retry Budget and jittered Backoff
+"""
+
+import time
+import random
+import threading
+import logging
+from typing import Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for one Semaphore instance
+
+    - closed: requests pass; ``failure_threshold`` consecutive failures open it
+    - open: requests fail fast; after ``reset_timeout`` it turns half-open
+    - half-open: requests still fail fast while one background probe runs;
+      a successful probe closes the circuit, a failed one re-opens it
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 3,
+        reset_timeout: float = 15.0,
+        probe: Optional[Callable[[], bool]] = None
+    ):
+        """
+        Initialize circuit breaker
+
+        Args:
+            name: Breaker name (base URL)
+            failure_threshold: Consecutive failures before opening
+            reset_timeout: Seconds the circuit stays open before probing
+            probe: Health check used while half-open (returns True if healthy)
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.probe = probe
+
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+
+        self.rejected = 0
+        self.trips = 0
+
+    def allow_request(self) -> bool:
+        """
+        Check whether a request may be sent
+
+        Returns:
+            True if closed; False while open or half-open (starts the probe when due)
+        """
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                self._start_probe()
+
+            self.rejected += 1
+            return False
+
+    def record_success(self) -> None:
+        """Register a successful request or probe"""
+        with self._lock:
+            if self.state != self.CLOSED:
+                logger.info(f"Circuit for {self.name} closed")
+            self.state = self.CLOSED
+            self.failures = 0
+
+    def record_failure(self) -> None:
+        """Register a failed request or probe"""
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or (
+                self.state == self.CLOSED and self.failures >= self.failure_threshold
+            ):
+                if self.state == self.CLOSED:
+                    self.trips += 1
+                    logger.warning(f"Circuit for {self.name} opened after {self.failures} failures")
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+    @property
+    def is_open(self) -> bool:
+        """True unless requests currently pass"""
+        return self.state != self.CLOSED
+
+    def stats(self) -> Dict[str, object]:
+        """Get breaker state and counters"""
+        with self._lock:
+            return {
+                'state': self.state,
+                'failures': self.failures,
+                'trips': self.trips,
+                'rejected': self.rejected
+            }
+
+    def _start_probe(self) -> None:
+        """Run the probe on a background thread (lock must be held)"""
+        if self.probe is None:
+            # Without a probe the next request acts as the trial request
+            self.state = self.CLOSED
+            self.failures = self.failure_threshold - 1
+            return
+
+        def _run():
+            try:
+                healthy = self.probe()
+            except Exception:
+                healthy = False
+
+            if healthy:
+                self.record_success()
+            else:
+                self.record_failure()
+
+        threading.Thread(
+            target=_run,
+            name=f"circuit-probe-{self.name}",
+            daemon=True
+        ).start()
+
+
+class RetryBudget:
+    """
+    Token-bucket retry budget
+
+    Every request deposits ``ratio`` tokens, every retry withdraws one, so
+    retries stay a bounded fraction of traffic even during an outage.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        min_tokens: float = 3.0,
+        max_tokens: float = 10.0
+    ):
+        """
+        Initialize retry budget
+
+        Args:
+            ratio: Tokens deposited per request
+            min_tokens: Initial tokens (allows retries right after start)
+            max_tokens: Upper bound for saved-up tokens
+        """
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self.tokens = min(min_tokens, max_tokens)
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        """Register a request"""
+        with self._lock:
+            self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+
+    def try_withdraw(self) -> bool:
+        """
+        Take one token for a retry
+
+        Returns:
+            True if the retry is within budget
+        """
+        with self._lock:
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+
+def backoff_delay(attempt: int, base: float = 0.1, cap: float = 1.0) -> float:
+    """
+    Full-jitter exponential backoff
+
+    Args:
+        attempt: Retry attempt (0-based)
+        base: Delay of the first attempt in seconds
+        cap: Maximum delay in seconds
+
+    Returns:
+        Delay in seconds
+    """
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+# ═══════════════════════════════════════════════════════════
+# SHARED BREAKERS & BUDGETS
+# ═══════════════════════════════════════════════════════════
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_budgets: Dict[str, RetryBudget] = {}
+_registry_lock = threading.Lock()
+
+
+def get_circuit_breaker(
+    base_url: str,
+    probe: Optional[Callable[[], bool]] = None
+) -> CircuitBreaker:
+    """
+    Get process-wide circuit breaker for a base URL
+
+    Args:
+        base_url: Semaphore base URL
+        probe: Health check used while half-open (set on first use)
+
+    Returns:
+        CircuitBreaker
+    """
+    key = base_url.rstrip('/')
+
+    with _registry_lock:
+        breaker = _breakers.get(key)
+        if breaker is None:
+            breaker = CircuitBreaker(key, probe=probe)
+            _breakers[key] = breaker
+        elif breaker.probe is None:
+            breaker.probe = probe
+        return breaker
+
+
+def get_retry_budget(base_url: str) -> RetryBudget:
+    """
+    Get process-wide retry budget for a base URL
+
+    Args:
+        base_url: Semaphore base URL
+
+    Returns:
+        RetryBudget
+    """
+    key = base_url.rstrip('/')
+
+    with _registry_lock:
+        budget = _budgets.get(key)
+        if budget is None:
+            budget = RetryBudget()
+            _budgets[key] = budget
+        return budget
@@ -0,0 +1,232 @@
+"""
+Semaphore Template Index
+Name → Template Resolution Cache with TTL, Invalidation and Background Refresh
+"""
+
+import time
+import threading
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class _ProjectTemplates:
+    """Indexed template listing of one project"""
+
+    def __init__(self, templates: List[Dict[str, Any]]):
+        self.templates = templates
+        self.fetched_at = time.monotonic()
+        self.by_name = {t.get('name'): t for t in templates if t.get('name')}
+        self.lower_names = [(t.get('name', '').lower(), t) for t in templates]
+        self.by_substring: Dict[str, Optional[Dict[str, Any]]] = {}
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.fetched_at
+
+
+class TemplateIndex:
+    """
+    Per-project template index keyed by name
+
+    Lookups are served from memory. Entries older than ``ttl`` are reloaded
+    synchronously; entries past ``refresh_after`` are still served but
+    reloaded on a background thread, so a deploy click normally costs only
+    the run_task POST.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        ttl: float = 300,
+        refresh_after: float = 240,
+        miss_refresh_after: float = 10
+    ):
+        """
+        Initialize template index
+
+        Args:
+            client: SemaphoreAPI client used for reloading
+            ttl: Seconds after which an entry must be reloaded before use
+            refresh_after: Seconds after which an entry is reloaded in background
+            miss_refresh_after: Minimum entry age before a name miss forces a reload
+        """
+        self.client = client
+        self.ttl = ttl
+        self.refresh_after = refresh_after
+        self.miss_refresh_after = miss_refresh_after
+
+        self._projects: Dict[int, _ProjectTemplates] = {}
+        self._lock = threading.Lock()
+        self._refreshing: set = set()
+
+    # ═══════════════════════════════════════════════════════════
+    # LOOKUPS
+    # ═══════════════════════════════════════════════════════════
+
+    def get(self, project_id: int, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Resolve template by exact name
+
+        Args:
+            project_id: Project ID
+            name: Template name
+
+        Returns:
+            Template or None if not found
+        """
+        entry = self._entry(project_id)
+        template = entry.by_name.get(name)
+
+        # Template may have been created since the last load
+        if template is None and entry.age > self.miss_refresh_after:
+            template = self.refresh(project_id).by_name.get(name)
+
+        return template
+
+    def find(self, project_id: int, substring: str) -> Optional[Dict[str, Any]]:
+        """
+        Resolve first template whose lowercase name contains substring
+
+        Args:
+            project_id: Project ID
+            substring: Case-insensitive name fragment (e.g. "health")
+
+        Returns:
+            Template or None if not found
+        """
+        needle = substring.lower()
+        entry = self._entry(project_id)
+
+        if needle not in entry.by_substring:
+            entry.by_substring[needle] = next(
+                (t for lower_name, t in entry.lower_names if needle in lower_name),
+                None
+            )
+
+        return entry.by_substring[needle]
+
+    def resolve_id(self, project_id: int, name: str) -> Optional[int]:
+        """
+        Resolve template ID by exact name
+
+        Args:
+            project_id: Project ID
+            name: Template name
+
+        Returns:
+            Template ID or None if not found
+        """
+        template = self.get(project_id, name)
+        return template.get('id') if template else None
+
+    def names(self, project_id: int) -> List[str]:
+        """Get all template names of a project"""
+        return list(self._entry(project_id).by_name)
+
+    def templates(self, project_id: int) -> List[Dict[str, Any]]:
+        """Get all templates of a project"""
+        return list(self._entry(project_id).templates)
+
+    # ═══════════════════════════════════════════════════════════
+    # MAINTENANCE
+    # ═══════════════════════════════════════════════════════════
+
+    def refresh(self, project_id: int) -> _ProjectTemplates:
+        """
+        Reload templates of a project
+
+        Args:
+            project_id: Project ID
+
+        Returns:
+            Fresh project entry
+        """
+        entry = _ProjectTemplates(self.client.get_templates(project_id))
+
+        with self._lock:
+            self._projects[project_id] = entry
+
+        return entry
+
+    def invalidate(self, project_id: Optional[int] = None) -> None:
+        """
+        Drop cached templates
+
+        Args:
+            project_id: Project to invalidate (None = all projects)
+        """
+        with self._lock:
+            if project_id is None:
+                self._projects.clear()
+            else:
+                self._projects.pop(project_id, None)
+
+    def _entry(self, project_id: int) -> _ProjectTemplates:
+        """Get project entry, reloading or scheduling a refresh as needed"""
+        with self._lock:
+            entry = self._projects.get(project_id)
+
+        if entry is None or entry.age > self.ttl:
+            return self.refresh(project_id)
+
+        if entry.age > self.refresh_after:
+            self._refresh_in_background(project_id)
+
+        return entry
+
+    def _refresh_in_background(self, project_id: int) -> None:
+        """Start one background reload per project"""
+        with self._lock:
+            if project_id in self._refreshing:
+                return
+            self._refreshing.add(project_id)
+
+        def _run():
+            try:
+                self.refresh(project_id)
+            except Exception as e:
+                logger.warning(f"Background template refresh failed for project {project_id}: {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(project_id)
+
+        threading.Thread(
+            target=_run,
+            name=f"semaphore-templates-{project_id}",
+            daemon=True
+        ).start()
+
+
+# ═══════════════════════════════════════════════════════════
+# SHARED INDEXES
+# ═══════════════════════════════════════════════════════════
+
+_indexes: Dict[Tuple[str, str], TemplateIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_template_index(client: Any) -> TemplateIndex:
+    """
+    Get process-wide template index for a Semaphore instance
+
+    Indexes are shared per base URL and token, so a fresh client per click
+    still hits a warm cache. The newest client is used for reloading.
+
+    Args:
+        client: SemaphoreAPI client
+
+    Returns:
+        TemplateIndex
+    """
+    key = client.client_key
+
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = TemplateIndex(client)
+            _indexes[key] = index
+        else:
+            index.client = client
+        return index
@@ -0,0 +1,308 @@
+"""
+Semaphore Task Watcher
+One shared Background Poller for all watched Tasks
+"""
+
+import time
+import threading
+import logging
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .semaphore_api import SemaphoreAPIError, TERMINAL_STATUSES
+from .semaphore_polling import PollPolicy
+
+logger = logging.getLogger(__name__)
+
+
+class _Watch:
+    """One watched task"""
+
+    __slots__ = ('future', 'callbacks', 'deadline', 'last_task', 'watchers')
+
+    def __init__(self, deadline: Optional[float]):
+        self.future: Future = Future()
+        self.callbacks: List[Callable[[Dict[str, Any]], None]] = []
+        self.deadline = deadline
+        self.last_task: Optional[Dict[str, Any]] = None
+        self.watchers = 0
+
+
+class TaskWatcher:
+    """
+    Multiplexed task watcher
+
+    A single background worker polls every watched task in one batched
+    cycle: one task-list request per project, plus individual requests only
+    for tasks that have dropped out of the list window. The request rate is
+    therefore constant in the number of watched tasks.
+
+    Completion is delivered through futures and optional callbacks:
+
+        watcher = get_task_watcher(client)
+        future = watcher.watch(project_id, task_id)
+        task = future.result(timeout=600)
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        policy: Optional[PollPolicy] = None,
+        list_limit: int = 100
+    ):
+        """
+        Initialize task watcher
+
+        Args:
+            client: SemaphoreAPI client
+            policy: Polling policy for the cycle interval; fast polling
+                restarts whenever a new task is watched
+            list_limit: Tasks requested per project list call
+        """
+        self.client = client
+        self.schedule = PollPolicy.resolve(policy).schedule()
+        self.list_limit = list_limit
+
+        self._watches: Dict[Tuple[int, int], _Watch] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.cycles = 0
+        self.requests = 0
+
+    # ═══════════════════════════════════════════════════════════
+    # PUBLIC API
+    # ═══════════════════════════════════════════════════════════
+
+    def watch(
+        self,
+        project_id: int,
+        task_id: int,
+        callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        timeout: Optional[float] = None
+    ) -> Future:
+        """
+        Watch a task until it reaches a terminal state
+
+        Callers watching the same task share one future; its deadline is
+        the latest requested one, and none if any caller passed no timeout.
+
+        Args:
+            project_id: Project ID
+            task_id: Task ID
+            callback: Called with the final task payload
+            timeout: Fail the future with SemaphoreAPIError after this many seconds
+
+        Returns:
+            Future resolving to the final task payload
+        """
+        key = (project_id, task_id)
+        deadline = time.monotonic() + timeout if timeout else None
+
+        with self._lock:
+            watch = self._watches.get(key)
+            if watch is None:
+                watch = _Watch(deadline)
+                self._watches[key] = watch
+            elif deadline is None:
+                watch.deadline = None
+            elif watch.deadline is not None and deadline > watch.deadline:
+                watch.deadline = deadline
+
+            watch.watchers += 1
+            if callback:
+                watch.callbacks.append(callback)
+
+            self.schedule.reset()
+            self._ensure_running()
+
+        return watch.future
+
+    def unwatch(
+        self,
+        project_id: int,
+        task_id: int,
+        callback: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> None:
+        """
+        Drop one caller's interest in a task
+
+        The shared future is cancelled only when no other caller is still
+        watching the task.
+
+        Args:
+            project_id: Project ID
+            task_id: Task ID
+            callback: Callback passed to watch() (removed if given)
+        """
+        with self._lock:
+            watch = self._watches.get((project_id, task_id))
+            if watch is None:
+                return
+            if callback in watch.callbacks:
+                watch.callbacks.remove(callback)
+            watch.watchers -= 1
+            if watch.watchers > 0:
+                return
+            del self._watches[(project_id, task_id)]
+        watch.future.cancel()
+
+    def last_known(self, project_id: int, task_id: int) -> Optional[Dict[str, Any]]:
+        """Get last polled payload of a watched task"""
+        with self._lock:
+            watch = self._watches.get((project_id, task_id))
+            return watch.last_task if watch else None
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get watcher statistics
+
+        Returns:
+            Dict with watched task count, poll cycles and request count
+        """
+        with self._lock:
+            return {
+                'watched': len(self._watches),
+                'cycles': self.cycles,
+                'requests': self.requests,
+                'running': self._thread is not None
+            }
+
+    # ═══════════════════════════════════════════════════════════
+    # WORKER
+    # ═══════════════════════════════════════════════════════════
+
+    def _ensure_running(self) -> None:
+        """Start the worker thread (lock must be held)"""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run,
+                name="semaphore-task-watcher",
+                daemon=True
+            )
+            self._thread.start()
+        self._wakeup.set()
+
+    def _run(self) -> None:
+        """Poll until nothing is watched anymore"""
+        while True:
+            with self._lock:
+                if not self._watches:
+                    self._thread = None
+                    return
+                by_project: Dict[int, List[int]] = {}
+                for project_id, task_id in self._watches:
+                    by_project.setdefault(project_id, []).append(task_id)
+
+            self._wakeup.clear()
+
+            activity = False
+            for project_id, task_ids in by_project.items():
+                try:
+                    activity |= self._poll_project(project_id, task_ids)
+                except Exception as e:
+                    logger.warning(f"Task watcher poll failed for project {project_id}: {e}")
+
+            self._expire()
+            self.cycles += 1
+
+            self._wakeup.wait(self.schedule.next_interval(activity))
+
+    def _poll_project(self, project_id: int, task_ids: List[int]) -> bool:
+        """
+        Refresh all watched tasks of one project in one batched cycle
+
+        Returns:
+            True if any watched task changed status
+        """
+        activity = False
+        limit = max(self.list_limit, len(task_ids))
+        tasks = {t.get('id'): t for t in self.client.get_tasks(project_id, limit=limit)}
+        self.requests += 1
+
+        # Tasks older than the list window are fetched individually
+        missing = [task_id for task_id in task_ids if task_id not in tasks]
+        if missing:
+            tasks.update(self.client.get_tasks_batch(project_id, missing))
+            self.requests += len(missing)
+
+        for task_id in task_ids:
+            task = tasks.get(task_id)
+            if task is None:
+                continue
+
+            with self._lock:
+                watch = self._watches.get((project_id, task_id))
+                if watch is None:
+                    continue
+                previous = watch.last_task
+                watch.last_task = task
+                if previous is not None and previous.get('status') != task.get('status'):
+                    activity = True
+                if task.get('status') not in TERMINAL_STATUSES:
+                    continue
+                del self._watches[(project_id, task_id)]
+
+            self._complete(watch, task)
+            activity = True
+
+        return activity
+
+    def _expire(self) -> None:
+        """Fail watches whose deadline has passed"""
+        now = time.monotonic()
+
+        with self._lock:
+            expired = [
+                (key, watch) for key, watch in self._watches.items()
+                if watch.deadline is not None and now >= watch.deadline
+            ]
+            for key, _ in expired:
+                del self._watches[key]
+
+        for (_, task_id), watch in expired:
+            if watch.future.set_running_or_notify_cancel():
+                watch.future.set_exception(SemaphoreAPIError(f"Task {task_id} timeout while watching"))
+
+    @staticmethod
+    def _complete(watch: _Watch, task: Dict[str, Any]) -> None:
+        """Resolve future and run callbacks"""
+        if not watch.future.set_running_or_notify_cancel():
+            return
+
+        watch.future.set_result(task)
+
+        for callback in watch.callbacks:
+            try:
+                callback(task)
+            except Exception as e:
+                logger.warning(f"Task watcher callback failed: {e}")
+
+
+# ═══════════════════════════════════════════════════════════
+# SHARED WATCHERS
+# ═══════════════════════════════════════════════════════════
+
+_watchers: Dict[Tuple[str, str], TaskWatcher] = {}
+_watchers_lock = threading.Lock()
+
+
+def get_task_watcher(client: Any) -> TaskWatcher:
+    """
+    Get process-wide task watcher for a Semaphore instance
+
+    Args:
+        client: SemaphoreAPI client
+
+    Returns:
+        TaskWatcher
+    """
+    key = client.client_key
+
+    with _watchers_lock:
+        watcher = _watchers.get(key)
+        if watcher is None:
+            watcher = TaskWatcher(client)
+            _watchers[key] = watcher
+        return watcher
@@ -0,0 +1,161 @@
+"""
+Single Flight
+Coalescing of concurrent identical Read Calls across Streamlit Sessions
+"""
+
+import copy
+import threading
+import logging
+from typing import Any, Callable, Dict, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class _Call:
+    """One in-flight call and its outcome"""
+
+    __slots__ = ('done', 'result', 'error', 'waiters')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Share one in-flight call between concurrent identical requests
+
+    While a call for a key runs, further callers with the same key wait
+    for it and receive (a copy of) its result or its exception instead of
+    issuing their own call. Nothing is cached: the next call after
+    completion runs again, so results are never staler than one call.
+
+        flight = get_single_flight('docker')
+        containers = flight.do(('ps', '-a'), lambda: run_docker_ps('-a'))
+    """
+
+    def __init__(self, name: str, copy_results: bool = True):
+        """
+        Initialize single-flight group
+
+        Args:
+            name: Group name (used in stats)
+            copy_results: Hand waiting callers a deep copy of the result, so
+                callers may mutate what they receive
+        """
+        self.name = name
+        self.copy_results = copy_results
+
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+        self.calls = 0
+        self.executed = 0
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Run fn, or join an identical call that is already running
+
+        Args:
+            key: Identity of the request (hashable)
+            fn: Call to execute when no identical call is in flight
+
+        Returns:
+            Result of fn (shared by all concurrent callers)
+
+        Raises:
+            Whatever fn raised (re-raised in every waiting caller)
+        """
+        with self._lock:
+            self.calls += 1
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self.coalesced += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self.executed += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result) if self.copy_results else call.result
+
+        result = None
+        try:
+            result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+                waiters = call.waiters
+            # Waiters copy from a private snapshot, the leader keeps the original
+            if waiters and call.error is None:
+                call.result = copy.deepcopy(result) if self.copy_results else result
+            call.done.set()
+
+        return result
+
+    def in_flight(self) -> int:
+        """Number of keys with a running call"""
+        with self._lock:
+            return len(self._calls)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get coalescing statistics
+
+        Returns:
+            Dict with calls, executed and coalesced counts and the coalescing ratio
+        """
+        with self._lock:
+            return {
+                'name': self.name,
+                'calls': self.calls,
+                'executed': self.executed,
+                'coalesced': self.coalesced,
+                'in_flight': len(self._calls),
+                'coalesced_ratio': self.coalesced / self.calls if self.calls else 0.0
+            }
+
+
+# ═══════════════════════════════════════════════════════════
+# SHARED GROUPS
+# ═══════════════════════════════════════════════════════════
+
+_groups: Dict[str, SingleFlight] = {}
+_groups_lock = threading.Lock()
+
+
+def get_single_flight(name: str) -> SingleFlight:
+    """
+    Get process-wide single-flight group (e.g. 'semaphore', 'docker')
+
+    Args:
+        name: Group name
+
+    Returns:
+        SingleFlight
+    """
+    with _groups_lock:
+        group = _groups.get(name)
+        if group is None:
+            group = SingleFlight(name)
+            _groups[name] = group
+        return group
+
+
+def single_flight_stats() -> Dict[str, Dict[str, Any]]:
+    """Stats of all single-flight groups by name"""
+    with _groups_lock:
+        groups = list(_groups.values())
+    return {group.name: group.stats() for group in groups}
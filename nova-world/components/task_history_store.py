@@ -0,0 +1,376 @@
+"""
+Task History Store
+Local SQLite Mirror of Semaphore Task History
+"""
+
+import json
+import time
+import sqlite3
+import threading
+import logging
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .semaphore_api import TERMINAL_STATUSES, SemaphoreAPIError, summarize_task
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = Path(__file__).parent.parent / '.nova' / 'task_history.db'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    project_id INTEGER NOT NULL,
+    id INTEGER NOT NULL,
+    template_id INTEGER,
+    status TEXT,
+    created TEXT,
+    start TEXT,
+    end TEXT,
+    duration_seconds REAL,
+    message TEXT,
+    payload TEXT,
+    synced_at REAL,
+    PRIMARY KEY (project_id, id)
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_template ON tasks (project_id, template_id, id DESC);
+CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks (project_id, status, id DESC);
+CREATE INDEX IF NOT EXISTS idx_tasks_start ON tasks (project_id, start);
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    project_id INTEGER PRIMARY KEY,
+    max_id INTEGER NOT NULL DEFAULT 0,
+    synced_at REAL
+);
+"""
+
+COLUMNS = 'project_id, id, template_id, status, created, start, end, duration_seconds, message, payload, synced_at'
+
+
+class TaskHistoryStore:
+    """
+    SQLite (WAL) mirror of Semaphore task history
+
+    ``sync()`` fetches only tasks newer than the highest stored ID (pages
+    are requested lazily via ``iter_tasks``) and re-fetches tasks stored
+    while still running. History views read from local queries and keep
+    working while Semaphore is slow or unreachable.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initialize task history store
+
+        Args:
+            path: SQLite database file (default: .nova/task_history.db, ':memory:' for tests)
+        """
+        self.path = str(path or DEFAULT_DB_PATH)
+        if self.path != ':memory:':
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        # One connection shared across Streamlit script threads
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        self._syncing: set = set()
+
+        # Bumped on every write, lets readers cache derived data
+        self.revision = 0
+
+        with self._lock:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.executescript(SCHEMA)
+
+    # ═══════════════════════════════════════════════════════════
+    # SYNC
+    # ═══════════════════════════════════════════════════════════
+
+    def sync(
+        self,
+        client: Any,
+        project_id: int,
+        page_size: int = 50
+    ) -> Dict[str, Any]:
+        """
+        Pull new tasks and refresh unfinished ones
+
+        Args:
+            client: SemaphoreAPI client
+            project_id: Project ID
+            page_size: Tasks per list request
+
+        Returns:
+            Dict with new/updated counts and the highest stored task ID
+        """
+        max_id = self.max_id(project_id)
+
+        new_tasks = []
+        for task in client.iter_tasks(project_id, page_size=page_size):
+            if task['id'] <= max_id:
+                break
+            new_tasks.append(task)
+
+        unfinished = [
+            task_id for task_id in self._unfinished_ids(project_id)
+            if task_id <= max_id
+        ]
+        refreshed = client.get_tasks_batch(project_id, unfinished) if unfinished else {}
+
+        self.upsert(project_id, new_tasks + list(refreshed.values()))
+
+        return {
+            'new': len(new_tasks),
+            'updated': len(refreshed),
+            'max_id': self.max_id(project_id)
+        }
+
+    def sync_in_background(
+        self,
+        client: Any,
+        project_id: int,
+        then: Optional[Callable[[Any, int], None]] = None
+    ) -> bool:
+        """
+        Start one background sync per project
+
+        Args:
+            client: SemaphoreAPI client
+            project_id: Project ID
+            then: Called with (client, project_id) after a successful sync
+                on the same thread (e.g. to archive finished logs)
+
+        Returns:
+            False if a sync for this project is already running
+        """
+        with self._lock:
+            if project_id in self._syncing:
+                return False
+            self._syncing.add(project_id)
+
+        def _run():
+            try:
+                self.sync(client, project_id)
+                if then is not None:
+                    then(client, project_id)
+            except SemaphoreAPIError as e:
+                logger.warning(f"Task history sync failed for project {project_id}: {e}")
+            except Exception as e:
+                logger.exception(f"Task history sync crashed for project {project_id}: {e}")
+            finally:
+                with self._lock:
+                    self._syncing.discard(project_id)
+
+        threading.Thread(
+            target=_run,
+            name=f"task-history-sync-{project_id}",
+            daemon=True
+        ).start()
+        return True
+
+    def is_syncing(self, project_id: int) -> bool:
+        """True while a background sync for the project runs"""
+        with self._lock:
+            return project_id in self._syncing
+
+    def upsert(self, project_id: int, tasks: List[Dict[str, Any]]) -> None:
+        """
+        Insert or replace tasks
+
+        Args:
+            project_id: Project ID
+            tasks: Task payloads as returned by Semaphore
+        """
+        now = time.time()
+        rows = [self._row(project_id, task, now) for task in tasks if task.get('id')]
+
+        with self._lock, self._conn:
+            if rows:
+                self._conn.executemany(
+                    f'INSERT OR REPLACE INTO tasks ({COLUMNS}) VALUES ({", ".join("?" * 11)})',
+                    rows
+                )
+                self.revision += 1
+            self._conn.execute(
+                """
+                INSERT INTO sync_state (project_id, max_id, synced_at)
+                VALUES (?, COALESCE((SELECT MAX(id) FROM tasks WHERE project_id = ?), 0), ?)
+                ON CONFLICT(project_id) DO UPDATE SET
+                    max_id = excluded.max_id,
+                    synced_at = excluded.synced_at
+                """,
+                (project_id, project_id, now)
+            )
+
+    # ═══════════════════════════════════════════════════════════
+    # QUERIES
+    # ═══════════════════════════════════════════════════════════
+
+    def recent(
+        self,
+        project_id: int,
+        limit: int = 10,
+        template_id: Optional[int] = None,
+        status: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get latest tasks as status summaries (same shape as get_recent_tasks)
+
+        Args:
+            project_id: Project ID
+            limit: Maximum number of tasks
+            template_id: Only tasks of this template
+            status: Only tasks with this status
+
+        Returns:
+            List of task summaries, newest first
+        """
+        where, params = self._filters(project_id, template_id, status)
+        rows = self._query(
+            f'SELECT payload FROM tasks WHERE {where} ORDER BY id DESC LIMIT ?',
+            params + [limit]
+        )
+        return [summarize_task(json.loads(row['payload'])) for row in rows]
+
+    def status_counts(
+        self,
+        project_id: int,
+        template_id: Optional[int] = None
+    ) -> Dict[str, int]:
+        """
+        Count tasks per status
+
+        Args:
+            project_id: Project ID
+            template_id: Only tasks of this template
+
+        Returns:
+            Dict status → count
+        """
+        where, params = self._filters(project_id, template_id, None)
+        rows = self._query(
+            f'SELECT status, COUNT(*) AS n FROM tasks WHERE {where} GROUP BY status',
+            params
+        )
+        return {row['status']: row['n'] for row in rows}
+
+    def columns(self, project_id: int) -> Dict[str, List[Any]]:
+        """
+        Get raw task columns for columnar analytics (ordered by ID)
+
+        Args:
+            project_id: Project ID
+
+        Returns:
+            Dict with id, template_id, status, start and end lists
+            (timestamps as ISO strings without trailing 'Z')
+        """
+        rows = self._query(
+            """
+            SELECT id, template_id, status, REPLACE(start, 'Z', ''), REPLACE(end, 'Z', '')
+            FROM tasks WHERE project_id = ? ORDER BY id
+            """,
+            [project_id]
+        )
+        names = ('id', 'template_id', 'status', 'start', 'end')
+        if not rows:
+            return {name: [] for name in names}
+        return {name: list(values) for name, values in zip(names, zip(*rows))}
+
+    def max_id(self, project_id: int) -> int:
+        """Highest stored task ID of a project (0 if empty)"""
+        rows = self._query('SELECT max_id FROM sync_state WHERE project_id = ?', [project_id])
+        return rows[0]['max_id'] if rows else 0
+
+    def last_sync(self, project_id: int) -> Optional[float]:
+        """Unix time of the last successful sync (None if never synced)"""
+        rows = self._query('SELECT synced_at FROM sync_state WHERE project_id = ?', [project_id])
+        return rows[0]['synced_at'] if rows else None
+
+    def count(self, project_id: int) -> int:
+        """Number of stored tasks of a project"""
+        return self._query('SELECT COUNT(*) AS n FROM tasks WHERE project_id = ?', [project_id])[0]['n']
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+
+    # ═══════════════════════════════════════════════════════════
+    # INTERNALS
+    # ═══════════════════════════════════════════════════════════
+
+    def _unfinished_ids(self, project_id: int) -> List[int]:
+        placeholders = ', '.join('?' * len(TERMINAL_STATUSES))
+        rows = self._query(
+            f'SELECT id FROM tasks WHERE project_id = ? AND status NOT IN ({placeholders})',
+            [project_id, *TERMINAL_STATUSES]
+        )
+        return [row['id'] for row in rows]
+
+    def _query(self, sql: str, params: List[Any]) -> List[sqlite3.Row]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    @staticmethod
+    def _filters(
+        project_id: int,
+        template_id: Optional[int],
+        status: Optional[str]
+    ) -> Tuple[str, List[Any]]:
+        clauses = ['project_id = ?']
+        params: List[Any] = [project_id]
+        if template_id is not None:
+            clauses.append('template_id = ?')
+            params.append(template_id)
+        if status is not None:
+            clauses.append('status = ?')
+            params.append(status)
+        return ' AND '.join(clauses), params
+
+    @staticmethod
+    def _row(project_id: int, task: Dict[str, Any], synced_at: float) -> Tuple[Any, ...]:
+        summary = summarize_task(task)
+        return (
+            project_id,
+            task['id'],
+            task.get('template_id'),
+            task.get('status'),
+            task.get('created'),
+            task.get('start'),
+            task.get('end'),
+            summary['duration_seconds'],
+            task.get('message', ''),
+            json.dumps(task),
+            synced_at
+        )
+
+
+# ═══════════════════════════════════════════════════════════
+# SHARED STORE
+# ═══════════════════════════════════════════════════════════
+
+_store: Optional[TaskHistoryStore] = None
+_store_lock = threading.Lock()
+
+
+def get_task_history_store(path: Optional[str] = None) -> TaskHistoryStore:
+    """
+    Get process-wide task history store
+
+    Args:
+        path: Database file (if None, reads semaphore.history_db from secrets)
+
+    Returns:
+        TaskHistoryStore
+    """
+    global _store
+    with _store_lock:
+        if _store is None:
+            if path is None:
+                try:
+                    import streamlit as st
+                    path = st.secrets.get("semaphore", {}).get("history_db")
+                except Exception:
+                    path = None
+            _store = TaskHistoryStore(path)
+        return _store
@@ -0,0 +1,495 @@
+"""
+Task Log Archive
+Block-compressed On-disk Archive of finished Task Output with Line Index
+"""
+
+import os
+import json
+import time
+import zlib
+import sqlite3
+import threading
+import logging
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from .semaphore_api import TERMINAL_STATUSES
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ARCHIVE_DIR = Path(__file__).parent.parent / '.nova' / 'task_logs'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS archives (
+    project_id INTEGER NOT NULL,
+    task_id INTEGER NOT NULL,
+    status TEXT,
+    lines INTEGER NOT NULL,
+    block_lines INTEGER NOT NULL,
+    raw_bytes INTEGER NOT NULL,
+    stored_bytes INTEGER NOT NULL,
+    archived_at REAL NOT NULL,
+    PRIMARY KEY (project_id, task_id)
+);
+CREATE INDEX IF NOT EXISTS idx_archives_age ON archives (archived_at);
+
+CREATE TABLE IF NOT EXISTS blocks (
+    project_id INTEGER NOT NULL,
+    task_id INTEGER NOT NULL,
+    block INTEGER NOT NULL,
+    offset INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    PRIMARY KEY (project_id, task_id, block)
+);
+"""
+
+
+class TaskLogArchive:
+    """
+    Compressed archive of finished task logs
+
+    Each log is stored in its own file as a sequence of independently
+    zlib-compressed blocks of ``block_lines`` lines. The block index
+    (byte offset and length per block) lives in SQLite, so any line range
+    is read with one seek and by decompressing only the blocks it spans.
+
+    Storage is bounded by a retention policy (maximum age and total size);
+    the oldest archives are dropped first.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        block_lines: int = 256,
+        retention_days: Optional[float] = 90,
+        max_bytes: Optional[int] = 500 * 1024 * 1024,
+        compression_level: int = 6
+    ):
+        """
+        Initialize task log archive
+
+        Args:
+            path: Archive directory (default: .nova/task_logs)
+            block_lines: Lines per compressed block
+            retention_days: Drop archives older than this (None = keep forever)
+            max_bytes: Upper bound for stored (compressed) bytes (None = unbounded)
+            compression_level: zlib level 1-9
+        """
+        self.path = Path(path or DEFAULT_ARCHIVE_DIR)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.block_lines = max(1, block_lines)
+        self.retention_days = retention_days
+        self.max_bytes = max_bytes
+        self.compression_level = compression_level
+
+        self._conn = sqlite3.connect(str(self.path / 'index.db'), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        self._archiving: set = set()
+
+        with self._lock:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.executescript(SCHEMA)
+
+    # ═══════════════════════════════════════════════════════════
+    # WRITING
+    # ═══════════════════════════════════════════════════════════
+
+    def archive_task(
+        self,
+        client: Any,
+        project_id: int,
+        task_id: int,
+        status: Optional[str] = None
+    ) -> bool:
+        """
+        Fetch and archive the output of a finished task
+
+        Args:
+            client: SemaphoreAPI client
+            project_id: Project ID
+            task_id: Task ID
+            status: Known task status (fetched if None)
+
+        Returns:
+            True if the log was archived, False if already archived or not finished
+        """
+        if self.has(project_id, task_id):
+            return False
+
+        if status is None:
+            status = client.get_task(project_id, task_id).get('status')
+        if status not in TERMINAL_STATUSES:
+            return False
+
+        entries = client.get_task_output(project_id, task_id)
+        self.write(project_id, task_id, entries or [], status=status)
+        return True
+
+    def archive_missing(
+        self,
+        client: Any,
+        project_id: int,
+        tasks: List[Dict[str, Any]],
+        limit: int = 20
+    ) -> int:
+        """
+        Archive finished tasks that are not archived yet
+
+        Args:
+            client: SemaphoreAPI client
+            project_id: Project ID
+            tasks: Candidate tasks (summaries or payloads, newest first)
+            limit: Maximum number of logs fetched in this call
+
+        Returns:
+            Number of archived logs
+        """
+        archived = 0
+
+        for task in tasks:
+            if archived >= limit:
+                break
+
+            task_id = task.get('task_id', task.get('id'))
+            status = task.get('status')
+            if task_id is None or status not in TERMINAL_STATUSES or self.has(project_id, task_id):
+                continue
+
+            with self._lock:
+                if (project_id, task_id) in self._archiving:
+                    continue
+                self._archiving.add((project_id, task_id))
+
+            try:
+                if self.archive_task(client, project_id, task_id, status=status):
+                    archived += 1
+            finally:
+                with self._lock:
+                    self._archiving.discard((project_id, task_id))
+
+        if archived:
+            self.enforce_retention()
+
+        return archived
+
+    def write(
+        self,
+        project_id: int,
+        task_id: int,
+        entries: List[Dict[str, Any]],
+        status: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Write a complete task log (replaces an existing archive)
+
+        Args:
+            project_id: Project ID
+            task_id: Task ID
+            entries: Output entries as returned by Semaphore
+            status: Final task status
+
+        Returns:
+            Archive metadata
+        """
+        file_path = self._file(project_id, task_id)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = file_path.with_suffix('.tmp')
+
+        blocks = []
+        raw_bytes = 0
+        offset = 0
+
+        with open(tmp_path, 'wb') as f:
+            for start in range(0, len(entries), self.block_lines):
+                raw = '\n'.join(
+                    json.dumps([entry.get('time'), entry.get('output', '')], ensure_ascii=False)
+                    for entry in entries[start:start + self.block_lines]
+                ).encode('utf-8')
+                data = zlib.compress(raw, self.compression_level)
+                f.write(data)
+
+                blocks.append((project_id, task_id, len(blocks), offset, len(data)))
+                raw_bytes += len(raw)
+                offset += len(data)
+
+        os.replace(tmp_path, file_path)
+
+        meta = {
+            'project_id': project_id,
+            'task_id': task_id,
+            'status': status,
+            'lines': len(entries),
+            'block_lines': self.block_lines,
+            'raw_bytes': raw_bytes,
+            'stored_bytes': offset,
+            'archived_at': time.time()
+        }
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                'DELETE FROM blocks WHERE project_id = ? AND task_id = ?',
+                (project_id, task_id)
+            )
+            self._conn.executemany(
+                'INSERT INTO blocks (project_id, task_id, block, offset, length) VALUES (?, ?, ?, ?, ?)',
+                blocks
+            )
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO archives
+                    (project_id, task_id, status, lines, block_lines, raw_bytes, stored_bytes, archived_at)
+                VALUES (:project_id, :task_id, :status, :lines, :block_lines, :raw_bytes, :stored_bytes, :archived_at)
+                """,
+                meta
+            )
+
+        return meta
+
+    # ═══════════════════════════════════════════════════════════
+    # READING
+    # ═══════════════════════════════════════════════════════════
+
+    def has(self, project_id: int, task_id: int) -> bool:
+        """True if the task log is archived"""
+        return self.info(project_id, task_id) is not None
+
+    def info(self, project_id: int, task_id: int) -> Optional[Dict[str, Any]]:
+        """Archive metadata of a task (None if not archived)"""
+        rows = self._query(
+            'SELECT * FROM archives WHERE project_id = ? AND task_id = ?',
+            [project_id, task_id]
+        )
+        return dict(rows[0]) if rows else None
+
+    def read_lines(
+        self,
+        project_id: int,
+        task_id: int,
+        start: int = 0,
+        count: int = 100
+    ) -> List[Dict[str, Any]]:
+        """
+        Read a line range of an archived log
+
+        Args:
+            project_id: Project ID
+            task_id: Task ID
+            start: First line (0-based)
+            count: Number of lines
+
+        Returns:
+            Entries with line (0-based), time and output; empty if not archived
+        """
+        meta = self.info(project_id, task_id)
+        if meta is None or count <= 0 or start >= meta['lines']:
+            return []
+
+        start = max(0, start)
+        end = min(start + count, meta['lines'])
+        block_lines = meta['block_lines']
+        first_block = start // block_lines
+        last_block = (end - 1) // block_lines
+
+        blocks = self._query(
+            """
+            SELECT block, offset, length FROM blocks
+            WHERE project_id = ? AND task_id = ? AND block BETWEEN ? AND ?
+            ORDER BY block
+            """,
+            [project_id, task_id, first_block, last_block]
+        )
+        if not blocks:
+            return []
+
+        # Blocks are contiguous on disk: one seek, one read
+        base = blocks[0]['offset']
+        with open(self._file(project_id, task_id), 'rb') as f:
+            f.seek(base)
+            data = f.read(blocks[-1]['offset'] + blocks[-1]['length'] - base)
+
+        entries = []
+        for block in blocks:
+            chunk = data[block['offset'] - base:block['offset'] - base + block['length']]
+            line_no = block['block'] * block_lines
+            for raw in zlib.decompress(chunk).decode('utf-8').split('\n'):
+                if start <= line_no < end:
+                    timestamp, output = json.loads(raw)
+                    entries.append({'line': line_no, 'time': timestamp, 'output': output})
+                line_no += 1
+
+        return entries
+
+    def iter_lines(
+        self,
+        project_id: int,
+        task_id: int,
+        start: int = 0
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over an archived log block by block (constant memory)
+
+        Args:
+            project_id: Project ID
+            task_id: Task ID
+            start: First line (0-based)
+
+        Yields:
+            Entries with line, time and output
+        """
+        meta = self.info(project_id, task_id)
+        if meta is None:
+            return
+
+        chunk = meta['block_lines']
+        line = start
+        while line < meta['lines']:
+            yield from self.read_lines(project_id, task_id, line, chunk)
+            line += chunk
+
+    def list_archives(
+        self,
+        project_id: int,
+        limit: int = 50
+    ) -> List[Dict[str, Any]]:
+        """Archived tasks of a project, newest first"""
+        rows = self._query(
+            'SELECT * FROM archives WHERE project_id = ? ORDER BY task_id DESC LIMIT ?',
+            [project_id, limit]
+        )
+        return [dict(row) for row in rows]
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get archive size statistics
+
+        Returns:
+            Dict with archive count, lines, raw and stored bytes, compression ratio
+        """
+        row = self._query(
+            """
+            SELECT COUNT(*) AS archives, COALESCE(SUM(lines), 0) AS lines,
+                   COALESCE(SUM(raw_bytes), 0) AS raw_bytes,
+                   COALESCE(SUM(stored_bytes), 0) AS stored_bytes
+            FROM archives
+            """,
+            []
+        )[0]
+        stats = dict(row)
+        stats['compression_ratio'] = (
+            stats['raw_bytes'] / stats['stored_bytes'] if stats['stored_bytes'] else 0.0
+        )
+        return stats
+
+    # ═══════════════════════════════════════════════════════════
+    # RETENTION
+    # ═══════════════════════════════════════════════════════════
+
+    def enforce_retention(self) -> int:
+        """
+        Drop archives beyond the retention policy (oldest first)
+
+        Returns:
+            Number of removed archives
+        """
+        doomed = []
+
+        if self.retention_days is not None:
+            cutoff = time.time() - self.retention_days * 86400
+            doomed += [
+                (row['project_id'], row['task_id'])
+                for row in self._query(
+                    'SELECT project_id, task_id FROM archives WHERE archived_at < ?',
+                    [cutoff]
+                )
+            ]
+
+        if self.max_bytes is not None:
+            total = self.stats()['stored_bytes']
+            if total > self.max_bytes:
+                for row in self._query(
+                    'SELECT project_id, task_id, stored_bytes FROM archives ORDER BY archived_at',
+                    []
+                ):
+                    if total <= self.max_bytes:
+                        break
+                    key = (row['project_id'], row['task_id'])
+                    if key not in doomed:
+                        doomed.append(key)
+                    total -= row['stored_bytes']
+
+        for project_id, task_id in doomed:
+            self.delete(project_id, task_id)
+
+        return len(doomed)
+
+    def delete(self, project_id: int, task_id: int) -> None:
+        """Remove an archived log"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                'DELETE FROM blocks WHERE project_id = ? AND task_id = ?',
+                (project_id, task_id)
+            )
+            self._conn.execute(
+                'DELETE FROM archives WHERE project_id = ? AND task_id = ?',
+                (project_id, task_id)
+            )
+
+        try:
+            self._file(project_id, task_id).unlink()
+        except FileNotFoundError:
+            pass
+
+    def close(self) -> None:
+        """Close the index database"""
+        with self._lock:
+            self._conn.close()
+
+    # ═══════════════════════════════════════════════════════════
+    # INTERNALS
+    # ═══════════════════════════════════════════════════════════
+
+    def _file(self, project_id: int, task_id: int) -> Path:
+        return self.path / str(project_id) / f"{task_id}.zlog"
+
+    def _query(self, sql: str, params: List[Any]) -> List[sqlite3.Row]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+
+# ═══════════════════════════════════════════════════════════
+# SHARED ARCHIVE
+# ═══════════════════════════════════════════════════════════
+
+_archive: Optional[TaskLogArchive] = None
+_archive_lock = threading.Lock()
+
+
+def get_task_log_archive() -> TaskLogArchive:
+    """
+    Get process-wide task log archive
+
+    Reads semaphore.log_archive_dir, semaphore.log_retention_days and
+    semaphore.log_archive_max_mb from secrets if available.
+
+    Returns:
+        TaskLogArchive
+    """
+    global _archive
+    with _archive_lock:
+        if _archive is None:
+            config = {}
+            try:
+                import streamlit as st
+                config = st.secrets.get("semaphore", {})
+            except Exception:
+                pass
+
+            max_mb = config.get("log_archive_max_mb", 500)
+            _archive = TaskLogArchive(
+                path=config.get("log_archive_dir"),
+                retention_days=config.get("log_retention_days", 90),
+                max_bytes=int(max_mb * 1024 * 1024) if max_mb else None
+            )
+        return _archive
@@ -0,0 +1,423 @@
+"""
+Task Log Search
+Positional Inverted Index over archived Task Output
+"""
+
+import re
+import sqlite3
+import threading
+import logging
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .ansible_output_parser import strip_ansi
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INDEX_PATH = Path(__file__).parent.parent / '.nova' / 'task_logs' / 'search.db'
+
+# Words and runs of punctuation ("FAILED! =>" → failed, !, =>)
+TOKEN_PATTERN = re.compile(r'\w+|[^\w\s]+')
+
+# Banner filler like "*****" or "-----" carries no meaning
+FILLER_PATTERN = re.compile(r'^([^\w\s])\1{3,}$')
+
+# Bumped when tokenize() changes; older indexes are dropped and rebuilt from the archive
+TOKENIZER_VERSION = 1
+
+# Separates ordered phrases in a query ("FAILED! => ... paperless")
+GAP = '...'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS terms (
+    id INTEGER PRIMARY KEY,
+    term TEXT NOT NULL UNIQUE,
+    lines INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS postings (
+    term_id INTEGER NOT NULL,
+    project_id INTEGER NOT NULL,
+    task_id INTEGER NOT NULL,
+    line INTEGER NOT NULL,
+    positions TEXT NOT NULL,
+    PRIMARY KEY (term_id, project_id, task_id, line)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_postings_task ON postings (project_id, task_id);
+
+CREATE TABLE IF NOT EXISTS task_terms (
+    term_id INTEGER NOT NULL,
+    project_id INTEGER NOT NULL,
+    task_id INTEGER NOT NULL,
+    PRIMARY KEY (term_id, project_id, task_id)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS indexed_tasks (
+    project_id INTEGER NOT NULL,
+    task_id INTEGER NOT NULL,
+    lines INTEGER NOT NULL,
+    PRIMARY KEY (project_id, task_id)
+);
+"""
+
+
+def tokenize(text: str) -> List[Tuple[int, str]]:
+    """
+    Split a log line into (position, token) pairs
+
+    ANSI colour codes are removed and tokens are lowercased; filler runs
+    are dropped without shifting the positions of the following tokens,
+    so index and query agree.
+    """
+    if '\x1b' in text:
+        text = strip_ansi(text)
+    tokens = []
+    position = 0
+    for match in TOKEN_PATTERN.finditer(text.lower()):
+        token = match.group()
+        if FILLER_PATTERN.match(token):
+            continue
+        tokens.append((position, token))
+        position += 1
+    return tokens
+
+
+def parse_query(query: str) -> List[List[str]]:
+    """
+    Parse a query into ordered phrases
+
+    "FAILED! => ... paperless" → [['failed', '!', '=>'], ['paperless']]
+    """
+    phrases = []
+    for segment in query.split(GAP):
+        tokens = [token for _, token in tokenize(segment)]
+        if tokens:
+            phrases.append(tokens)
+    return phrases
+
+
+class TaskLogIndex:
+    """
+    Positional inverted index over archived task logs
+
+    Every (term, task, line) gets one posting holding the token positions
+    within the line. A query is a sequence of phrases that must occur in
+    order on the same line. Candidate tasks are those containing every
+    query term (per-task term table); they are scanned newest first, so
+    the search stops as soon as ``limit`` lines matched. Within a task,
+    candidate lines come from the rarest term and phrase order is verified
+    from the stored positions.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initialize log index
+
+        Args:
+            path: SQLite database file (default: .nova/task_logs/search.db)
+        """
+        self.path = str(path or DEFAULT_INDEX_PATH)
+        if self.path != ':memory:':
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._term_ids: Dict[str, int] = {}
+
+        with self._lock:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.executescript(SCHEMA)
+
+            version = self._conn.execute('PRAGMA user_version').fetchone()[0]
+            if version < TOKENIZER_VERSION:
+                # Terms of an older tokenizer would never match new queries
+                self._conn.executescript(
+                    "DELETE FROM postings; DELETE FROM task_terms; "
+                    "DELETE FROM indexed_tasks; DELETE FROM terms;"
+                )
+                self._conn.execute(f'PRAGMA user_version = {TOKENIZER_VERSION}')
+                self._conn.commit()
+
+    # ═══════════════════════════════════════════════════════════
+    # INDEXING
+    # ═══════════════════════════════════════════════════════════
+
+    def index_task(
+        self,
+        project_id: int,
+        task_id: int,
+        entries: Iterable[Dict[str, Any]]
+    ) -> int:
+        """
+        Index one task log (replaces an existing index of the task)
+
+        Args:
+            project_id: Project ID
+            task_id: Task ID
+            entries: Log entries with line and output (e.g. TaskLogArchive.iter_lines)
+
+        Returns:
+            Number of indexed lines
+        """
+        if task_id in self.indexed_tasks(project_id):
+            self.remove_task(project_id, task_id)
+
+        postings: Dict[Tuple[str, int], List[int]] = defaultdict(list)
+        lines = 0
+        for number, entry in enumerate(entries):
+            line = entry.get('line', number)
+            for position, token in tokenize(str(entry.get('output', ''))):
+                postings[(token, line)].append(position)
+            lines += 1
+
+        with self._lock, self._conn:
+            rows = []
+            line_counts: Dict[int, int] = defaultdict(int)
+            for (token, line), positions in postings.items():
+                term_id = self._term_id(token)
+                line_counts[term_id] += 1
+                rows.append((term_id, project_id, task_id, line, ','.join(map(str, positions))))
+
+            self._conn.executemany(
+                'INSERT INTO postings (term_id, project_id, task_id, line, positions) VALUES (?, ?, ?, ?, ?)',
+                rows
+            )
+            self._conn.executemany(
+                'UPDATE terms SET lines = lines + ? WHERE id = ?',
+                [(count, term_id) for term_id, count in line_counts.items()]
+            )
+            self._conn.executemany(
+                'INSERT INTO task_terms (term_id, project_id, task_id) VALUES (?, ?, ?)',
+                [(term_id, project_id, task_id) for term_id in line_counts]
+            )
+            self._conn.execute(
+                'INSERT OR REPLACE INTO indexed_tasks (project_id, task_id, lines) VALUES (?, ?, ?)',
+                (project_id, task_id, lines)
+            )
+
+        return lines
+
+    def index_archived(
+        self,
+        archive: Any,
+        project_id: int,
+        limit: int = 20
+    ) -> int:
+        """
+        Index archived logs that are not indexed yet, and drop index entries
+        of logs removed by the archive's retention
+
+        Args:
+            archive: TaskLogArchive
+            project_id: Project ID
+            limit: Maximum number of logs indexed in this call
+
+        Returns:
+            Number of newly indexed logs
+        """
+        archived = {a['task_id'] for a in archive.list_archives(project_id, limit=1_000_000)}
+        indexed = self.indexed_tasks(project_id)
+
+        for task_id in indexed - archived:
+            self.remove_task(project_id, task_id)
+
+        pending = sorted(archived - indexed, reverse=True)[:limit]
+        for task_id in pending:
+            self.index_task(project_id, task_id, archive.iter_lines(project_id, task_id))
+
+        return len(pending)
+
+    def remove_task(self, project_id: int, task_id: int) -> None:
+        """Drop all postings of a task"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                UPDATE terms SET lines = lines - (
+                    SELECT COUNT(*) FROM postings
+                    WHERE postings.term_id = terms.id AND project_id = ? AND task_id = ?
+                )
+                WHERE id IN (SELECT term_id FROM postings WHERE project_id = ? AND task_id = ?)
+                """,
+                (project_id, task_id, project_id, task_id)
+            )
+            self._conn.execute(
+                'DELETE FROM postings WHERE project_id = ? AND task_id = ?',
+                (project_id, task_id)
+            )
+            self._conn.execute(
+                'DELETE FROM task_terms WHERE project_id = ? AND task_id = ?',
+                (project_id, task_id)
+            )
+            self._conn.execute(
+                'DELETE FROM indexed_tasks WHERE project_id = ? AND task_id = ?',
+                (project_id, task_id)
+            )
+
+    def indexed_tasks(self, project_id: int) -> set:
+        """IDs of indexed tasks of a project"""
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT task_id FROM indexed_tasks WHERE project_id = ?',
+                (project_id,)
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    # ═══════════════════════════════════════════════════════════
+    # SEARCH
+    # ═══════════════════════════════════════════════════════════
+
+    def search(
+        self,
+        query: str,
+        project_id: Optional[int] = None,
+        limit: int = 100
+    ) -> List[Dict[str, Any]]:
+        """
+        Find log lines matching a query
+
+        Args:
+            query: Phrases in order, separated by "..." (e.g. "FAILED! => ... paperless")
+            project_id: Restrict to one project
+            limit: Maximum number of matching lines
+
+        Returns:
+            Matches with project_id, task_id and line (0-based), newest task first
+        """
+        phrases = parse_query(query)
+        if not phrases:
+            return []
+
+        terms = {token for phrase in phrases for token in phrase}
+
+        with self._lock:
+            rows = self._conn.execute(
+                f'SELECT term, id, lines FROM terms WHERE term IN ({", ".join("?" * len(terms))})',
+                list(terms)
+            ).fetchall()
+
+        if len(rows) < len(terms):
+            return []  # a term never occurs
+
+        term_ids = {term: term_id for term, term_id, _ in rows}
+        rarest = min(rows, key=lambda row: row[2])[1]
+        phrase_ids = [[term_ids[token] for token in phrase] for phrase in phrases]
+
+        project_clause = 'AND project_id = ?' if project_id is not None else ''
+        project_params = [project_id] if project_id is not None else []
+        id_list = ', '.join('?' * len(term_ids))
+
+        # Tasks containing every term, newest first
+        with self._lock:
+            tasks = self._conn.execute(
+                f"""
+                SELECT project_id, task_id FROM task_terms
+                WHERE term_id IN ({id_list}) {project_clause}
+                GROUP BY project_id, task_id
+                HAVING COUNT(*) = ?
+                ORDER BY task_id DESC, project_id
+                """,
+                [*term_ids.values(), *project_params, len(term_ids)]
+            ).fetchall()
+
+        # Candidate lines from the rarest term, other terms only for those lines
+        sql = f"""
+            SELECT p.term_id, p.line, p.positions
+            FROM postings c
+            JOIN postings p
+              ON p.term_id IN ({id_list})
+             AND p.project_id = c.project_id
+             AND p.task_id = c.task_id
+             AND p.line = c.line
+            WHERE c.term_id = ? AND c.project_id = ? AND c.task_id = ?
+        """
+
+        matches = []
+        for pid, task_id in tasks:
+            with self._lock:
+                postings = self._conn.execute(
+                    sql,
+                    [*term_ids.values(), rarest, pid, task_id]
+                ).fetchall()
+
+            lines: Dict[int, Dict[int, set]] = defaultdict(dict)
+            for term_id, line, positions in postings:
+                lines[line][term_id] = {int(p) for p in positions.split(',')}
+
+            for line in sorted(lines):
+                if _matches(phrase_ids, lines[line]):
+                    matches.append({'project_id': pid, 'task_id': task_id, 'line': line})
+                    if len(matches) >= limit:
+                        return matches
+
+        return matches
+
+    def stats(self) -> Dict[str, int]:
+        """Get index size (tasks, terms, postings)"""
+        with self._lock:
+            tasks = self._conn.execute('SELECT COUNT(*) FROM indexed_tasks').fetchone()[0]
+            terms = self._conn.execute('SELECT COUNT(*) FROM terms').fetchone()[0]
+            postings = self._conn.execute('SELECT COUNT(*) FROM postings').fetchone()[0]
+        return {'tasks': tasks, 'terms': terms, 'postings': postings}
+
+    def close(self) -> None:
+        """Close the index database"""
+        with self._lock:
+            self._conn.close()
+
+    def _term_id(self, term: str) -> int:
+        """Get or create term ID (lock must be held)"""
+        term_id = self._term_ids.get(term)
+        if term_id is None:
+            self._conn.execute('INSERT OR IGNORE INTO terms (term) VALUES (?)', (term,))
+            term_id = self._conn.execute('SELECT id FROM terms WHERE term = ?', (term,)).fetchone()[0]
+            self._term_ids[term] = term_id
+        return term_id
+
+
+def _matches(phrases: List[List[int]], positions: Dict[int, set]) -> bool:
+    """Check that all phrases occur in order, each as consecutive tokens"""
+    cursor = -1
+    for phrase in phrases:
+        if any(term_id not in positions for term_id in phrase):
+            return False
+
+        starts = sorted(
+            start for start in positions[phrase[0]]
+            if start > cursor and all(start + i in positions[t] for i, t in enumerate(phrase))
+        )
+        if not starts:
+            return False
+        cursor = starts[0] + len(phrase) - 1
+    return True
+
+
+# ═══════════════════════════════════════════════════════════
+# SHARED INDEX
+# ═══════════════════════════════════════════════════════════
+
+_index: Optional[TaskLogIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_task_log_index() -> TaskLogIndex:
+    """
+    Get process-wide task log index
+
+    Returns:
+        TaskLogIndex
+    """
+    global _index
+    with _index_lock:
+        if _index is None:
+            path = None
+            try:
+                import streamlit as st
+                archive_dir = st.secrets.get("semaphore", {}).get("log_archive_dir")
+                if archive_dir:
+                    path = str(Path(archive_dir) / 'search.db')
+            except Exception:
+                pass
+            _index = TaskLogIndex(path)
+        return _index
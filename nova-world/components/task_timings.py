@@ -0,0 +1,331 @@
+"""
+Task Timings
+Per-(Role, Task) Duration History and Slow-Task Regression Detection
+"""
+
+import csv
+import io
+import sqlite3
+import statistics
+import threading
+import logging
+from datetime import datetime, timezone
+from itertools import groupby
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .ansible_output_parser import AnsibleOutputParser
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = Path(__file__).parent.parent / '.nova' / 'task_timings.db'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    project_id INTEGER NOT NULL,
+    task_id INTEGER NOT NULL,
+    started_at REAL,
+    duration REAL,
+    tasks INTEGER NOT NULL,
+    failed INTEGER NOT NULL,
+    PRIMARY KEY (project_id, task_id)
+);
+
+CREATE TABLE IF NOT EXISTS timings (
+    project_id INTEGER NOT NULL,
+    task_id INTEGER NOT NULL,
+    play TEXT NOT NULL,
+    role TEXT NOT NULL,
+    task TEXT NOT NULL,
+    duration REAL NOT NULL,
+    failed INTEGER NOT NULL,
+    started_at REAL,
+    PRIMARY KEY (project_id, task_id, play, role, task)
+);
+CREATE INDEX IF NOT EXISTS idx_timings_task ON timings (project_id, role, task, started_at);
+"""
+
+REGRESSION_FIELDS = (
+    'role', 'task', 'task_id', 'started_at', 'duration', 'baseline', 'ratio', 'delta_seconds', 'samples'
+)
+
+
+class TaskTimingStore:
+    """
+    SQLite (WAL) history of playbook task durations
+
+    Each Semaphore task is parsed once (see AnsibleOutputParser) and its
+    per-(role, task) wall-clock times are stored. The history outlives
+    the log archive's retention, so baselines stay available.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initialize timing store
+
+        Args:
+            path: SQLite database file (default: .nova/task_timings.db, ':memory:' for tests)
+        """
+        self.path = str(path or DEFAULT_DB_PATH)
+        if self.path != ':memory:':
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+
+        with self._lock:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.executescript(SCHEMA)
+
+    # ═══════════════════════════════════════════════════════════
+    # RECORDING
+    # ═══════════════════════════════════════════════════════════
+
+    def record(self, project_id: int, task_id: int, parser: AnsibleOutputParser) -> int:
+        """
+        Store the task timings of one parsed run (replaces earlier records)
+
+        Args:
+            project_id: Project ID
+            task_id: Semaphore task ID
+            parser: Parser that consumed the complete output
+
+        Returns:
+            Number of stored playbook tasks
+        """
+        started_at = parser.started_at
+        duration = (
+            parser.last_seen - parser.started_at
+            if parser.started_at is not None and parser.last_seen is not None else None
+        )
+
+        rows = [
+            (
+                project_id, task_id, stats.play, stats.role or '', stats.name, stats.duration,
+                int(bool(stats.results['failed'] or stats.results['unreachable'])), started_at
+            )
+            for stats in parser.tasks.values()
+        ]
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                'DELETE FROM timings WHERE project_id = ? AND task_id = ?',
+                (project_id, task_id)
+            )
+            self._conn.executemany(
+                """
+                INSERT INTO timings (project_id, task_id, play, role, task, duration, failed, started_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                rows
+            )
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO runs (project_id, task_id, started_at, duration, tasks, failed)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (project_id, task_id, started_at, duration, len(rows), int(parser.failed))
+            )
+
+        return len(rows)
+
+    def record_archived(self, archive: Any, project_id: int, limit: int = 20) -> int:
+        """
+        Parse archived logs that have no timings yet (newest first)
+
+        Args:
+            archive: TaskLogArchive
+            project_id: Project ID
+            limit: Maximum number of logs parsed in this call
+
+        Returns:
+            Number of newly recorded runs
+        """
+        archived = {a['task_id'] for a in archive.list_archives(project_id, limit=1_000_000)}
+        pending = sorted(archived - self.recorded_tasks(project_id), reverse=True)[:limit]
+
+        for task_id in pending:
+            parser = AnsibleOutputParser().feed_many(archive.iter_lines(project_id, task_id))
+            parser.finish()
+            self.record(project_id, task_id, parser)
+
+        return len(pending)
+
+    def recorded_tasks(self, project_id: int) -> set:
+        """IDs of Semaphore tasks with recorded timings"""
+        rows = self._query('SELECT task_id FROM runs WHERE project_id = ?', [project_id])
+        return {row['task_id'] for row in rows}
+
+    # ═══════════════════════════════════════════════════════════
+    # QUERIES
+    # ═══════════════════════════════════════════════════════════
+
+    def history(
+        self,
+        project_id: int,
+        role: str,
+        task: str,
+        limit: int = 50
+    ) -> List[Dict[str, Any]]:
+        """
+        Durations of one playbook task, newest first
+
+        Args:
+            project_id: Project ID
+            role: Role name ('' for tasks outside a role)
+            task: Task name
+
+        Returns:
+            List of dicts with task_id, started_at, duration and failed
+        """
+        rows = self._query(
+            """
+            SELECT task_id, started_at, SUM(duration) AS duration, MAX(failed) AS failed
+            FROM timings WHERE project_id = ? AND role = ? AND task = ?
+            GROUP BY task_id ORDER BY started_at DESC LIMIT ?
+            """,
+            [project_id, role, task, limit]
+        )
+        return [dict(row) for row in rows]
+
+    def detect_regressions(
+        self,
+        project_id: int,
+        factor: float = 3.0,
+        baseline_days: float = 7.0,
+        baseline_runs: int = 10,
+        min_samples: int = 3,
+        min_seconds: float = 10.0
+    ) -> List[Dict[str, Any]]:
+        """
+        Find playbook tasks whose latest run is much slower than their baseline
+
+        The baseline of a (role, task) is the median of up to
+        ``baseline_runs`` earlier successful runs within ``baseline_days``
+        before its latest run. Failed runs are ignored on both sides.
+
+        Args:
+            project_id: Project ID
+            factor: Minimum latest / baseline ratio
+            baseline_days: Rolling baseline window
+            baseline_runs: Maximum runs in the baseline
+            min_samples: Minimum runs in the baseline
+            min_seconds: Minimum absolute slowdown (filters noise of quick tasks)
+
+        Returns:
+            List of regressions (see REGRESSION_FIELDS), largest slowdown first
+        """
+        # A task can run in several plays of one run; durations are summed
+        rows = self._query(
+            """
+            SELECT role, task, task_id, started_at, SUM(duration) AS duration
+            FROM timings
+            WHERE project_id = ? AND failed = 0 AND started_at IS NOT NULL
+            GROUP BY role, task, task_id
+            ORDER BY role, task, started_at
+            """,
+            [project_id]
+        )
+
+        window = baseline_days * 86400
+        regressions = []
+
+        for (role, task), group in groupby(rows, key=lambda row: (row['role'], row['task'])):
+            runs = list(group)
+            latest = runs[-1]
+
+            baseline = [
+                row['duration'] for row in runs[:-1]
+                if row['started_at'] >= latest['started_at'] - window
+            ][-baseline_runs:]
+            if len(baseline) < min_samples:
+                continue
+
+            median = statistics.median(baseline)
+            delta = latest['duration'] - median
+            if delta < min_seconds or latest['duration'] < factor * median:
+                continue
+
+            regressions.append({
+                'role': role or None,
+                'task': task,
+                'task_id': latest['task_id'],
+                'started_at': _iso(latest['started_at']),
+                'duration': latest['duration'],
+                'baseline': median,
+                'ratio': latest['duration'] / median if median > 0 else None,
+                'delta_seconds': delta,
+                'samples': len(baseline)
+            })
+
+        regressions.sort(key=lambda r: r['delta_seconds'], reverse=True)
+        return regressions
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+
+    def _query(self, sql: str, params: List[Any]) -> List[sqlite3.Row]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+
+# ═══════════════════════════════════════════════════════════
+# HELPERS
+# ═══════════════════════════════════════════════════════════
+
+def regressions_to_csv(regressions: List[Dict[str, Any]]) -> str:
+    """
+    Export regressions as CSV
+
+    Args:
+        regressions: Result of TaskTimingStore.detect_regressions
+
+    Returns:
+        CSV text with a header row
+    """
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=REGRESSION_FIELDS, extrasaction='ignore')
+    writer.writeheader()
+    writer.writerows(regressions)
+    return buffer.getvalue()
+
+
+def _iso(timestamp: Optional[float]) -> Optional[str]:
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat(timespec='seconds')
+
+
+# ═══════════════════════════════════════════════════════════
+# SHARED STORE
+# ═══════════════════════════════════════════════════════════
+
+_store: Optional[TaskTimingStore] = None
+_store_lock = threading.Lock()
+
+
+def get_task_timing_store(path: Optional[str] = None) -> TaskTimingStore:
+    """
+    Get process-wide task timing store
+
+    Args:
+        path: Database file (if None, reads semaphore.timings_db from secrets)
+
+    Returns:
+        TaskTimingStore
+    """
+    global _store
+    with _store_lock:
+        if _store is None:
+            if path is None:
+                try:
+                    import streamlit as st
+                    path = st.secrets.get("semaphore", {}).get("timings_db")
+                except Exception:
+                    path = None
+            _store = TaskTimingStore(path)
+        return _store
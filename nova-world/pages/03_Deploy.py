@@ -4,7 +4,6 @@ Ansible Profile Management
 """
 
 import streamlit as st
-from datetime import datetime
 
 st.set_page_config(
     page_title="Deployment",
@@ -27,6 +26,11 @@ st.divider()
 
 st.markdown("### 📋 Deployment Profiles")
 
+from components.quick_actions_semaphore import get_profile_duration_estimates
+
+# Real durations from the local task history (p50/p95), static fallback
+duration_estimates = get_profile_duration_estimates()
+
 col1, col2, col3 = st.columns(3)
 
 with col1:
@@ -39,9 +43,8 @@ with col1:
         - ✅ System-Setup
         - ✅ Docker Installation
         - ✅ Basis-Container
-        
-        **Dauer:** ~5 Minuten
         """)
+        st.markdown(f"**Dauer:** {duration_estimates.get('minimal', '~5 Minuten')}")
         
         if st.button("🚀 Deploy Minimal", use_container_width=True, type="primary", key="deploy_minimal"):
             from components.quick_actions import get_quick_actions
@@ -68,9 +71,8 @@ with col2:
         - ✅ Alle Core-Apps
         - ✅ Monitoring
         - ✅ Backups
-        
-        **Dauer:** ~15 Minuten
         """)
+        st.markdown(f"**Dauer:** {duration_estimates.get('standard', '~15 Minuten')}")
         
         if st.button("🚀 Deploy Standard", use_container_width=True, type="primary", key="deploy_standard"):
             from components.quick_actions import get_quick_actions
@@ -97,9 +99,8 @@ with col3:
         - ✅ Alle optionalen Apps
         - ✅ Advanced Features
         - ✅ Full Monitoring
-        
-        **Dauer:** ~30 Minuten
         """)
+        st.markdown(f"**Dauer:** {duration_estimates.get('full', '~30 Minuten')}")
         
         if st.button("🚀 Deploy Full", use_container_width=True, type="primary", key="deploy_full"):
             from components.quick_actions import get_quick_actions
@@ -115,6 +116,11 @@ with col3:
                 else:
                     st.error(f"Fehler: {result.get('error')}")
 
+with st.expander("⏳ Deployment-Warteschlange"):
+    from components.quick_actions_semaphore import render_deploy_queue
+    
+    render_deploy_queue()
+
 st.divider()
 
 # ═══════════════════════════════════════════════════════════
@@ -153,39 +159,32 @@ with col2:
     if st.button("🔄 Status aktualisieren", use_container_width=True):
         st.rerun()
 
+if semaphore_status.get("success"):
+    from components.quick_actions_semaphore import render_semaphore_status_widget
+    
+    render_semaphore_status_widget()
+
 st.divider()
 
 # ═══════════════════════════════════════════════════════════
-# 📜 DEPLOYMENT HISTORY (Mock)
+# 📜 DEPLOYMENT HISTORY
 # ═══════════════════════════════════════════════════════════
 
 st.markdown("### 📜 Recent Deployments")
 
-st.info("""
-**Deployment-Historie** wird angezeigt, sobald Semaphore API vollständig integriert ist.
+from components.quick_actions_semaphore import render_recent_deployments
 
-**Geplante Features:**
-- ✅ Job-Historie
-- ✅ Deployment-Logs
-- ✅ Success/Failure-Status
-- ✅ Deployment-Dauer
-- ✅ Rollback-Option
-""")
+render_recent_deployments(limit=10)
 
-# Mock Data
-with st.expander("📋 Beispiel-Deployment"):
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.metric("Status", "✅ Success")
+with st.expander("📈 Deployment Analytics"):
+    from components.quick_actions_semaphore import render_deployment_analytics
     
-    with col2:
-        st.metric("Dauer", "12m 34s")
-    
-    with col3:
-        st.metric("Profile", "Standard")
+    render_deployment_analytics()
+
+with st.expander("🐢 Task-Regressionen"):
+    from components.quick_actions_semaphore import render_task_regressions
     
-    st.caption(f"Zeitpunkt: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    render_task_regressions()
 
 st.divider()
 
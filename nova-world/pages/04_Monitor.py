@@ -6,7 +6,6 @@ Real-time Metrics & Alerts
 import streamlit as st
 import psutil
 from datetime import datetime
-import time
 
 st.set_page_config(
     page_title="Monitoring",
@@ -277,7 +276,8 @@ with st.sidebar:
     
     if auto_refresh:
         st.info("Auto-Refresh aktiv")
-        time.sleep(30)
+        # Returns early when a container changes state (event cache)
+        qa.docker_wait_for_change(docker_status.get("version"), timeout=30)
         st.rerun()
     
     st.divider()
@@ -58,6 +58,10 @@ if docker_status.get("success"):
             st.metric("Status", "🟡 Teilweise")
         else:
             st.metric("Status", "🔴 Alle gestoppt")
+    
+    unhealthy = docker_status.get("containers", {}).get("unhealthy", [])
+    if unhealthy:
+        st.warning(f"⚠️ Unhealthy: {', '.join(unhealthy)}")
 
 else:
     st.error(f"Fehler beim Laden: {docker_status.get('error')}")
@@ -70,20 +74,34 @@ st.divider()
 
 st.markdown("### 🎮 Quick Actions")
 
+
+def lifecycle_progress(label: str):
+    """Progress bar callback for the parallel start/stop/restart actions"""
+    bar = st.progress(0.0, text=label)
+    
+    def on_result(result):
+        icon = "✅" if result["success"] else ("⏱️" if result["timed_out"] else "❌")
+        bar.progress(
+            result["done"] / result["total"],
+            text=f"{label} {result['done']}/{result['total']} · {icon} {result['container']}"
+        )
+    
+    return on_result
+
+
 col1, col2, col3, col4 = st.columns(4)
 
 with col1:
     if st.button("▶️ Start All", use_container_width=True, type="primary"):
-        with st.spinner("Starte Container..."):
-            result = qa.docker_start_all()
-            
-            if result["success"]:
-                st.success(result["message"])
-                if result.get("started"):
-                    st.caption(f"Started: {', '.join(result['started'])}")
-                st.rerun()
-            else:
-                st.error(f"Fehler: {result.get('error')}")
+        result = qa.docker_start_all(on_result=lifecycle_progress("Starte Container..."))
+        
+        if result["success"]:
+            st.success(result["message"])
+            if result.get("started"):
+                st.caption(f"Started: {', '.join(result['started'])}")
+            st.rerun()
+        else:
+            st.error(f"Fehler: {result.get('error')}")
 
 with col2:
     if st.button("⏹️ Stop All", use_container_width=True, type="secondary"):
@@ -92,14 +110,13 @@ with col2:
             st.session_state.confirm_stop_all = False
         
         if st.session_state.confirm_stop_all:
-            with st.spinner("Stoppe Container..."):
-                result = qa.docker_stop_all()
-                
-                if result["success"]:
-                    st.warning(result["message"])
-                    st.rerun()
-                else:
-                    st.error(f"Fehler: {result.get('error')}")
+            result = qa.docker_stop_all(on_result=lifecycle_progress("Stoppe Container..."))
+            
+            if result["success"]:
+                st.warning(result["message"])
+                st.rerun()
+            else:
+                st.error(f"Fehler: {result.get('error')}")
             
             st.session_state.confirm_stop_all = False
         else:
@@ -108,14 +125,13 @@ with col2:
 
 with col3:
     if st.button("🔄 Restart All", use_container_width=True):
-        with st.spinner("Starte Container neu..."):
-            result = qa.docker_restart_all()
-            
-            if result["success"]:
-                st.info(result["message"])
-                st.rerun()
-            else:
-                st.error(f"Fehler: {result.get('error')}")
+        result = qa.docker_restart_all(on_result=lifecycle_progress("Starte Container neu..."))
+        
+        if result["success"]:
+            st.info(result["message"])
+            st.rerun()
+        else:
+            st.error(f"Fehler: {result.get('error')}")
 
 with col4:
     if st.button("🧹 Cleanup", use_container_width=True):
@@ -152,47 +168,29 @@ if docker_status.get("success"):
                 
                 with col1:
                     if st.button("⏹️ Stop", key=f"stop_{container}", use_container_width=True):
-                        import subprocess
-                        result = subprocess.run(
-                            ["docker", "stop", container],
-                            capture_output=True,
-                            text=True,
-                            timeout=10
-                        )
+                        result = qa.docker_container_action(container, "stop")
                         
-                        if result.returncode == 0:
+                        if result["success"]:
                             st.success(f"✅ {container} gestoppt")
                             st.rerun()
                         else:
-                            st.error(f"Fehler: {result.stderr}")
+                            st.error(f"Fehler: {result['error']}")
                 
                 with col2:
                     if st.button("🔄 Restart", key=f"restart_{container}", use_container_width=True):
-                        import subprocess
-                        result = subprocess.run(
-                            ["docker", "restart", container],
-                            capture_output=True,
-                            text=True,
-                            timeout=10
-                        )
+                        result = qa.docker_container_action(container, "restart")
                         
-                        if result.returncode == 0:
+                        if result["success"]:
                             st.success(f"✅ {container} neugestartet")
                             st.rerun()
                         else:
-                            st.error(f"Fehler: {result.stderr}")
+                            st.error(f"Fehler: {result['error']}")
                 
                 with col3:
                     if st.button("📜 Logs", key=f"logs_{container}", use_container_width=True):
-                        import subprocess
-                        result = subprocess.run(
-                            ["docker", "logs", "--tail", "50", container],
-                            capture_output=True,
-                            text=True,
-                            timeout=5
-                        )
+                        result = qa.docker_logs(container, tail=50)
                         
-                        st.code(result.stdout + result.stderr)
+                        st.code(result["output"] or result.get("error", ""))
     else:
         st.info("Keine laufenden Container")
     
@@ -210,31 +208,19 @@ if docker_status.get("success"):
                 
                 with col1:
                     if st.button("▶️ Start", key=f"start_{container}", use_container_width=True):
-                        import subprocess
-                        result = subprocess.run(
-                            ["docker", "start", container],
-                            capture_output=True,
-                            text=True,
-                            timeout=5
-                        )
+                        result = qa.docker_container_action(container, "start")
                         
-                        if result.returncode == 0:
+                        if result["success"]:
                             st.success(f"✅ {container} gestartet")
                             st.rerun()
                         else:
-                            st.error(f"Fehler: {result.stderr}")
+                            st.error(f"Fehler: {result['error']}")
                 
                 with col2:
                     if st.button("📜 Logs", key=f"logs_stopped_{container}", use_container_width=True):
-                        import subprocess
-                        result = subprocess.run(
-                            ["docker", "logs", "--tail", "50", container],
-                            capture_output=True,
-                            text=True,
-                            timeout=5
-                        )
+                        result = qa.docker_logs(container, tail=50)
                         
-                        st.code(result.stdout + result.stderr)
+                        st.code(result["output"] or result.get("error", ""))
     else:
         st.info("Keine gestoppten Container")
 
@@ -303,8 +289,26 @@ with st.sidebar:
     if st.button("🔄 Aktualisieren", use_container_width=True):
         st.rerun()
     
+    live_view = st.checkbox(
+        "📡 Live",
+        disabled=not docker_status.get("live"),
+        help="Aktualisiert nur, wenn sich ein Container ändert (Docker Events)"
+    )
+    
+    live_caption = st.empty()
+    
     st.divider()
     
     st.markdown("### 🔙 Navigation")
     st.page_link("nova_universe.py", label="🏠 Home")
     st.page_link("pages/01_🏠_Home.py", label="📊 Dashboard")
+
+# ═══════════════════════════════════════════════════════════
+# 📡 LIVE VIEW (last: the page is fully rendered while waiting)
+# ═══════════════════════════════════════════════════════════
+
+if live_view and docker_status.get("live"):
+    # Re-render only on a new state version; short waits keep clicks responsive
+    while not qa.docker_wait_for_change(docker_status.get("version"), timeout=1.0):
+        live_caption.caption(f"📡 Keine Änderung · {datetime.now().strftime('%H:%M:%S')}")
+    st.rerun()
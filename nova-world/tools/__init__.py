@@ -0,0 +1 @@
+# Nova-World Dashboard - Developer Tools
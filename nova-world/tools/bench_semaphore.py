@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+Semaphore Client Benchmark
+Throughput, Latency and Transfer of SemaphoreAPI against the local Simulator
+
+Scenarios:
+    recent_tasks   get_recent_tasks() on a project with running tasks
+    stream_logs    run_task() + stream_task_logs() until completion
+    wait_for_task  run_task() + wait_for_task()
+
+Usage (from nova-world/):
+    python -m tools.bench_semaphore
+    python -m tools.bench_semaphore --latency 0.02 --json bench.json
+    python -m tools.bench_semaphore --baseline bench.json
+"""
+
+import json
+import time
+import argparse
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+from components.semaphore_api import SemaphoreAPI, SemaphoreAPIError
+from components.semaphore_polling import DEFAULT_POLL_POLICY, PollPolicy
+from tools.semaphore_sim import SemaphoreSimulator, build_arg_parser, config_from_args
+
+PROJECT_ID = 1
+TOKEN = 'bench-token'
+
+SCENARIOS = ('recent_tasks', 'stream_logs', 'wait_for_task')
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile (0 for no values)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def scaled_policy(scale: float) -> PollPolicy:
+    """Default poll policy with all intervals multiplied by scale"""
+    policy = DEFAULT_POLL_POLICY
+    return PollPolicy(
+        initial=policy.initial * scale,
+        fast_window=policy.fast_window * scale,
+        max_interval=policy.max_interval * scale,
+        multiplier=policy.multiplier,
+        jitter=policy.jitter
+    )
+
+
+class Benchmark:
+    """Runs client scenarios against one simulator and collects metrics"""
+
+    def __init__(
+        self,
+        sim: SemaphoreSimulator,
+        concurrency: int = 4,
+        policy: Optional[PollPolicy] = None
+    ):
+        """
+        Initialize benchmark
+
+        Args:
+            sim: Running simulator
+            concurrency: Parallel workers per scenario
+            policy: Poll policy for stream_logs / wait_for_task
+        """
+        self.sim = sim
+        self.concurrency = concurrency
+        self.policy = policy or DEFAULT_POLL_POLICY
+
+    def client(self) -> SemaphoreAPI:
+        """Fresh client with its own connection pool"""
+        return SemaphoreAPI(self.sim.base_url, TOKEN, timeout=10)
+
+    def run(self, name: str, iterations: int) -> Dict[str, Any]:
+        """
+        Run one scenario
+
+        Args:
+            name: Scenario name (see SCENARIOS)
+            iterations: Number of scenario calls (spread over workers)
+
+        Returns:
+            Metrics dict
+        """
+        client = self.client()
+        call = getattr(self, f'_scenario_{name}')
+        prepare = getattr(self, f'_prepare_{name}', None)
+        if prepare:
+            prepare(client)
+
+        return self._measure(name, lambda: call(client), iterations)
+
+    # ═══════════════════════════════════════════════════════════
+    # SCENARIOS
+    # ═══════════════════════════════════════════════════════════
+
+    def _prepare_recent_tasks(self, client: SemaphoreAPI) -> None:
+        # A few running tasks, so the active-task refresh is exercised too
+        template_id = self.sim.templates[PROJECT_ID][0]['id']
+        for _ in range(3):
+            self.sim.create_task(PROJECT_ID, template_id)
+
+    def _scenario_recent_tasks(self, client: SemaphoreAPI) -> int:
+        return len(client.get_recent_tasks(PROJECT_ID, limit=10))
+
+    def _scenario_stream_logs(self, client: SemaphoreAPI) -> int:
+        task = self._start_task(client)
+        lines = client.stream_task_logs(PROJECT_ID, task['id'], policy=self.policy)
+        return sum(1 for _ in lines)
+
+    def _scenario_wait_for_task(self, client: SemaphoreAPI) -> int:
+        task = self._start_task(client)
+        client.wait_for_task(PROJECT_ID, task['id'], timeout=120, policy=self.policy)
+        return 1
+
+    def _start_task(self, client: SemaphoreAPI) -> Dict[str, Any]:
+        template_id = self.sim.templates[PROJECT_ID][1 % len(self.sim.templates[PROJECT_ID])]['id']
+        return client.run_task(PROJECT_ID, template_id)
+
+    # ═══════════════════════════════════════════════════════════
+    # MEASUREMENT
+    # ═══════════════════════════════════════════════════════════
+
+    def _measure(
+        self,
+        name: str,
+        call: Callable[[], int],
+        iterations: int
+    ) -> Dict[str, Any]:
+        latencies: List[float] = []
+        errors = 0
+        items = 0
+        lock = threading.Lock()
+        remaining = [iterations]
+
+        def worker():
+            nonlocal errors, items
+            while True:
+                with lock:
+                    if remaining[0] <= 0:
+                        return
+                    remaining[0] -= 1
+
+                started = time.perf_counter()
+                try:
+                    count = call()
+                    failed = False
+                except SemaphoreAPIError:
+                    count = 0
+                    failed = True
+                elapsed = time.perf_counter() - started
+
+                with lock:
+                    latencies.append(elapsed)
+                    items += count
+                    errors += failed
+
+        self.sim.reset_stats()
+        wall_start = time.perf_counter()
+
+        workers = [
+            threading.Thread(target=worker, daemon=True)
+            for _ in range(max(1, min(self.concurrency, iterations)))
+        ]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+
+        wall = time.perf_counter() - wall_start
+        server = self.sim.stats()
+
+        return {
+            'scenario': name,
+            'calls': len(latencies),
+            'errors': errors,
+            'items': items,
+            'wall_seconds': wall,
+            'calls_per_second': len(latencies) / wall if wall else 0.0,
+            'requests': server['requests'],
+            'requests_per_second': server['requests'] / wall if wall else 0.0,
+            'requests_per_call': server['requests'] / len(latencies) if latencies else 0.0,
+            'p50_ms': percentile(latencies, 50) * 1000,
+            'p99_ms': percentile(latencies, 99) * 1000,
+            'bytes': server['bytes_sent'],
+            'bytes_per_call': server['bytes_sent'] / len(latencies) if latencies else 0.0,
+            'not_modified': server['not_modified'],
+            'errors_injected': server['errors_injected']
+        }
+
+
+# ═══════════════════════════════════════════════════════════
+# REPORTING
+# ═══════════════════════════════════════════════════════════
+
+COLUMNS = [
+    # (key, title, width, value format)
+    ('scenario', 'Scenario', 14, 's'),
+    ('calls', 'Calls', 6, 'd'),
+    ('errors', 'Err', 4, 'd'),
+    ('requests_per_second', 'Req/s', 8, '.1f'),
+    ('requests_per_call', 'Req/call', 8, '.1f'),
+    ('p50_ms', 'p50 ms', 9, '.1f'),
+    ('p99_ms', 'p99 ms', 9, '.1f'),
+    ('bytes_per_call', 'Bytes/call', 11, '.0f'),
+]
+
+# Metrics compared against a baseline (lower is better)
+COMPARED = ('requests_per_call', 'p50_ms', 'p99_ms', 'bytes_per_call')
+
+
+def print_report(results: List[Dict[str, Any]], baseline: Optional[Dict[str, Any]] = None) -> None:
+    """Print results as table (with relative change vs. baseline if given)"""
+    def cell(value: Any, width: int, spec: str, header: bool = False) -> str:
+        align = '<' if spec == 's' else '>'
+        return format(value, f'{align}{width}{"" if header else spec}')
+
+    header = ' '.join(cell(title, width, spec, header=True) for _, title, width, spec in COLUMNS)
+    print(header)
+    print('─' * len(header))
+
+    for result in results:
+        print(' '.join(cell(result[key], width, spec) for key, _, width, spec in COLUMNS))
+
+        previous = (baseline or {}).get(result['scenario'])
+        if previous:
+            changes = []
+            for key in COMPARED:
+                before, after = previous.get(key), result[key]
+                if before:
+                    changes.append(f"{key} {(after - before) / before * 100:+.0f}%")
+            print(f"{'':<14} vs. baseline: {', '.join(changes)}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark SemaphoreAPI against the local simulator",
+        parents=[build_arg_parser()]
+    )
+    parser.add_argument('--scenario', action='append', choices=SCENARIOS,
+                        help="Scenario to run (repeatable, default: all)")
+    parser.add_argument('--iterations', type=int, default=200, help="Calls for recent_tasks")
+    parser.add_argument('--tasks', type=int, default=8, help="Tasks for stream_logs / wait_for_task")
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--poll-scale', type=float, default=0.25,
+                        help="Multiplier for the default poll intervals")
+    parser.add_argument('--json', metavar='FILE', help="Write results as JSON")
+    parser.add_argument('--baseline', metavar='FILE', help="Compare with a previous --json run")
+    parser.set_defaults(token=TOKEN, seed=1)
+    args = parser.parse_args()
+
+    config = config_from_args(args)
+    scenarios = args.scenario or list(SCENARIOS)
+
+    print(f"🧪 Semaphore benchmark – latency {config.latency * 1000:.0f} ms, "
+          f"error rate {config.error_rate:.0%}, concurrency {args.concurrency}\n")
+
+    results = []
+    with SemaphoreSimulator(config) as sim:
+        bench = Benchmark(sim, concurrency=args.concurrency, policy=scaled_policy(args.poll_scale))
+        for name in scenarios:
+            iterations = args.iterations if name == 'recent_tasks' else args.tasks
+            results.append(bench.run(name, iterations))
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = {r['scenario']: r for r in json.load(f)['results']}
+
+    print_report(results, baseline)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'config': vars(args), 'results': results}, f, indent=2)
+        print(f"\n💾 Results written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
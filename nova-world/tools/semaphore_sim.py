@@ -0,0 +1,674 @@
+#!/usr/bin/env python3
+"""
+Semaphore API Simulator
+Local stand-in for the Semaphore REST API (stdlib only)
+
+Implements the endpoints used by SemaphoreAPI / AsyncSemaphoreAPI with
+configurable latency, error rate and log growth, so the clients can be
+exercised and benchmarked without a live Semaphore server.
+
+Usage:
+    python -m tools.semaphore_sim --port 3000 --latency 0.02 --error-rate 0.05
+"""
+
+import re
+import json
+import time
+import random
+import hashlib
+import argparse
+import threading
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+# Output lines cycled through for simulated tasks
+LOG_TEMPLATE = [
+    "PLAY [Deploy {template}] ********************************************",
+    "TASK [Gathering Facts] **********************************************",
+    "ok: [{host}]",
+    "TASK [common : Install base packages] *******************************",
+    "changed: [{host}]",
+    "TASK [docker : Ensure docker is running] ****************************",
+    "ok: [{host}]",
+    "TASK [app : Render compose file] ************************************",
+    "changed: [{host}]",
+    "TASK [app : Start containers] ***************************************",
+    "changed: [{host}]",
+]
+
+
+# Colours ansible uses for result lines (ok green, changed yellow, failures red)
+ANSI_COLORS = {'ok': '0;32', 'changed': '0;33', 'fatal': '0;31', 'failed': '0;31', 'PLAY RECAP': '0;33'}
+
+
+def _colorize(text: str) -> str:
+    """Wrap a line in the ANSI codes ansible-playbook emits with colour forced"""
+    for prefix, code in ANSI_COLORS.items():
+        if text.startswith(prefix):
+            return f"\x1b[{code}m{text}\x1b[0m"
+    return text
+
+
+class SimConfig:
+    """Simulator behaviour"""
+
+    def __init__(
+        self,
+        api_token: Optional[str] = None,
+        latency: float = 0.0,
+        latency_jitter: float = 0.0,
+        error_rate: float = 0.0,
+        projects: int = 1,
+        templates: int = 5,
+        history: int = 50,
+        task_start_delay: float = 0.2,
+        task_duration: float = 3.0,
+        log_lines_per_second: float = 50.0,
+        task_failure_rate: float = 0.0,
+        honor_offset: bool = True,
+        task_filters: bool = True,
+        etags: bool = True,
+        seed: Optional[int] = None,
+        color: bool = False
+    ):
+        """
+        Initialize simulator config
+
+        Args:
+            api_token: Required bearer token (None = accept any)
+            latency: Base delay per request in seconds
+            latency_jitter: Additional uniform random delay in seconds
+            error_rate: Probability of answering with 503
+            projects: Number of projects
+            templates: Templates per project
+            history: Finished tasks seeded per project
+            task_start_delay: Seconds a new task stays in 'waiting'
+            task_duration: Seconds a task stays in 'running'
+            log_lines_per_second: Output growth of a running task
+            task_failure_rate: Probability that a task ends with 'error'
+            honor_offset: Apply ?offset= on task list and output (False = old Semaphore)
+            task_filters: Apply template_id/status/since/until on the task list
+            etags: Send ETags and answer If-None-Match with 304
+            seed: Random seed for reproducible runs
+            color: Colour host results and recap like ANSIBLE_FORCE_COLOR=True
+        """
+        self.api_token = api_token
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.projects = projects
+        self.templates = templates
+        self.history = history
+        self.task_start_delay = task_start_delay
+        self.task_duration = task_duration
+        self.log_lines_per_second = log_lines_per_second
+        self.task_failure_rate = task_failure_rate
+        self.honor_offset = honor_offset
+        self.task_filters = task_filters
+        self.etags = etags
+        self.seed = seed
+        self.color = color
+
+
+class SimTask:
+    """One simulated task with time-based status and output growth"""
+
+    def __init__(
+        self,
+        task_id: int,
+        project_id: int,
+        template: Dict[str, Any],
+        config: SimConfig,
+        rng: random.Random,
+        finished_at: Optional[datetime] = None
+    ):
+        self.id = task_id
+        self.project_id = project_id
+        self.template = template
+        self.config = config
+        self.created = datetime.now(timezone.utc)
+        self.started_mono = time.monotonic()
+        self.stopped_after: Optional[float] = None
+        self.fails = rng.random() < config.task_failure_rate
+        self.total_lines = max(1, int(config.task_duration * config.log_lines_per_second))
+
+        # Seeded history: already finished
+        self.finished_at = finished_at
+        if finished_at is not None:
+            self.created = finished_at - timedelta(seconds=config.task_start_delay + config.task_duration)
+
+    def elapsed(self) -> float:
+        if self.finished_at is not None:
+            return self.config.task_start_delay + self.config.task_duration
+        elapsed = time.monotonic() - self.started_mono
+        if self.stopped_after is not None:
+            return min(elapsed, self.stopped_after)
+        return elapsed
+
+    @property
+    def status(self) -> str:
+        elapsed = self.elapsed()
+        if self.stopped_after is not None and elapsed >= self.stopped_after:
+            return 'stopped'
+        if elapsed < self.config.task_start_delay:
+            return 'waiting'
+        if elapsed < self.config.task_start_delay + self.config.task_duration:
+            return 'running'
+        return 'error' if self.fails else 'success'
+
+    def stop(self) -> None:
+        if self.status in ('waiting', 'running'):
+            self.stopped_after = time.monotonic() - self.started_mono
+
+    def line_count(self) -> int:
+        running_for = self.elapsed() - self.config.task_start_delay
+        if running_for <= 0:
+            return 0
+        if self.status in ('success', 'error'):
+            return self.total_lines
+        return min(self.total_lines, int(running_for * self.config.log_lines_per_second))
+
+    def output(self, offset: int = 0) -> List[Dict[str, Any]]:
+        count = self.line_count()
+        start = self.created + timedelta(seconds=self.config.task_start_delay)
+        host = f"host-{self.project_id}"
+        lines = []
+        for i in range(offset, count):
+            if i == self.total_lines - 1 and self.status in ('success', 'error'):
+                text = f"PLAY RECAP: {host} : ok={i} failed={1 if self.fails else 0}"
+            else:
+                text = LOG_TEMPLATE[i % len(LOG_TEMPLATE)].format(
+                    template=self.template['name'], host=host
+                )
+            if self.config.color:
+                text = _colorize(text)
+            timestamp = start + timedelta(seconds=i / max(self.config.log_lines_per_second, 1e-9))
+            lines.append({
+                'task_id': self.id,
+                'time': _iso(timestamp),
+                'output': text
+            })
+        return lines
+
+    def to_dict(self) -> Dict[str, Any]:
+        status = self.status
+        start = self.created + timedelta(seconds=self.config.task_start_delay)
+        end = None
+        if status in ('success', 'error', 'stopped'):
+            end = self.created + timedelta(seconds=self.elapsed())
+
+        return {
+            'id': self.id,
+            'template_id': self.template['id'],
+            'project_id': self.project_id,
+            'status': status,
+            'debug': False,
+            'dry_run': False,
+            'message': '',
+            'created': _iso(self.created),
+            'start': _iso(start) if status != 'waiting' else None,
+            'end': _iso(end) if end else None
+        }
+
+
+class SemaphoreSimulator:
+    """
+    In-memory Semaphore state plus the HTTP server serving it
+
+    Request and byte counters are kept per endpoint pattern so benchmarks
+    can report what a client actually sent over the wire.
+    """
+
+    def __init__(self, config: Optional[SimConfig] = None):
+        """
+        Initialize simulator
+
+        Args:
+            config: Simulator behaviour (default: SimConfig())
+        """
+        self.config = config or SimConfig()
+        self.rng = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+
+        self.projects: Dict[int, Dict[str, Any]] = {}
+        self.templates: Dict[int, List[Dict[str, Any]]] = {}
+        self.tasks: Dict[int, Dict[int, SimTask]] = {}
+        self._next_task_id = 1
+
+        self.counters: Dict[str, Dict[str, int]] = {}
+        self.server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+        self._seed_state()
+
+    # ═══════════════════════════════════════════════════════════
+    # LIFECYCLE
+    # ═══════════════════════════════════════════════════════════
+
+    def start(self, host: str = '127.0.0.1', port: int = 0) -> str:
+        """
+        Start serving on a background thread
+
+        Args:
+            host: Bind address
+            port: Port (0 = pick a free one)
+
+        Returns:
+            Base URL (e.g. http://127.0.0.1:38721)
+        """
+        self.server = ThreadingHTTPServer((host, port), _make_handler(self))
+        self.server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self.server.serve_forever,
+            name="semaphore-sim",
+            daemon=True
+        )
+        self._thread.start()
+        return self.base_url
+
+    def stop(self) -> None:
+        """Stop serving"""
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> 'SemaphoreSimulator':
+        if self.server is None:
+            self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    # ═══════════════════════════════════════════════════════════
+    # STATE
+    # ═══════════════════════════════════════════════════════════
+
+    def create_task(self, project_id: int, template_id: int) -> SimTask:
+        """Start a new simulated task"""
+        template = self._template(project_id, template_id)
+        if template is None:
+            raise KeyError(template_id)
+
+        with self._lock:
+            task = SimTask(self._next_task_id, project_id, template, self.config, self.rng)
+            self._next_task_id += 1
+            self.tasks[project_id][task.id] = task
+        return task
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get request and byte counters
+
+        Returns:
+            Dict with totals and a per-endpoint breakdown
+        """
+        with self._lock:
+            endpoints = {k: dict(v) for k, v in self.counters.items()}
+
+        return {
+            'requests': sum(c['requests'] for c in endpoints.values()),
+            'bytes_sent': sum(c['bytes'] for c in endpoints.values()),
+            'errors_injected': sum(c['errors'] for c in endpoints.values()),
+            'not_modified': sum(c['not_modified'] for c in endpoints.values()),
+            'endpoints': endpoints
+        }
+
+    def reset_stats(self) -> None:
+        """Clear request and byte counters"""
+        with self._lock:
+            self.counters.clear()
+
+    def _seed_state(self) -> None:
+        config = self.config
+        now = datetime.now(timezone.utc)
+        template_id = 1
+
+        for project_id in range(1, config.projects + 1):
+            self.projects[project_id] = {
+                'id': project_id,
+                'name': f"Project {project_id}",
+                'created': _iso(now - timedelta(days=30))
+            }
+
+            templates = []
+            for i in range(config.templates):
+                name = 'Health Check' if i == 0 else f"Deploy Stack {i}"
+                templates.append({
+                    'id': template_id,
+                    'project_id': project_id,
+                    'name': name,
+                    'playbook': f"playbooks/{name.lower().replace(' ', '_')}.yml",
+                    'inventory_id': 1,
+                    'repository_id': 1,
+                    'environment_id': 1
+                })
+                template_id += 1
+            self.templates[project_id] = templates
+
+            self.tasks[project_id] = {}
+            for i in range(config.history):
+                template = templates[i % len(templates)]
+                finished_at = now - timedelta(minutes=(config.history - i) * 15)
+                task = SimTask(self._next_task_id, project_id, template, config, self.rng, finished_at)
+                self._next_task_id += 1
+                self.tasks[project_id][task.id] = task
+
+    def _template(self, project_id: int, template_id: int) -> Optional[Dict[str, Any]]:
+        return next(
+            (t for t in self.templates.get(project_id, []) if t['id'] == template_id),
+            None
+        )
+
+    def _count(self, pattern: str, size: int, status: int) -> None:
+        with self._lock:
+            counter = self.counters.setdefault(
+                pattern,
+                {'requests': 0, 'bytes': 0, 'errors': 0, 'not_modified': 0}
+            )
+            counter['requests'] += 1
+            counter['bytes'] += size
+            if status == 503:
+                counter['errors'] += 1
+            elif status == 304:
+                counter['not_modified'] += 1
+
+    # ═══════════════════════════════════════════════════════════
+    # ROUTING
+    # ═══════════════════════════════════════════════════════════
+
+    def handle(
+        self,
+        method: str,
+        path: str,
+        query: Dict[str, str],
+        body: Optional[Dict[str, Any]]
+    ) -> Tuple[int, Any]:
+        """
+        Dispatch one API request
+
+        Returns:
+            (HTTP status, JSON-serializable payload or raw text)
+        """
+        for route_method, pattern, handler in self._routes():
+            if route_method != method:
+                continue
+            match = pattern.match(path)
+            if match:
+                return handler(*[int(g) for g in match.groups()], query=query, body=body)
+
+        return 404, {'error': 'Not found'}
+
+    def _routes(self):
+        return [
+            ('GET', _ROUTES['ping'], self._ping),
+            ('GET', _ROUTES['info'], self._info),
+            ('GET', _ROUTES['projects'], self._projects),
+            ('GET', _ROUTES['project'], self._project),
+            ('GET', _ROUTES['templates'], self._templates),
+            ('GET', _ROUTES['template'], self._template_detail),
+            ('GET', _ROUTES['tasks'], self._tasks),
+            ('POST', _ROUTES['tasks'], self._run_task),
+            ('GET', _ROUTES['task'], self._task),
+            ('GET', _ROUTES['output'], self._output),
+            ('POST', _ROUTES['stop'], self._stop),
+        ]
+
+    def _ping(self, **_):
+        return 200, 'pong'
+
+    def _info(self, **_):
+        return 200, {'version': 'sim-2.10', 'update': None}
+
+    def _projects(self, **_):
+        return 200, list(self.projects.values())
+
+    def _project(self, project_id, **_):
+        project = self.projects.get(project_id)
+        return (200, project) if project else (404, {'error': 'Project not found'})
+
+    def _templates(self, project_id, **_):
+        if project_id not in self.templates:
+            return 404, {'error': 'Project not found'}
+        return 200, self.templates[project_id]
+
+    def _template_detail(self, project_id, template_id, **_):
+        template = self._template(project_id, template_id)
+        return (200, template) if template else (404, {'error': 'Template not found'})
+
+    def _tasks(self, project_id, query, **_):
+        if project_id not in self.tasks:
+            return 404, {'error': 'Project not found'}
+
+        with self._lock:
+            tasks = sorted(self.tasks[project_id].values(), key=lambda t: t.id, reverse=True)
+        rows = [t.to_dict() for t in tasks]
+
+        if self.config.task_filters:
+            if 'template_id' in query:
+                rows = [r for r in rows if r['template_id'] == int(query['template_id'])]
+            if 'status' in query:
+                statuses = query['status'].split(',')
+                rows = [r for r in rows if r['status'] in statuses]
+            if 'since' in query:
+                rows = [r for r in rows if r['created'] >= query['since']]
+            if 'until' in query:
+                rows = [r for r in rows if r['created'] <= query['until']]
+
+        limit = int(query.get('limit', 50))
+        offset = int(query.get('offset', 0)) if self.config.honor_offset else 0
+        return 200, rows[offset:offset + limit]
+
+    def _run_task(self, project_id, body, **_):
+        template_id = (body or {}).get('template_id')
+        try:
+            task = self.create_task(project_id, int(template_id))
+        except (KeyError, TypeError, ValueError):
+            return 400, {'error': 'Invalid template_id'}
+        return 201, task.to_dict()
+
+    def _task(self, project_id, task_id, **_):
+        task = self.tasks.get(project_id, {}).get(task_id)
+        return (200, task.to_dict()) if task else (404, {'error': 'Task not found'})
+
+    def _output(self, project_id, task_id, query, **_):
+        task = self.tasks.get(project_id, {}).get(task_id)
+        if task is None:
+            return 404, {'error': 'Task not found'}
+
+        offset = int(query.get('offset', 0)) if self.config.honor_offset else 0
+        return 200, task.output(offset)
+
+    def _stop(self, project_id, task_id, **_):
+        task = self.tasks.get(project_id, {}).get(task_id)
+        if task is None:
+            return 404, {'error': 'Task not found'}
+        task.stop()
+        return 204, None
+
+
+_ROUTES = {
+    'ping': re.compile(r'^/api/ping$'),
+    'info': re.compile(r'^/api/info$'),
+    'projects': re.compile(r'^/api/projects$'),
+    'project': re.compile(r'^/api/projects?/(\d+)$'),
+    'templates': re.compile(r'^/api/project/(\d+)/templates$'),
+    'template': re.compile(r'^/api/project/(\d+)/templates/(\d+)$'),
+    'tasks': re.compile(r'^/api/project/(\d+)/tasks$'),
+    'task': re.compile(r'^/api/project/(\d+)/tasks/(\d+)$'),
+    'output': re.compile(r'^/api/project/(\d+)/tasks/(\d+)/output$'),
+    'stop': re.compile(r'^/api/project/(\d+)/tasks/(\d+)/stop$'),
+}
+
+
+def _endpoint_pattern(path: str) -> str:
+    """Collapse IDs so counters group by endpoint (e.g. /project/{id}/tasks/{id})"""
+    return re.sub(r'/\d+', '/{id}', path)
+
+
+def _make_handler(sim: SemaphoreSimulator):
+    """Build a request handler class bound to one simulator"""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        # Headers and body are written separately; avoid Nagle/delayed-ACK stalls
+        disable_nagle_algorithm = True
+
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            self._dispatch('GET')
+
+        def do_POST(self):
+            self._dispatch('POST')
+
+        def _dispatch(self, method: str) -> None:
+            config = sim.config
+            url = urlparse(self.path)
+            query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+
+            length = int(self.headers.get('Content-Length') or 0)
+            raw = self.rfile.read(length) if length else b''
+            body = None
+            if raw:
+                try:
+                    body = json.loads(raw)
+                except ValueError:
+                    body = None
+
+            delay = config.latency
+            if config.latency_jitter:
+                delay += sim.rng.uniform(0, config.latency_jitter)
+            if delay:
+                time.sleep(delay)
+
+            if config.api_token and url.path != '/api/ping':
+                if self.headers.get('Authorization') != f"Bearer {config.api_token}":
+                    self._send(url.path, 401, {'error': 'Unauthorized'})
+                    return
+
+            if config.error_rate and sim.rng.random() < config.error_rate:
+                self._send(url.path, 503, {'error': 'Simulated outage'})
+                return
+
+            status, payload = sim.handle(method, url.path, query, body)
+            self._send(url.path, status, payload, cacheable=method == 'GET')
+
+        def _send(self, path: str, status: int, payload: Any, cacheable: bool = False) -> None:
+            if payload is None:
+                data = b''
+                content_type = 'application/json'
+            elif isinstance(payload, str):
+                data = payload.encode('utf-8')
+                content_type = 'text/plain'
+            else:
+                data = json.dumps(payload).encode('utf-8')
+                content_type = 'application/json'
+
+            headers = {'Content-Type': content_type}
+
+            if cacheable and status == 200 and sim.config.etags:
+                etag = '"' + hashlib.sha1(data).hexdigest()[:16] + '"'
+                headers['ETag'] = etag
+                if self.headers.get('If-None-Match') == etag:
+                    status, data = 304, b''
+
+            # Count before writing, so the client never sees a response that is not counted yet
+            sim._count(_endpoint_pattern(path), len(data), status)
+
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            if data:
+                self.wfile.write(data)
+
+    return Handler
+
+
+def _iso(value: datetime) -> str:
+    return value.strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+
+
+# ═══════════════════════════════════════════════════════════
+# CLI
+# ═══════════════════════════════════════════════════════════
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    """Argument parser for SimConfig (shared with the benchmark)"""
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument('--token', default=None, help="Required API token (default: accept any)")
+    parser.add_argument('--latency', type=float, default=0.0, help="Base delay per request (s)")
+    parser.add_argument('--latency-jitter', type=float, default=0.0, help="Extra random delay per request (s)")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Probability of a 503 response")
+    parser.add_argument('--projects', type=int, default=1)
+    parser.add_argument('--templates', type=int, default=5)
+    parser.add_argument('--history', type=int, default=50, help="Finished tasks per project")
+    parser.add_argument('--task-duration', type=float, default=3.0, help="Running time of a new task (s)")
+    parser.add_argument('--log-rate', type=float, default=50.0, help="Output lines per second")
+    parser.add_argument('--task-failure-rate', type=float, default=0.0)
+    parser.add_argument('--ignore-offset', action='store_true', help="Behave like Semaphore without ?offset=")
+    parser.add_argument('--no-task-filters', action='store_true', help="Ignore task list filter parameters")
+    parser.add_argument('--no-etags', action='store_true')
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--color', action='store_true', help="ANSI-coloured output like Semaphore")
+    return parser
+
+
+def config_from_args(args: argparse.Namespace) -> SimConfig:
+    """Build SimConfig from parsed arguments"""
+    return SimConfig(
+        api_token=args.token,
+        latency=args.latency,
+        latency_jitter=args.latency_jitter,
+        error_rate=args.error_rate,
+        projects=args.projects,
+        templates=args.templates,
+        history=args.history,
+        task_duration=args.task_duration,
+        log_lines_per_second=args.log_rate,
+        task_failure_rate=args.task_failure_rate,
+        honor_offset=not args.ignore_offset,
+        task_filters=not args.no_task_filters,
+        etags=not args.no_etags,
+        seed=args.seed,
+        color=args.color
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Local Semaphore API simulator",
+        parents=[build_arg_parser()]
+    )
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=3000)
+    args = parser.parse_args()
+
+    sim = SemaphoreSimulator(config_from_args(args))
+    print(f"🧪 Semaphore simulator on {sim.start(args.host, args.port)}")
+    print("   Ctrl+C to stop")
+
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stats = sim.stats()
+        print(f"\n{stats['requests']} requests, {stats['bytes_sent']} bytes sent")
+        sim.stop()
+
+
+if __name__ == "__main__":
+    main()